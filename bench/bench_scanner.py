@@ -0,0 +1,67 @@
+"""Throughput of the passive UTC-time scanner (timeparse.scan_utc_times) in messages/sec.
+
+    python bench/bench_scanner.py [messages]
+
+Most chat in a scanned channel never mentions UTC and should be rejected by the
+prefilter alone; the mix below reports each kind separately and then all together.
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timeparse import scan_utc_times  # noqa: E402
+
+CHATTER = [
+    "anyone got a spare golden scroll? need 3 more for the next tier",
+    "gg everyone, that was close",
+    "lol",
+    "who's leading the bear hunt this week? I can take the 2nd rally at 19:00",
+    "remember to spend your stamina before the event ends, don't waste it on farming today",
+    "https://example.com/guide/season-3#heroes-and-gear-priority",
+]
+MENTIONS_UTC = [
+    "server time is UTC btw",
+    "is that in UTC or local?",
+    "we use UTC+2 for the schedule, ask in #officers",
+]
+WITH_TIMES = [
+    "Reset at 00:00 UTC, collect your dailies before that",
+    "bear hunt fri 18:00 utc, all rally leaders please be online",
+    "Finals start 2025-08-11 09:00 UTC and last 3 days; sign-ups close at 3pm UTC",
+]
+# Busy channel: ~95% chatter, ~3% mention UTC without a time, ~2% actual times
+MIX = [(CHATTER, 95), (MENTIONS_UTC, 3), (WITH_TIMES, 2)]
+
+
+def throughput(messages: list, now: datetime) -> float:
+    best = float("inf")
+    for _ in range(5):
+        t0 = time.perf_counter()
+        for text in messages:
+            scan_utc_times(text, now)
+        best = min(best, time.perf_counter() - t0)
+    return len(messages) / best
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(0)
+    now = datetime(2025, 8, 10, 12, 0, tzinfo=timezone.utc)
+    assert not any(scan_utc_times(t, now) for t in CHATTER + MENTIONS_UTC)
+    assert all(scan_utc_times(t, now) for t in WITH_TIMES)
+    for name, pool in (("chatter", CHATTER), ("mentions UTC", MENTIONS_UTC), ("with times", WITH_TIMES)):
+        msgs = [pool[i % len(pool)] for i in range(n)]
+        rate = throughput(msgs, now)
+        print(f"{name:14} {rate:12,.0f} msg/s   {1e6 / rate:6.2f} us/msg")
+    pools = rng.choices([pool for pool, _ in MIX], weights=[w for _, w in MIX], k=n)
+    mixed = [rng.choice(pool) for pool in pools]
+    rate = throughput(mixed, now)
+    print(f"{'mixed':14} {rate:12,.0f} msg/s   {1e6 / rate:6.2f} us/msg")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Micro-benchmark: timeparse.parse_when vs the original strptime-based /utc parsing.
+
+    python bench/bench_timeparse.py [iterations]
+"""
+import os
+import sys
+import timeit
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timeparse import parse_when  # noqa: E402
+
+INPUTS = ["15:30", "2025-08-11 09:00"]
+
+
+def legacy_parse(when: str) -> datetime:
+    """The /utc parsing as it was before timeparse.py."""
+    if " " in when:
+        return datetime.strptime(when, "%Y-%m-%d %H:%M").replace(tzinfo=timezone.utc)
+    t = datetime.strptime(when, "%H:%M").time()
+    today_utc = datetime.now(timezone.utc).date()
+    return datetime.combine(today_utc, t).replace(tzinfo=timezone.utc)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for text in INPUTS:
+        assert legacy_parse(text) == parse_when(text), text
+        legacy = min(timeit.repeat(lambda: legacy_parse(text), number=n, repeat=5)) / n
+        fast = min(timeit.repeat(lambda: parse_when(text), number=n, repeat=5)) / n
+        print(f"{text!r:22} strptime {legacy * 1e6:6.2f} us   parse_when {fast * 1e6:6.2f} us   "
+              f"x{legacy / fast:.1f}")
+    for text in ("3pm", "+2h30m", "fri 18:00", "2025-08-11T09:00:00Z"):
+        t = min(timeit.repeat(lambda: parse_when(text), number=n, repeat=5)) / n
+        print(f"{text!r:22} {'':18}parse_when {t * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Layout checks: oversized synthetic days must render within every Discord embed limit.
+
+    python bench/check_layout.py
+
+Also run by bench/run.py before timing anything. Raises AssertionError on the
+first payload that Discord would reject, or if a line went missing on the way.
+"""
+import os
+import sys
+from typing import Any, Dict, List, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import layout  # noqa: E402
+from catalog import compile_catalog  # noqa: E402
+from harness import synthetic_doc  # noqa: E402
+from layout import EmbedBlock  # noqa: E402
+from render import SCHEDULE_FIELD_CHARS, render_event_day  # noqa: E402
+
+
+def assert_within_limits(messages: Sequence[Sequence[Dict[str, Any]]], reserve_chars: int = 0) -> None:
+    assert messages, "no messages"
+    for n, embeds in enumerate(messages):
+        where = f"message {n}"
+        assert 0 < len(embeds) <= layout.EMBEDS_PER_MESSAGE, f"{where}: {len(embeds)} embeds"
+        used = layout.message_chars(embeds) + (reserve_chars if n == 0 else 0)
+        assert used <= layout.MESSAGE_EMBED_CHARS, f"{where}: {used} chars"
+        for e in embeds:
+            fields = e.get("fields", [])
+            assert e.get("title") or e.get("description") or fields, f"{where}: empty embed"
+            assert len(e.get("title", "")) <= layout.TITLE_LIMIT, f"{where}: title"
+            assert len(e.get("description", "")) <= layout.DESCRIPTION_LIMIT, f"{where}: description"
+            assert len(e.get("footer", {}).get("text", "")) <= layout.FOOTER_LIMIT, f"{where}: footer"
+            assert len(fields) <= layout.FIELDS_PER_EMBED, f"{where}: {len(fields)} fields"
+            for f in fields:
+                assert 0 < len(f["name"]) <= layout.FIELD_NAME_LIMIT, f"{where}: field name"
+                assert 0 < len(f["value"]) <= layout.FIELD_VALUE_LIMIT, f"{where}: field value {len(f['value'])}"
+
+
+def section_lines(messages: Sequence[Sequence[Dict[str, Any]]], name: str) -> List[str]:
+    """Lines of one section, reassembled across its "(cont.)" fields, embeds and messages."""
+    out: List[str] = []
+    for embeds in messages:
+        for e in embeds:
+            for f in e.get("fields", []):
+                if f["name"] in (name, f"{name} (cont.)"):
+                    out.extend(f["value"].split("\n"))
+    return out
+
+
+def check_chunk_lines() -> None:
+    lines = [f"• line {i}:" + "x" * (i % 90) for i in range(2000)] + ["y" * 5000]
+    chunks = layout.chunk_lines(lines)
+    assert all(len(c) < 950 for c in chunks)
+    assert "\n".join(chunks[:-6]).split("\n") == lines[:-1]  # the 5000-char line is split in 6 pieces
+    assert "".join(chunks[-6:]) == lines[-1]
+    assert layout.chunk_lines([]) == []
+
+
+def check_blocks() -> None:
+    lines = [f"• **Task {i}** — gather {i * 1000} food\n  ↳ {i}x Golden Scroll" for i in range(3000)]
+    huge = EmbedBlock(
+        title="T" * 400, description="D" * 6000, color=1, footer="F" * 3000,
+        sections=[("N" * 300, ["z" * 3000]), ("Tasks", lines), ("Empty", [])],
+    )
+    messages = layout.layout([huge, EmbedBlock(color=2, sections=[("More", lines[:40])], footer="end")],
+                             reserve_fields=1, reserve_chars=SCHEDULE_FIELD_CHARS)
+    assert_within_limits(messages, reserve_chars=SCHEDULE_FIELD_CHARS)
+    assert len(messages[0][0].get("fields", [])) < layout.FIELDS_PER_EMBED
+    assert section_lines(messages, "Tasks") == "\n".join(lines).split("\n")
+    assert section_lines(messages, "More") == "\n".join(lines[:40]).split("\n")
+
+
+def check_oversized_days() -> None:
+    catalog = compile_catalog(synthetic_doc(events=2, days=3, tasks=400, scoring=300))
+    total = 0
+    for ev in catalog.events:
+        for day in ev.days:
+            messages = render_event_day(catalog, ev.name, day.name)
+            assert_within_limits(messages, reserve_chars=SCHEDULE_FIELD_CHARS)
+            assert len(section_lines(messages, "Scoring")) == len(day.scoring)
+            assert len(section_lines(messages, "Tasks & Rewards")) == 2 * len(day.tasks)
+            total += len(messages)
+    small = compile_catalog(synthetic_doc(events=3, days=2))
+    for ev in small.events:
+        for day in ev.days:
+            messages = render_event_day(small, ev.name, day.name)
+            assert len(messages) == 1 and len(messages[0]) == 2, "a normal day should stay one message"
+    print(f"layout checks passed ({total} messages for 6 oversized days)")
+
+
+def main() -> None:
+    check_chunk_lines()
+    check_blocks()
+    check_oversized_days()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Offline stand-ins for discord.Interaction so command callbacks can run without a gateway.
+
+Only the attributes bot.py touches are modelled. Every response/followup call
+is recorded on the interaction (`.sent`) instead of going over HTTP.
+"""
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+
+def import_bot():
+    """Import bot.py with its SQLite state in a throwaway directory (never touches ./bot.db)."""
+    if "bot" not in sys.modules:
+        os.environ.setdefault("BOT_DB_PATH", os.path.join(tempfile.mkdtemp(prefix="bench-"), "bench.db"))
+        if ROOT not in sys.path:
+            sys.path.insert(0, ROOT)
+    import bot
+
+    return bot
+
+
+class FakeResponse:
+    """InteractionResponse stand-in."""
+
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    def _record(self, kind: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        if self._done:
+            raise RuntimeError(f"interaction already responded to (tried {kind})")
+        self._done = True
+        self._interaction.sent.append((kind, args, kwargs))
+
+    async def send_message(self, *args: Any, **kwargs: Any) -> None:
+        self._record("send_message", args, kwargs)
+
+    async def edit_message(self, *args: Any, **kwargs: Any) -> None:
+        self._record("edit_message", args, kwargs)
+
+    async def defer(self, *args: Any, **kwargs: Any) -> None:
+        self._record("defer", args, kwargs)
+
+    async def autocomplete(self, choices: List[Any]) -> None:
+        self._record("autocomplete", (choices,), {})
+
+
+class FakeFollowup:
+    """Webhook stand-in for interaction.followup."""
+
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+
+    async def send(self, *args: Any, **kwargs: Any) -> None:
+        self._interaction.sent.append(("followup", args, kwargs))
+
+
+class FakeInteraction:
+    def __init__(self, user_id: int = 1, guild_id: Optional[int] = 1, channel_id: int = 1,
+                 namespace: Optional[Dict[str, Any]] = None, command_name: str = ""):
+        self.user = SimpleNamespace(id=user_id, mention=f"<@{user_id}>")
+        self.guild_id = guild_id
+        self.guild = SimpleNamespace(id=guild_id, name=f"guild-{guild_id}") if guild_id else None
+        self.channel_id = channel_id
+        self.message = None  # set for component interactions; None for slash commands
+        self.namespace = SimpleNamespace(**(namespace or {}))
+        self.command = SimpleNamespace(qualified_name=command_name, name=command_name) if command_name else None
+        self.extras: Dict[str, Any] = {}
+        self.sent: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+
+    async def delete_original_response(self) -> None:
+        self.sent.append(("delete_original", (), {}))
+
+
+# =========================================
+# SYNTHETIC CATALOG
+# =========================================
+RANK_BRACKETS = ["1", "2", "3", "4 ~ 5", "6 ~ 10", "11 ~ 20", "21 ~ 50", "51 ~ 100"]
+
+
+def synthetic_doc(events: int = 1000, days: int = 10, tasks: int = 8, scoring: int = 8) -> Dict[str, Any]:
+    """An events.yaml-shaped document of arbitrary size with realistic-looking text."""
+    items = ["Gem", "Golden Scroll", "Silver Scroll", "50.000 Food", "50.000 Wood", "50.000 Stone",
+             "Rare Spirit Shard", "Epic Spirit Shard", "Speedup 60m", "Book of Experience (5.000)"]
+    doc: Dict[str, Any] = {"version": 1, "source": "synthetic", "events": []}
+    for e in range(events):
+        ev_days = {}
+        for d in range(days):
+            ev_days[f"Day{d + 1}"] = {
+                "label": f"Stage {d + 1}",
+                "summary": "",
+                "scoring": [
+                    {"action": f"Per gathering {100 * (s + 1)} Food on the field (tier {s})", "points": 3 * (s + 1),
+                     "notes": None}
+                    for s in range(scoring)
+                ],
+                "tasks": [
+                    {"task": f"Gather {100_000 * (t + 1):,} resources from the field".replace(",", "."),
+                     "notes": None,
+                     "reward": [{"item": items[(e + d + t + k) % len(items)], "qty": (k + 1) * (t + 1)}
+                                for k in range(4)]}
+                    for t in range(tasks)
+                ],
+            }
+        rankings = {
+            kind: [{"range": bracket,
+                    "rewards": [{"item": items[(e + b + k) % len(items)], "qty": scale * (8 - b) * (k + 1)}
+                                for k in range(4)]}
+                   for b, bracket in enumerate(RANK_BRACKETS)]
+            for kind, scale in (("daily", 10), ("overall", 50))
+        }
+        doc["events"].append({
+            "id": f"synthetic-{e}",
+            "name": f"Synthetic Event {e:04d} {['Harvest', 'Leader', 'Festival', 'Quest'][e % 4]}",
+            "summary": "",
+            "description": "Generated for benchmarking.",
+            "duration_days": days,
+            "repeats": "Every 2 weeks",
+            "days": ev_days,
+            "extras": {"rankings": rankings},
+        })
+    return doc
@@ -0,0 +1,544 @@
+"""Burst load test: the real bot and discord.py stack against a local fake Discord.
+
+    python bench/loadtest.py                          # 5,000 synthetic interactions, all at once
+    python bench/loadtest.py -n 20000 --rate 2000     # paced arrivals, interactions/sec
+    python bench/loadtest.py --synthetic              # on a 1,000-event x 10-day catalog
+    python bench/loadtest.py --save-trace burst.jsonl # keep the generated trace ...
+    python bench/loadtest.py --trace burst.jsonl      # ... and replay it (or a hand-written one)
+
+A child process plays Discord on 127.0.0.1: the REST API over aiohttp (login,
+command sync, interaction callbacks, followups, message edits) and a gateway
+websocket that sends HELLO and READY, then the trace as INTERACTION_CREATE
+dispatches. The bot itself is not modified. discord.py only gets its API base
+and gateway URL pointed at the fake, so each interaction goes through the same
+gateway decode, state parsing, CommandTree/view dispatch, handler and HTTP
+response as in production.
+
+Reports throughput, first-response latency as Discord would see it (dispatch
+written -> callback received, the span held against the 3 s deadline) overall
+and per kind, event-loop lag in the bot process, peak tasks in flight and RSS.
+Exits 1 if an interaction went unanswered, a handler failed, the bot called a
+route the fake doesn't know, or p99 latency exceeds --max-p99-ms.
+
+Trace format (JSONL), one interaction per line:
+
+    {"at": 0.25, "type": 2, "user": 1017, "guild": 3, "channel": 31,
+     "data": {"name": "utc", "type": 1, "options": [{"name": "when", "type": 3, "value": "18:00"}]}}
+
+`at` is seconds from the start of the replay; `type` and `data` are the
+interaction's as Discord sends them (2 command, 3 component, 4 autocomplete with
+a "focused" option). Ids, tokens, member, channel and component message objects
+are filled in when the line is sent.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from aiohttp import WSMsgType, web
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+APP_ID = 100000000000000001
+BOT_USER = {"id": str(APP_ID), "username": "UTC2LOCAL", "discriminator": "0", "global_name": None,
+            "avatar": None, "bot": True, "flags": 0}
+DISCORD_EPOCH_MS = 1420070400000
+RESPONSE_DEADLINE = 3.0  # responder.RESPONSE_DEADLINE; not imported so the child never loads the bot
+DEFERRED_TYPES = (5, 6)  # deferred message / deferred update
+
+Trace = List[Dict[str, Any]]
+
+
+# =========================================
+# TRACE
+# =========================================
+def _option(name: str, value: Any, focused: bool = False) -> Dict[str, Any]:
+    kind = 5 if isinstance(value, bool) else 4 if isinstance(value, int) else 3
+    option: Dict[str, Any] = {"name": name, "type": kind, "value": value}
+    if focused:
+        option["focused"] = True
+    return option
+
+
+def synthetic_trace(bot: Any, count: int, rate: float, seed: int = 1) -> Trace:
+    """A reset-time burst: people typing /event (autocomplete on every few keystrokes, then the
+    command), paging through answers already on screen, and a tail of /utc, /time, /now, /rewards."""
+    rng = random.Random(seed)
+    events = list(bot.CATALOG.events)
+    items = sorted(bot.REWARD_INDEX.items)[:200] or ["Gem"]
+    users = [1000 + i for i in range(max(50, count // 10))]
+    zones = ["CET", "pst", "America/New_York", "kst", "UTC+5:30", "Europe/Berlin"]
+    trace: Trace = []
+
+    while len(trace) < count:
+        user = rng.choice(users)
+        guild = 1 + user % 20
+        base = {"user": user, "guild": guild, "channel": guild * 10 + user % 5}
+
+        def add(kind: int, data: Dict[str, Any]) -> None:
+            trace.append({"at": 0.0, "type": kind, **base, "data": data})
+
+        ev = rng.choice(events)
+        day = rng.randrange(len(ev.days))
+        r = rng.random()
+        if r < 0.45:
+            for n in (1, 3, 6):
+                add(4, {"name": "event", "type": 1, "options": [_option("event", ev.name[:n].lower(), True)]})
+            if len(ev.days) > 1:
+                add(4, {"name": "event", "type": 1,
+                        "options": [_option("event", ev.name), _option("day", "", True)]})
+            add(2, {"name": "event", "type": 1, "options": [
+                _option("event", ev.name), _option("day", ev.day_names[day]), _option("public", rng.random() < 0.1)]})
+        elif r < 0.65:
+            button = bot.EventPageButton(ev.id, day, 0, user, rng.choice("pn"))
+            add(3, {"custom_id": button.custom_id, "component_type": 2})
+        elif r < 0.70:
+            select = bot.DaySelect(ev.id, user)
+            add(3, {"custom_id": select.custom_id, "component_type": 3, "values": [ev.day_names[day]]})
+        elif r < 0.82:
+            add(2, {"name": "utc", "type": 1, "options": [_option("when", f"{rng.randrange(24):02d}:00")]})
+        elif r < 0.90:
+            zone = rng.choice(zones)
+            add(4, {"name": "time", "type": 1, "options": [_option("when", "20:00"), _option("zone", zone[:2], True)]})
+            add(2, {"name": "time", "type": 1, "options": [_option("when", "20:00"), _option("zone", zone)]})
+        elif r < 0.95:
+            add(2, {"name": "now", "type": 1, "options": []})
+        else:
+            item = rng.choice(items)
+            add(4, {"name": "rewards", "type": 1, "options": [_option("item", item[:4].lower(), True)]})
+            add(2, {"name": "rewards", "type": 1, "options": [_option("item", item)]})
+
+    del trace[count:]
+    if rate > 0:
+        for i, entry in enumerate(trace):
+            entry["at"] = round(i / rate, 6)
+    return trace
+
+
+def load_trace(path: str) -> Trace:
+    with open(path) as f:
+        trace = [json.loads(line) for line in f if line.strip()]
+    trace.sort(key=lambda e: e.get("at", 0.0))
+    return trace
+
+
+def save_trace(trace: Trace, path: str) -> None:
+    with open(path, "w") as f:
+        for entry in trace:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+
+def kind_of(entry: Dict[str, Any]) -> str:
+    """Report label: '/event', '/event (autocomplete)', 'component evpg'."""
+    data = entry.get("data") or {}
+    if entry["type"] == 3:
+        return f"component {data.get('custom_id', '?').split(':', 1)[0]}"
+    label = f"/{data.get('name', '?')}"
+    return f"{label} (autocomplete)" if entry["type"] == 4 else label
+
+
+# =========================================
+# FAKE DISCORD (child process)
+# =========================================
+def _json(data: Any, status: int = 200) -> web.Response:
+    # discord.py only decodes bodies whose Content-Type is exactly application/json (no charset)
+    return web.Response(body=json.dumps(data).encode(), status=status, content_type="application/json")
+
+
+class FakeDiscord:
+    """Gateway + REST stand-in. Records when each interaction was dispatched and answered."""
+
+    def __init__(self, conn: Any, trace: Trace, drain_seconds: float):
+        self.conn = conn
+        self.trace = trace
+        self.drain_seconds = drain_seconds
+        self.port = 0
+        self.ws: Any = None
+        self.seq = 0
+        self.identified = asyncio.Event()
+        self.done = asyncio.Event()
+        self._snowflakes = 0
+        self.pending: Dict[int, float] = {}  # trace index -> perf_counter() when dispatched
+        self.latency: List[Optional[float]] = [None] * len(trace)
+        self.response_types: Counter = Counter()
+        self.rest: Counter = Counter()
+        self.unexpected: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.all_sent = False
+        self.last_answer = 0.0
+
+    def snowflake(self) -> int:
+        self._snowflakes += 1
+        return ((int(time.time() * 1000) - DISCORD_EPOCH_MS) << 22) | (self._snowflakes & 0x3FFFFF)
+
+    def channel(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        if not entry.get("guild"):
+            return {"id": str(entry["channel"]), "type": 1}
+        return {"id": str(entry["channel"]), "type": 0, "guild_id": str(entry["guild"]), "name": "general",
+                "position": 0, "permission_overwrites": [], "nsfw": False, "parent_id": None}
+
+    def message(self, entry: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": str(self.snowflake()), "channel_id": str(entry["channel"]), "author": BOT_USER,
+            "content": data.get("content") or "", "timestamp": datetime.now(timezone.utc).isoformat(),
+            "edited_timestamp": None, "tts": False, "mention_everyone": False, "mentions": [],
+            "mention_roles": [], "attachments": [], "embeds": data.get("embeds") or [], "pinned": False,
+            "type": 20, "flags": data.get("flags") or 0, "components": data.get("components") or [],
+        }
+
+    def interaction(self, index: int, entry: Dict[str, Any]) -> Dict[str, Any]:
+        user = {"id": str(entry["user"]), "username": f"user{entry['user']}", "discriminator": "0",
+                "global_name": None, "avatar": None}
+        payload: Dict[str, Any] = {
+            "id": str(self.snowflake()), "application_id": str(APP_ID), "type": entry["type"],
+            "token": f"t{index}", "version": 1, "data": entry["data"], "locale": "en-US",
+            "app_permissions": "0", "attachment_size_limit": 10485760, "entitlements": [],
+            "context": 0 if entry.get("guild") else 1,
+            "channel_id": str(entry["channel"]), "channel": self.channel(entry),
+        }
+        if entry.get("guild"):
+            payload["authorizing_integration_owners"] = {"0": str(entry["guild"])}
+            payload["guild_id"] = str(entry["guild"])
+            payload["guild_locale"] = "en-US"
+            payload["member"] = {"user": user, "roles": [], "joined_at": "2024-01-01T00:00:00+00:00",
+                                 "deaf": False, "mute": False, "flags": 0, "permissions": "0"}
+        else:
+            payload["authorizing_integration_owners"] = {"1": str(entry["user"])}
+            payload["user"] = user
+        if entry["type"] == 3:
+            payload["message"] = self.message(entry, {"flags": 64, "components": [self.component(entry["data"])]})
+        return payload
+
+    @staticmethod
+    def component(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Action row holding the clicked component; discord.py rebuilds dynamic items from the message."""
+        if data.get("component_type") == 3:
+            values = data.get("values") or []
+            item = {"type": 3, "custom_id": data["custom_id"], "min_values": 1, "max_values": 1,
+                    "options": [{"label": v, "value": v} for v in values]}
+        else:
+            item = {"type": 2, "style": 2, "label": "Next", "custom_id": data["custom_id"]}
+        return {"type": 1, "components": [item]}
+
+    async def dispatch(self, event: str, data: Dict[str, Any]) -> None:
+        self.seq += 1
+        await self.ws.send_str(json.dumps({"op": 0, "t": event, "s": self.seq, "d": data}))
+
+    # ---- gateway ----
+    async def gateway(self, request: web.Request) -> web.StreamResponse:
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        await ws.send_json({"op": 10, "d": {"heartbeat_interval": 41250}, "s": None, "t": None})
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            frame = json.loads(msg.data)
+            if frame["op"] == 1:  # heartbeat
+                await ws.send_json({"op": 11, "d": None, "s": None, "t": None})
+            elif frame["op"] == 2:  # identify
+                self.ws = ws
+                await self.dispatch("READY", {
+                    "v": 10, "user": BOT_USER, "guilds": [], "session_id": "loadtest", "shard": [0, 1],
+                    "resume_gateway_url": f"ws://127.0.0.1:{self.port}/",
+                    "application": {"id": str(APP_ID), "flags": 0},
+                })
+                self.identified.set()
+        return ws
+
+    # ---- REST ----
+    def _answered(self, index: int, body: Dict[str, Any]) -> None:
+        sent = self.pending.pop(index, None)
+        if sent is None:
+            return
+        self.last_answer = time.perf_counter()
+        self.latency[index] = self.last_answer - sent
+        self.response_types[body.get("type")] += 1
+        content = (body.get("data") or {}).get("content") or ""
+        if content.startswith("Something went wrong"):
+            self.errors[kind_of(self.trace[index])] += 1
+        if self.all_sent and not self.pending:
+            self.done.set()
+
+    async def callback(self, request: web.Request) -> web.StreamResponse:
+        index = int(request.match_info["token"][1:])
+        body = await request.json()
+        self.rest["callback"] += 1
+        self._answered(index, body)
+        kind, data = body.get("type"), body.get("data") or {}
+        result: Dict[str, Any] = {"type": kind}
+        interaction = {"id": request.match_info["id"], "type": self.trace[index]["type"]}
+        if kind in (4, 5, 7):
+            message = self.message(self.trace[index], data)
+            result["message"] = message
+            interaction.update(response_message_id=message["id"], response_message_loading=kind == 5,
+                               response_message_ephemeral=bool(message["flags"] & 64))
+        return _json({"interaction": interaction, "resource": result})
+
+    async def followup(self, request: web.Request) -> web.StreamResponse:
+        index = int(request.match_info["token"][1:])
+        self.rest["followup"] += 1
+        return _json(self.message(self.trace[index], await request.json()))
+
+    async def webhook_message(self, request: web.Request) -> web.StreamResponse:
+        index = int(request.match_info["token"][1:])
+        self.rest[f"{request.method} message"] += 1
+        if request.method == "DELETE":
+            return web.Response(status=204)
+        data = await request.json() if request.can_read_body else {}
+        return _json(self.message(self.trace[index], data))
+
+    async def current_user(self, request: web.Request) -> web.StreamResponse:
+        return _json(BOT_USER)
+
+    async def application(self, request: web.Request) -> web.StreamResponse:
+        return _json({
+            "id": str(APP_ID), "name": "UTC2LOCAL", "icon": None, "description": "", "bot_public": True,
+            "bot_require_code_grant": False, "verify_key": "0" * 64, "flags": 0, "owner": BOT_USER,
+            "team": None, "bot": BOT_USER,
+        })
+
+    async def sync_commands(self, request: web.Request) -> web.StreamResponse:
+        self.rest["command sync"] += 1
+        commands = await request.json()
+        for command in commands:
+            command.update(id=str(self.snowflake()), application_id=str(APP_ID), version="1")
+            command.setdefault("description", "")
+            command.setdefault("type", 1)
+        return _json(commands)
+
+    async def unknown(self, request: web.Request) -> web.StreamResponse:
+        self.unexpected[f"{request.method} {request.path}"] += 1
+        return _json({"message": "Unknown route (loadtest)", "code": 0}, status=404)
+
+    # ---- replay ----
+    async def replay(self) -> Dict[str, Any]:
+        await self.identified.wait()
+        await asyncio.get_running_loop().run_in_executor(None, self.conn.recv)  # the bot is ready
+        start = time.perf_counter()
+        for index, entry in enumerate(self.trace):
+            delay = start + entry.get("at", 0.0) - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            payload = self.interaction(index, entry)
+            self.pending[index] = time.perf_counter()
+            await self.dispatch("INTERACTION_CREATE", payload)
+        sent = time.perf_counter() - start
+        self.all_sent = True
+        if self.pending:
+            try:
+                await asyncio.wait_for(self.done.wait(), self.drain_seconds)
+            except asyncio.TimeoutError:
+                pass
+        answered = [t for t in self.latency if t is not None]
+        return {
+            "latency": self.latency,
+            "sent_seconds": sent,
+            "elapsed": max(self.last_answer - start, sent),
+            "unanswered": len(self.trace) - len(answered),
+            "response_types": dict(self.response_types),
+            "rest": dict(self.rest),
+            "unexpected": dict(self.unexpected),
+            "errors": dict(self.errors),
+        }
+
+    async def serve(self) -> None:
+        app = web.Application(client_max_size=16 * 2**20)
+        api = "/api/v10"
+        app.router.add_get("/", self.gateway)
+        app.router.add_get(f"{api}/users/@me", self.current_user)
+        app.router.add_get(f"{api}/oauth2/applications/@me", self.application)
+        app.router.add_put(f"{api}/applications/{{app}}/commands", self.sync_commands)
+        app.router.add_put(f"{api}/applications/{{app}}/guilds/{{guild}}/commands", self.sync_commands)
+        app.router.add_post(f"{api}/interactions/{{id}}/{{token}}/callback", self.callback)
+        app.router.add_post(f"{api}/webhooks/{{app}}/{{token}}", self.followup)
+        app.router.add_route("*", f"{api}/webhooks/{{app}}/{{token}}/messages/{{message}}", self.webhook_message)
+        app.router.add_route("*", "/{tail:.*}", self.unknown)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        self.conn.send(self.port)
+        try:
+            self.conn.send(await self.replay())
+        finally:
+            await runner.cleanup()
+
+
+def fake_discord(conn: Any, trace: Trace, drain_seconds: float) -> None:
+    """Child process entry point."""
+    asyncio.run(FakeDiscord(conn, trace, drain_seconds).serve())
+
+
+# =========================================
+# BOT PROCESS
+# =========================================
+def _rss_mib() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        return float("nan")
+
+
+def _peak_rss_mib() -> float:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+async def _watch_loop(lags: List[float], tasks: List[int], interval: float = 0.01) -> None:
+    """Sample event-loop lag (how late a 10 ms sleep wakes up) and tasks in flight."""
+    loop = asyncio.get_running_loop()
+    while True:
+        t0 = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - t0 - interval)
+        tasks.append(len(asyncio.all_tasks()))
+
+
+def _receive(conn: Any, proc: Any) -> Any:
+    """Next message from the fake Discord; raises if its process died instead."""
+    while not conn.poll(0.5):
+        if not proc.is_alive():
+            raise RuntimeError(f"fake Discord exited with code {proc.exitcode}")
+    return conn.recv()
+
+
+async def drive(bot: Any, conn: Any, proc: Any) -> Dict[str, Any]:
+    client = bot.bot
+    async with client:
+        await client.login("loadtest")
+        connection = asyncio.create_task(client.connect(reconnect=False))
+        await client.wait_until_ready()
+        rss_ready = _rss_mib()
+        lags: List[float] = []
+        tasks: List[int] = []
+        watcher = asyncio.create_task(_watch_loop(lags, tasks))
+        conn.send("go")
+        results = await asyncio.get_running_loop().run_in_executor(None, _receive, conn, proc)
+        watcher.cancel()
+        results.update(lags=lags, tasks=tasks, rss_ready=rss_ready, rss_after=_rss_mib(), rss_peak=_peak_rss_mib())
+    connection.cancel()
+    return results
+
+
+def _pct(values: List[float], pct: float) -> float:
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+def _latency_line(label: str, seconds: List[float]) -> str:
+    ms = [s * 1000 for s in seconds]
+    return (f"{label:34} {len(ms):6}  p50 {_pct(ms, 50):8.1f}  p90 {_pct(ms, 90):8.1f}  "
+            f"p99 {_pct(ms, 99):8.1f}  max {max(ms, default=float('nan')):8.1f} ms")
+
+
+def report(trace: Trace, results: Dict[str, Any]) -> List[str]:
+    """Print the results; returns the reasons to fail the run."""
+    latency = results["latency"]
+    answered = [t for t in latency if t is not None]
+    by_kind: Dict[str, List[float]] = {}
+    for entry, t in zip(trace, latency):
+        if t is not None:
+            by_kind.setdefault(kind_of(entry), []).append(t)
+    elapsed = results["elapsed"]
+    types = results["response_types"]
+
+    print(f"\n{len(trace)} interactions dispatched in {results['sent_seconds']:.2f}s, "
+          f"{len(answered)} answered in {elapsed:.2f}s: {len(answered) / max(elapsed, 1e-9):,.0f}/s")
+    print(_latency_line("first response (all)", answered))
+    for kind in sorted(by_kind, key=lambda k: -len(by_kind[k])):
+        print(_latency_line(f"  {kind}", by_kind[kind]))
+    late = sum(1 for t in answered if t > RESPONSE_DEADLINE)
+    deferred = sum(types.get(t, 0) for t in DEFERRED_TYPES)
+    print(f"deadline: {late} past {RESPONSE_DEADLINE:.0f}s, {deferred} deferred, {results['unanswered']} unanswered")
+    lags_ms = [lag * 1000 for lag in results["lags"]]
+    print(f"event-loop lag: p50 {_pct(lags_ms, 50):.1f}  p99 {_pct(lags_ms, 99):.1f}  "
+          f"max {max(lags_ms, default=float('nan')):.1f} ms; peak tasks {max(results['tasks'], default=0)}")
+    peak = results["rss_peak"] if not results["rss_peak"] < results["rss_after"] else results["rss_after"]
+    print(f"memory: RSS {results['rss_ready']:.0f} MiB when ready, {results['rss_after']:.0f} MiB after "
+          f"(peak {peak:.0f} MiB)")
+    print("REST: " + ", ".join(f"{n} {name}" for name, n in sorted(results["rest"].items())))
+
+    failures: List[str] = []
+    if results["unanswered"]:
+        failures.append(f"{results['unanswered']} interaction(s) never answered")
+    for kind, n in sorted(results["errors"].items()):
+        failures.append(f"{n} error response(s) from {kind}")
+    for route, n in sorted(results["unexpected"].items()):
+        failures.append(f"{n} call(s) to unknown route {route}")
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--interactions", type=int, default=5000, help="synthetic trace length")
+    parser.add_argument("--rate", type=float, default=0.0, help="interactions/sec (0 = all at once)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--synthetic", action="store_true", help="use a 1,000-event x 10-day catalog")
+    parser.add_argument("--trace", help="replay this JSONL trace instead of generating one")
+    parser.add_argument("--save-trace", help="write the trace that is replayed to this JSONL file")
+    parser.add_argument("--drain", type=float, default=10.0, help="seconds to wait for answers after the last send")
+    parser.add_argument("--max-p99-ms", type=float, default=0.0, help="fail if p99 first-response latency exceeds this")
+    args = parser.parse_args(argv)
+
+    # A quiet, self-contained bot: no metrics port, file watcher, sharding or guild sync from the environment
+    for name in ("SHARD_MODE", "SHARD_COUNT", "SHARD_IDS", "GUILD_ID", "SCAN_CHANNELS", "JSON_LOGS"):
+        os.environ.pop(name, None)
+    os.environ.update(METRICS_PORT="0", CATALOG_WATCH_SECONDS="0", SHARD_REPORT_SECONDS="0")
+
+    from harness import import_bot, synthetic_doc
+
+    bot = import_bot()
+    if args.synthetic:
+        from catalog import compile_catalog
+
+        bot.install_catalog(compile_catalog(synthetic_doc(1000, 10)))
+    trace = load_trace(args.trace) if args.trace else synthetic_trace(bot, args.interactions, args.rate, args.seed)
+    if args.save_trace:
+        save_trace(trace, args.save_trace)
+    print(f"[loadtest] {len(trace)} interactions: " + ", ".join(
+        f"{n} {kind}" for kind, n in Counter(kind_of(e) for e in trace).most_common()))
+
+    ctx = multiprocessing.get_context("spawn")
+    parent, child = ctx.Pipe()
+    proc = ctx.Process(target=fake_discord, args=(child, trace, args.drain), daemon=True)
+    proc.start()
+    port = _receive(parent, proc)
+
+    import discord
+    import yarl
+
+    discord.http.Route.BASE = f"http://127.0.0.1:{port}/api/v10"
+    discord.gateway.DiscordWebSocket.DEFAULT_GATEWAY = yarl.URL(f"ws://127.0.0.1:{port}/")
+    try:
+        results = asyncio.run(drive(bot, parent, proc))
+    finally:
+        proc.join(timeout=5)
+        if proc.is_alive():
+            proc.kill()
+
+    failures = report(trace, results)
+    p99 = _pct([t for t in results["latency"] if t is not None], 99) * 1000
+    if args.max_p99_ms and not p99 <= args.max_p99_ms:
+        failures.append(f"p99 first-response latency {p99:.1f} ms > {args.max_p99_ms:.1f} ms")
+    for line in failures:
+        print(f"FAIL {line}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""Offline benchmark suite for bot.py's hot paths.
+
+Runs the real command callbacks, autocomplete handlers, the /event paginator's
+DaySelect and EventPageButton callbacks, build_event_messages and chunk_lines
+against FakeInteraction (no network),
+first on the shipped catalog and then on a synthetic 1k-event x 10-day one.
+
+    python bench/run.py                 # run and compare with bench/baselines.json
+    python bench/run.py --save          # run and record new baselines
+    python bench/run.py --only event    # cases whose name contains "event"
+
+Reports p50/p99 latency and peak bytes allocated per call (tracemalloc). The
+layout checks in check_layout.py run first and fail the run on any embed limit.
+Exits 1 if a case's p50 or allocation exceeds its baseline by more than --tolerance.
+"""
+import argparse
+import asyncio
+import dataclasses
+import inspect
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import check_layout  # noqa: E402
+from harness import FakeInteraction, import_bot, synthetic_doc  # noqa: E402
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+Case = Tuple[str, Callable[[int], Any]]  # (name, fn(i) -> awaitable or value)
+
+
+def _percentile(sorted_ns: List[int], pct: float) -> float:
+    idx = min(len(sorted_ns) - 1, int(round(pct / 100 * (len(sorted_ns) - 1))))
+    return sorted_ns[idx] / 1000.0
+
+
+async def _call(fn: Callable[[int], Any], i: int) -> None:
+    result = fn(i)
+    if inspect.isawaitable(result):
+        await result
+
+
+async def measure(fn: Callable[[int], Any], iterations: int, alloc_iterations: int) -> Dict[str, float]:
+    for i in range(min(50, iterations)):  # warm-up (caches, lazy imports)
+        await _call(fn, i)
+    samples: List[int] = []
+    for i in range(iterations):
+        t0 = time.perf_counter_ns()
+        await _call(fn, i)
+        samples.append(time.perf_counter_ns() - t0)
+    samples.sort()
+
+    tracemalloc.start()
+    peak_total = 0
+    for i in range(alloc_iterations):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        await _call(fn, i)
+        peak_total += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    return {
+        "p50_us": round(_percentile(samples, 50), 2),
+        "p99_us": round(_percentile(samples, 99), 2),
+        "alloc_kib": round(peak_total / max(alloc_iterations, 1) / 1024, 2),
+    }
+
+
+def build_cases(bot: Any, label: str) -> List[Case]:
+    import layout
+    from scoring import ScoreTable
+    import render
+    from catalog import compile_catalog
+
+    catalog = bot.CATALOG
+    pairs = [(ev.name, d.name) for ev in catalog.events for d in ev.days]
+    multi_day = [ev.name for ev in catalog.events if len(ev.days) > 1] or [catalog.events[0].name]
+    words = [ev.name.split()[-1][:5].lower() for ev in catalog.events[:20]]
+    queries = ["", "gre", "gretest leadr", "golden scroll", "harv", "spirit shard", "stage 3"] + words
+    long_lines = [f"• **Task {i}**\n  ↳ {i}x Golden Scroll, {i}x Gem, {i}x 50.000 Food" for i in range(200)]
+    batch = ", ".join(f"Slot {i} @ {i % 24:02d}:{(i * 7) % 60:02d}" for i in range(12))
+
+    def pair(i: int) -> Tuple[str, str]:
+        return pairs[(i * 7919) % len(pairs)]
+
+    def utc(i: int):
+        return bot.utc.callback(FakeInteraction(), when=f"{i % 24:02d}:{i % 60:02d}")
+
+    zones = ["CET", "America/New_York", "kst", "UTC+5:30", "Europe/Berlin", "pst"]
+    zone_queries = ["", "new y", "berln", "pst", "asia/", "kolkata", "america los", "cet"]
+
+    def time_in_zone(i: int):
+        return bot.time_cmd.callback(FakeInteraction(), when=f"{i % 24:02d}:{i % 60:02d}", zone=zones[i % len(zones)])
+
+    def ac_zone(i: int):
+        return bot.autocomplete_zone(FakeInteraction(), zone_queries[i % len(zone_queries)])
+
+    def utcbatch(i: int):
+        return bot.utcbatch.callback(FakeInteraction(), times=batch)
+
+    def event_day(i: int):
+        ev, day = pair(i)
+        return bot.event.callback(FakeInteraction(), event=ev, day=day, public=False)
+
+    def event_picker(i: int):
+        return bot.event.callback(FakeInteraction(), event=multi_day[i % len(multi_day)], day=None, public=False)
+
+    async def day_select(i: int):
+        ev, day = pair(i)
+        custom_id = f"daypick:{bot.CATALOG.get_event(ev).id}:1"
+        match = bot.DaySelect.__discord_ui_compiled_template__.fullmatch(custom_id)
+        select = await bot.DaySelect.from_custom_id(None, None, match)
+        select.item._values = [day]
+        await select.callback(FakeInteraction())
+
+    async def page_click(i: int):
+        ev = bot.CATALOG.get_event(multi_day[i % len(multi_day)])
+        custom_id = f"evpg:{ev.id}:{i % len(ev.days)}.0:1:n"
+        match = bot.EventPageButton.__discord_ui_compiled_template__.fullmatch(custom_id)
+        button = await bot.EventPageButton.from_custom_id(None, None, match)
+        await button.callback(FakeInteraction())
+
+    def embeds_cached(i: int):
+        ev, day = pair(i)
+        return bot.build_event_messages(ev, day, 1)
+
+    def embeds_cold(i: int):
+        ev, day = pair(i)
+        return render.render_event_day(bot.CATALOG, ev, day)
+
+    # One day with 300 scoring rules and 400 tasks: ~13 messages of embeds
+    oversized = compile_catalog(synthetic_doc(events=1, days=1, tasks=400, scoring=300))
+    big_event, big_day = oversized.events[0].name, oversized.events[0].days[0].name
+
+    def embeds_oversized(i: int):
+        return render.render_event_day(oversized, big_event, big_day)
+
+    # The shared render file workers map (see render.py), written to a temp dir for this catalog
+    shared_path = os.path.join(tempfile.mkdtemp(prefix="bench-render-"), "events.render")
+    render.write_render_file(dataclasses.replace(catalog, digest=catalog.digest or b"synthetic".ljust(16)), shared_path)
+    shared = render.RenderFile.open(shared_path)
+
+    def render_file_get(i: int):
+        ev, day = pair(i)
+        return shared.get(ev, day)
+
+    def ac_event(i: int):
+        return bot.autocomplete_event(FakeInteraction(), queries[i % len(queries)])
+
+    def ac_event_uncached(i: int):
+        bot.EVENT_INDEX._cache.clear()
+        return bot.autocomplete_event(FakeInteraction(), queries[i % len(queries)])
+
+    def ac_day(i: int):
+        ev, _ = pair(i)
+        return bot.autocomplete_day(FakeInteraction(namespace={"event": ev}), queries[i % len(queries)])
+
+    items = list(bot.REWARD_INDEX.items) or ["Gem"]
+    ranked = list(bot.REWARD_INDEX.ranked_events)
+
+    def rewards(i: int):
+        return bot.rewards_cmd.callback(FakeInteraction(), item=items[(i * 7919) % len(items)], public=False)
+
+    def rank(i: int):
+        return bot.rank_cmd.callback(FakeInteraction(), event=ranked[i % len(ranked)], rank=1 + i % 120,
+                                     kind=None, public=False)
+
+    scored = list(bot.SCORE_TABLES)
+    plans = ["food 500k, lucky ticket 2, 10 golden scroll", "wood 1.5m; stone 200.000", "tier 3 bender 1000"]
+
+    def score(i: int):
+        return bot.score_cmd.callback(FakeInteraction(), event=scored[i % len(scored)], plan=plans[i % len(plans)],
+                                      day=None, target=5_000_000, public=False)
+
+    # The evaluation itself on both paths: NumPy matrix product vs the plain-Python fallback
+    vectorized = bot.SCORE_TABLES[scored[0]] if scored else None
+    plain = ScoreTable(vectorized.event, vectorized=False) if vectorized else None
+    quantities = [500_000] * len(vectorized.actions) if vectorized else []
+
+    def totals_numpy(i: int):
+        return vectorized.day_totals(quantities)
+
+    def totals_plain(i: int):
+        return plain.day_totals(quantities)
+
+    buckets = bot.TokenBuckets(5, 60, max_keys=10_000)
+    for key in range(10_000):
+        buckets.take(key)
+
+    def limiter(i: int):
+        buckets.take(i % 20_000)  # half hits, half evictions once the map is full
+
+    def chunk(i: int):
+        return layout.chunk_lines(long_lines)
+
+    return [(f"{label}/{name}", fn) for name, fn in [
+        ("utc", utc),
+        ("utcbatch[12]", utcbatch),
+        ("time(zone)", time_in_zone),
+        ("autocomplete_zone", ac_zone),
+        ("event(day)", event_day),
+        ("event(picker)", event_picker),
+        ("DaySelect.callback", day_select),
+        ("EventPageButton.callback", page_click),
+        ("build_event_messages(cached)", embeds_cached),
+        ("render_event_day(cold)", embeds_cold),
+        ("render_event_day(oversized)", embeds_oversized),
+        ("RenderFile.get", render_file_get),
+        ("autocomplete_event", ac_event),
+        ("autocomplete_event(uncached)", ac_event_uncached),
+        ("autocomplete_day", ac_day),
+        ("rewards", rewards),
+        # Skipped on corpora without rankings / scoring tables rather than timing a no-op
+        ("rank", rank if ranked else None),
+        ("score", score if scored else None),
+        ("ScoreTable.day_totals(numpy)", totals_numpy if vectorized and vectorized.np else None),
+        ("ScoreTable.day_totals(plain)", totals_plain if plain else None),
+        ("TokenBuckets.take[10k keys]", limiter),
+        ("chunk_lines[200]", chunk),
+    ] if fn is not None]
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    bot = import_bot()
+    from catalog import compile_catalog
+
+    check_layout.main()
+
+    results: Dict[str, Dict[str, float]] = {}
+    suites = [("catalog", None), ("synthetic-1kx10", lambda: compile_catalog(synthetic_doc(1000, 10)))]
+    for label, make_catalog in suites:
+        if make_catalog is not None:
+            t0 = time.perf_counter()
+            bot.install_catalog(make_catalog())
+            print(f"[{label}] compiled + indexed + pre-rendered in {time.perf_counter() - t0:.2f}s")
+        for name, fn in build_cases(bot, label):
+            if args.only and args.only not in name:
+                continue
+            results[name] = await measure(fn, args.iterations, args.alloc_iterations)
+            r = results[name]
+            print(f"{name:48} p50 {r['p50_us']:9.1f} us   p99 {r['p99_us']:9.1f} us   "
+                  f"alloc {r['alloc_kib']:8.1f} KiB/call")
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    if not os.path.exists(BASELINES):
+        return []
+    with open(BASELINES) as f:
+        baselines = json.load(f)
+    regressions: List[str] = []
+    for name, r in results.items():
+        base = baselines.get(name)
+        if not base:
+            continue
+        for key in ("p50_us", "alloc_kib"):
+            # Small absolute floors keep sub-microsecond noise from failing the run
+            floor = 5.0 if key == "p50_us" else 1.0
+            if r[key] > max(base[key] * tolerance, base[key] + floor):
+                regressions.append(f"{name}: {key} {r[key]} vs baseline {base[key]}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--alloc-iterations", type=int, default=200)
+    parser.add_argument("--only", default="", help="only run cases whose name contains this")
+    parser.add_argument("--save", action="store_true", help="write results to bench/baselines.json")
+    parser.add_argument("--tolerance", type=float, default=2.0, help="allowed slowdown factor vs baseline")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args))
+    if args.save:
+        merged: Dict[str, Dict[str, float]] = {}
+        if os.path.exists(BASELINES):
+            with open(BASELINES) as f:
+                merged = json.load(f)
+        merged.update(results)
+        with open(BASELINES, "w") as f:
+            json.dump(dict(sorted(merged.items())), f, indent=2)
+            f.write("\n")
+        print(f"Saved {len(results)} baseline(s) to {BASELINES}")
+        return 0
+
+    regressions = compare(results, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
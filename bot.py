@@ -1,8 +1,38 @@
 import os
+import time
+import asyncio
+import functools
+import re
 import discord
+from collections import OrderedDict
+from itertools import groupby
+from operator import attrgetter
 from discord import app_commands
-from datetime import datetime, timezone
-from typing import List, Dict, Any, Tuple
+from datetime import datetime, timezone, tzinfo
+from typing import List, Dict, Any, Tuple, Sequence, Callable, Optional
+
+import search
+from catalog import Catalog, CatalogError, Event, load_catalog, pending_preload, resolve_source
+from search import SearchIndex, build_day_indexes, build_event_index
+from reminders import ReminderDispatcher
+from rewards import RewardIndex, RewardSource, build_reward_index
+from scoring import PlanError, ScoreTable, build_score_tables
+from schedule import DAY, ScheduleEngine, Status
+from shards import ShardStats, config_from_env as shard_config_from_env, shard_for_guild
+from metrics import REGISTRY, log_json, start_http_server
+from ratelimit import RecentPosts, TokenBuckets, parse_rate
+from layout import EmbedBlock, chunk_lines, layout
+from render import RenderFile, render_event_day, render_path, write_render_file
+from responder import (
+    DEADLINE_MARGIN, ON_NO_PUBLIC_POST, RECEIVED_AT, RESPONSE_DEADLINE, deadline_guard, jump_url, reply,
+)
+from store import Reminder, Store
+from syncmanager import SyncManager
+from timeparse import (
+    FORMATS_HELP, MAX_BATCH_ENTRIES, FoundTime, TimeParseError, parse_batch, parse_when,
+    scan_utc_times,
+)
+from zones import describe_zone, resolve_zone, search_zones, zone_index, zone_name
 
 TOKEN = os.getenv("DISCORD_TOKEN")
 GUILD_ID_ENV = os.getenv("GUILD_ID")  # Optional: speeds up slash command registration for one server
@@ -11,378 +41,359 @@ if GUILD_ID_ENV and GUILD_ID_ENV.isdigit():
     GUILD_OBJ = discord.Object(id=int(GUILD_ID_ENV))
 
 
+# Sharding: SHARD_MODE=auto, or SHARD_COUNT + SHARD_IDS for multi-process deployments (see shards.py)
+SHARDS = shard_config_from_env()
+# Log a per-shard latency/event-rate line every N seconds (0 = off; /shards works either way)
+SHARD_REPORT_SECONDS = float(os.getenv("SHARD_REPORT_SECONDS") or 0)
+SYNC_CONCURRENCY = 5  # parallel per-guild command syncs
+# Metrics: METRICS_PORT=9100 serves /metrics on METRICS_HOST (0 = off); JSON_LOGS=1 for structured logs
+METRICS_PORT = int(os.getenv("METRICS_PORT") or 0)
+METRICS_HOST = os.getenv("METRICS_HOST") or "127.0.0.1"
+# Public posts: token buckets per user and per channel ("burst/seconds", 0 = off), and for how many
+# seconds an identical public /event post in a channel is answered with a link instead of a repost
+RATE_LIMIT_USER = parse_rate(os.getenv("RATE_LIMIT_USER") or "5/60")
+RATE_LIMIT_CHANNEL = parse_rate(os.getenv("RATE_LIMIT_CHANNEL") or "12/60")
+DEDUP_SECONDS = float(os.getenv("DEDUP_SECONDS") or 30)
+# Passive scanning: channel ids (comma separated) where "reset at 00:00 UTC" in chat gets a reply with
+# the local-time rendering. Needs the privileged message-content intent, only requested when this is set.
+SCAN_CHANNELS = frozenset(int(c) for c in (os.getenv("SCAN_CHANNELS") or "").split(",") if c.strip().isdigit())
+
+
 # -----------------------------
-# Event Catalog (from your data)
+# Event Catalog (events.yaml, compiled by catalog.py into the binary events.catalog)
 # -----------------------------
-# Each event may define multiple "days". For each day:
-#   - "name": display name for the day/stage
-#   - "scoring": list[tuple[str, int]] or [] if not applicable
-#   - "tasks": list[tuple[str, str]] -> (Task, Reward string)
-# Top-level event also supports "duration_days", "repeats", and "notes" fields (optional).
-
-EVENTS: Dict[str, Dict[str, Any]] = {
-    "The Greatest Leader": {
-        "description": "Do your best to prove that you are the greatest leader!",
-        "duration_days": 5,
-        "repeats": "Every 2 weeks",
-        "notes": (
-            "First 7 times are single-server; afterward becomes cross-server. "
-            "Hero shards rotate among Aang, Amon, Korra, Kyoshi, Yangchen, Roku."
-        ),
-        "days": [
-            {
-                "name": "Day 1 — Resource Gathering & Research",
-                "scoring": [
-                    ("Per gathering 100 Food on the field", 3),
-                    ("Per gathering 100 Wood on the field", 3),
-                    ("Per gathering 100 Stone on the field", 3),
-                    ("Per gathering 50 Gold on the field", 3),
-                    ("Increase Power by 1 with research", 25),
-                    ("Per 1 Lucky Ticket", 150_000),
-                ],
-                "tasks": [
-                    ("Gather 100,000 resources from the field",
-                     "1x Rare Spirit Shard, 1x Silver Scroll, 1x 50,000 Food, 1x 50,000 Wood"),
-                    ("Gather 300,000 resources from the field",
-                     "1x Rare Spirit Shard, 1x Golden Scroll, 2x 50,000 Food, 2x 50,000 Wood"),
-                    ("Gather 500,000 resources from the field",
-                     "1x Epic Spirit Shard, 1x Golden Scroll, 3x 50,000 Food, 3x 50,000 Wood"),
-                    ("Increase Power by 30,000 with Research",
-                     "50x Gem, 1x Rare Spirit Badge, 1x Silver Scroll, 5x Speedup 5m"),
-                    ("Increase Power by 60,000 with Research",
-                     "100x Gem, 1x Rare Spirit Badge, 1x Golden Scroll, 1x Speedup 60m"),
-                    ("Increase Power by 90,000 with Research",
-                     "200x Gem, 1x Legendary Spirit Badge, 1x Golden Scroll, 2x Speedup 60m"),
-                ],
-            },
-            {
-                "name": "Day 2 — Bender Recruitment",
-                "scoring": [
-                    ("Per recruiting 1 bender (Tier 1)", 25),
-                    ("Per recruiting 1 bender (Tier 2)", 50),
-                    ("Per recruiting 1 bender (Tier 3)", 75),
-                    ("Per recruiting 1 bender (Tier 4)", 100),
-                    ("Per recruiting 1 bender (Tier 5)", 150),
-                    ("Per recruiting 1 bender (Tier 6)", 350),
-                    ("Per 1 Lucky Ticket", 150_000),
-                ],
-                "tasks": [
-                    ("Recruit 1,000 Tier 2 or Higher Benders",
-                     "30x Gem, 1x Rare Spirit Badge, 1x Silver Scroll, 5x Speedup 5m"),
-                    ("Recruit 3,000 Tier 2 or Higher Benders",
-                     "60x Gem, 1x Rare Spirit Badge, 1x Silver Scroll, 10x Speedup 5m"),
-                    ("Recruit 6,000 Tier 2 or Higher Benders",
-                     "90x Gem, 1x Epic Spirit Badge, 1x Silver Scroll, 15x Speedup 5m"),
-                    ("Recruit 12,000 Tier 2 or Higher Benders",
-                     "120x Gem, 1x Epic Spirit Badge, 1x Golden Scroll, 2x Speedup 60m"),
-                    ("Recruit 18,000 Tier 2 or Higher Benders",
-                     "150x Gem, 1x Legendary Spirit Badge, 1x Golden Scroll, 3x Speedup 60m"),
-                    ("Recruit 25,000 Tier 2 or Higher Benders",
-                     "200x Gem, 1x Legendary Spirit Shard, 1x Golden Scroll, 5x Speedup 60m"),
-                ],
-            },
-            {
-                "name": "Day 3 — Hero Growth",
-                "scoring": [
-                    ("Use a Silver Scroll", 750),
-                    ("Use a Golden Scroll", 1_500),
-                    ("Use a Rare Hero Spirit Shard", 250),
-                    ("Use an Epic Hero Spirit Shard", 1_250),
-                    ("Use a Legendary Hero Spirit Shard", 50_000),
-                    ("Use a Rare Hero Spirit Badge", 250),
-                    ("Use an Epic Hero Spirit Badge", 1_250),
-                    ("Use a Legendary Hero Spirit Badge", 50_000),
-                    ("Per 1 Lucky Ticket", 150_000),
-                ],
-                "tasks": [
-                    ("Use Silver Scrolls 10 time(s)",
-                     "1x Rare Spirit Shard, 5x Silver Scroll, 1x Book of Experience (1,000), 1x Research Speedup 60m"),
-                    ("Use Golden Scrolls 10 time(s)",
-                     "1x Epic Spirit Shard, 5x Golden Scroll, 1x Book of Experience (5,000), 2x Research Speedup 60m"),
-                    ("Skill up any hero 1 time(s)",
-                     "3x Rare Spirit Badge, 1x Silver Scroll, 1x Book of Experience (1,000), 1x Research Speedup 60m"),
-                    ("Skill up any hero 3 time(s)",
-                     "1x Epic Spirit Badge, 1x Golden Scroll, 1x Book of Experience (5,000), 2x Research Speedup 60m"),
-                    ("Rank up any hero 1 time(s)",
-                     "3x Rare Spirit Shard, 1x Silver Scroll, 1x Book of Experience (1,000), 1x Research Speedup 60m"),
-                    ("Rank up any hero 3 time(s)",
-                     "3x Rare Spirit Shard, 1x Golden Scroll, 1x Book of Experience (5,000), 2x Research Speedup 60m"),
-                ],
-            },
-            {
-                "name": "Day 4 — Shattered Skulls & Construction",
-                "scoring": [
-                    ("Shattered Skull Levels 1 ~ 5", 1_500),
-                    ("Shattered Skull Levels 6 ~ 10", 1_800),
-                    ("Shattered Skull Levels 11 ~ 15", 2_100),
-                    ("Shattered Skull Levels 16 ~ 20", 2_400),
-                    ("Shattered Skull Levels 21 ~ 25", 2_700),
-                    ("Shattered Skull Levels 26 ~ 30", 3_000),
-                    ("Shattered Skulls’ Fortress 1", 10_000),
-                    ("Shattered Skulls’ Fortress 2", 12_000),
-                    ("Shattered Skulls’ Fortress 3", 14_000),
-                    ("Shattered Skulls’ Fortress 4", 16_000),
-                    ("Increase construction Power by 1", 25),
-                ],
-                "tasks": [
-                    ("Defeat Shattered Skulls 10 time(s)",
-                     "1x Rare Spirit Shard, 1x Silver Scroll, 1x Book of Experience (1,000), 1x Seal of Solidarity"),
-                    ("Defeat Shattered Skulls 20 time(s)",
-                     "1x Epic Spirit Shard, 1x Golden Scroll, 1x Book of Experience (5,000), 3x Seal of Solidarity"),
-                    ("Destroy Shattered Skulls’ Fortress 2 time(s)",
-                     "1x Rare Spirit Badge, 1x Silver Scroll, 1x Book of Experience (1,000), 2x Seal of Solidarity"),
-                    ("Destroy Shattered Skulls’ Fortress 4 time(s)",
-                     "1x Epic Spirit Badge, 1x Golden Scroll, 1x Book of Experience (5,000), 5x Seal of Solidarity"),
-                    ("Increase Power by 30,000 with Construction",
-                     "30x Gem, 3x Epic Spirit Shard, 1x Silver Scroll, 1x Speedup 60m"),
-                    ("Increase Power by 60,000 with Construction",
-                     "100x Gem, 1x Legendary Spirit Shard, 1x Golden Scroll, 2x Speedup 60m"),
-                ],
-            },
-            {
-                "name": "Day 5 — Increase Power (Hero Power excluded)",
-                "scoring": [
-                    ("Increase Power by 1 (Hero Power excluded)", 20),
-                ],
-                "tasks": [
-                    ("Increase Power by 40,000",
-                     "50x Gem, 1x Rare Spirit Badge, 1x Silver Scroll, 5x Speedup 5m"),
-                    ("Increase Power by 80,000",
-                     "100x Gem, 1x Rare Spirit Shard, 1x Silver Scroll, 10x Speedup 5m"),
-                    ("Increase Power by 120,000",
-                     "150x Gem, 1x Epic Spirit Shard, 1x Golden Scroll, 15x Speedup 5m"),
-                    ("Increase Power by 180,000",
-                     "200x Gem, 1x Epic Spirit Shard, 1x Golden Scroll, 2x Speedup 60m"),
-                    ("Increase Power by 240,000",
-                     "250x Gem, 1x Legendary Spirit Badge, 1x Golden Scroll, 3x Speedup 60m"),
-                    ("Increase Power by 300,000",
-                     "300x Gem, 1x Legendary Spirit Shard, 1x Golden Scroll, 5x Speedup 60m"),
-                ],
-            },
-        ],
-    },
-
-    "Avatar Day Festival": {
-        "description": "Exchange Aang Cookies for rewards.",
-        "duration_days": 7,  # Shop on last day
-        "days": [
-            {
-                "name": "Day 1",
-                "scoring": [],
-                "tasks": [
-                    ("Login 1 Day(s)", "1x Aang Cookie, 1x Book of Experience (1,000), 1x 10,000 Food, 1x 10,000 Wood, 1x 10,000 Stone"),
-                    ("Login 2 Day(s)", "2x Aang Cookie, 2x Book of Experience (1,000), 2x 10,000 Food, 2x 10,000 Wood, 2x 10,000 Stone"),
-                    ("Login 3 Day(s)", "3x Aang Cookie, 1x Book of Experience (5,000), 3x 10,000 Food, 3x 10,000 Wood, 3x 10,000 Stone"),
-                    ("Login 4 Day(s)", "4x Aang Cookie, 1x Silver Scroll, 4x 10,000 Food, 4x 10,000 Wood, 4x 10,000 Stone"),
-                    ("Login 5 Day(s)", "5x Aang Cookie, 1x Golden Scroll, 5x 10,000 Food, 5x 10,000 Wood, 5x 10,000 Stone"),
-                    ("Recruit 3,000 Benders", "1x Aang Cookie, 1x Research Speedup 60m, 1x 50,000 Food, 1x 50,000 Wood, 1x 50,000 Stone"),
-                    ("Recruit 6,000 Benders", "3x Aang Cookie, 2x Research Speedup 60m, 3x 50,000 Food, 3x 50,000 Wood, 3x 50,000 Stone"),
-                    ("Recruit 12,000 Benders", "5x Aang Cookie, 1x Silver Scroll, 3x Research Speedup 60m, 5x 50,000 Food, 5x 50,000 Wood, 5x 50,000 Stone"),
-                    ("Recruit 20,000 Benders", "5x Aang Cookie, 1x Golden Scroll, 5x Research Speedup 60m, 10x 50,000 Food, 10x 50,000 Wood, 10x 50,000 Stone"),
-                ],
-            },
-            {
-                "name": "Day 2",
-                "scoring": [],
-                "tasks": [
-                    ("Use 500 AP", "1x Aang Cookie, 1x Book of Experience (5,000), 1x 50,000 Food, 1x 50,000 Wood, 1x 50,000 Stone"),
-                    ("Use 1,000 AP", "3x Aang Cookie, 1x Silver Scroll, 3x 50,000 Food, 3x 50,000 Wood, 3x 50,000 Stone"),
-                    ("Use 2,000 AP", "5x Aang Cookie, 1x Golden Scroll, 5x 50,000 Food, 5x 50,000 Wood, 5x 50,000 Stone"),
-                    ("Gather 100,000 resources from the field", "1x Aang Cookie, 1x Book of Experience (5,000), 5x Construction Speedup 5m, 5x Recruitment Speedup 5m, 5x Research Speedup 5m"),
-                    ("Gather 200,000 resources from the field", "2x Aang Cookie, 1x Silver Scroll, 10x Construction Speedup 5m, 10x Recruitment Speedup 5m, 10x Research Speedup 5m"),
-                    ("Gather 400,000 resources from the field", "3x Aang Cookie, 1x Golden Scroll, 15x Construction Speedup 5m, 15x Recruitment Speedup 5m, 15x Research Speedup 5m"),
-                    ("Gather 800,000 resources from the field", "5x Aang Cookie, 2x Golden Scroll, 2x Construction Speedup 60m, 2x Recruitment Speedup 60m, 2x Research Speedup 60m"),
-                ],
-            },
-            {
-                "name": "Day 3",
-                "scoring": [],
-                "tasks": [
-                    ("Increase Power by 40,000 with Construction", "1x Aang Cookie, 1x Book of Experience (5,000), 5x Construction Speedup 5m, 5x Recruitment Speedup 5m, 5x Research Speedup 5m"),
-                    ("Increase Power by 80,000 with Construction", "3x Aang Cookie, 1x Silver Scroll, 1x Construction Speedup 60m, 1x Recruitment Speedup 60m, 1x Research Speedup 60m"),
-                    ("Increase Power by 120,000 with Construction", "5x Aang Cookie, 1x Golden Scroll, 2x Construction Speedup 60m, 2x Recruitment Speedup 60m, 2x Research Speedup 60m"),
-                    ("Complete Expedition missions 10 time(s)", "1x Aang Cookie, 1x Book of Experience (5,000), 1x 50,000 Food, 1x 50,000 Wood, 1x 50,000 Stone"),
-                    ("Complete Expedition missions 20 time(s)", "3x Aang Cookie, 1x Silver Scroll, 3x 50,000 Food, 3x 50,000 Wood, 3x 50,000 Stone"),
-                    ("Complete Expedition missions 30 time(s)", "5x Aang Cookie, 1x Golden Scroll, 5x 10,000 Food, 5x 10,000 Wood, 5x 10,000 Stone"),
-                ],
-            },
-            {
-                "name": "Day 4",
-                "scoring": [],
-                "tasks": [
-                    ("Harvest 10,000 resources in the city", "1x Aang Cookie, 2x Book of Experience (1,000), 1x 10,000 Food, 1x 10,000 Wood, 1x 10,000 Stone"),
-                    ("Harvest 50,000 resources in the city", "2x Aang Cookie, 1x Book of Experience (5,000), 3x 10,000 Food, 3x 10,000 Wood, 3x 10,000 Stone"),
-                    ("Harvest 100,000 resources in the city", "3x Aang Cookie, 1x Silver Scroll, 1x 50,000 Food, 1x 50,000 Wood, 1x 50,000 Stone"),
-                    ("Harvest 150,000 resources in the city", "5x Aang Cookie, 1x Golden Scroll, 3x 50,000 Food, 3x 50,000 Wood, 3x 50,000 Stone"),
-                    ("Increase Power by 20,000 with Research", "1x Aang Cookie, 1x Book of Experience (5,000), 1x Construction Speedup 5m, 1x Recruitment Speedup 5m, 1x Research Speedup 5m"),
-                    ("Increase Power by 40,000 with Research", "3x Aang Cookie, 1x Silver Scroll, 1x Construction Speedup 60m, 1x Recruitment Speedup 60m, 1x Research Speedup 60m"),
-                    ("Increase Power by 60,000 with Research", "5x Aang Cookie, 1x Golden Scroll, 2x Construction Speedup 60m, 2x Recruitment Speedup 60m, 2x Research Speedup 60m"),
-                ],
-            },
-            {
-                "name": "Day 5",
-                "scoring": [],
-                "tasks": [
-                    ("Defeat Shattered Skulls 5 time(s)", "1x Aang Cookie, 1x Book of Experience (5,000), 2x 10,000 Food, 2x 10,000 Wood, 2x 10,000 Stone"),
-                    ("Defeat Shattered Skulls 10 time(s)", "3x Aang Cookie, 2x Book of Experience (5,000), 1x 50,000 Food, 1x 50,000 Wood, 1x 50,000 Stone"),
-                    ("Defeat Shattered Skulls 20 time(s)", "5x Aang Cookie, 1x Silver Scroll, 3x 50,000 Food, 3x 50,000 Wood, 3x 50,000 Stone"),
-                    ("Defeat Shattered Skulls 30 time(s)", "7x Aang Cookie, 1x Golden Scroll, 5x 50,000 Food, 5x 50,000 Wood, 5x 50,000 Stone"),
-                    ("Use any Scrolls 5 time(s)", "1x Aang Cookie, 1x Book of Experience (5,000), 2x Construction Speedup 5m, 2x Recruitment Speedup 5m, 2x Research Speedup 5m"),
-                    ("Use any Scrolls 10 time(s)", "3x Aang Cookie, 1x Silver Scroll, 5x Construction Speedup 5m, 5x Recruitment Speedup 5m, 5x Research Speedup 5m"),
-                    ("Use any Scrolls 15 time(s)", "5x Aang Cookie, 1x Golden Scroll, 1x Construction Speedup 60m, 1x Recruitment Speedup 60m, 1x Research Speedup 60m"),
-                ],
-            },
-            {
-                "name": "Exchange Shop (last day only)",
-                "scoring": [],
-                "tasks": [
-                    ("1 Cookie → Speedup 60m", "Qty 10"),
-                    ("1 Cookie → 50,000 Food", "Qty 10"),
-                    ("1 Cookie → 50,000 Wood", "Qty 10"),
-                    ("1 Cookie → 50,000 Stone", "Qty 10"),
-                    ("1 Cookie → 25,000 Gold", "Qty 10"),
-                    ("2 Cookies → Rare Spirit Shard", "Qty 10"),
-                    ("2 Cookies → Rare Spirit Badge", "Qty 10"),
-                    ("2 Cookies → Silver Scroll", "Qty 10"),
-                    ("8 Cookies → Spirit Shard: Zuko", "Qty 10"),
-                    ("8 Cookies → Spirit Shard: Katara", "Qty 10"),
-                    ("8 Cookies → Spirit Shard: Toph", "Qty 10"),
-                    ("8 Cookies → Spirit Shard: Tenzin", "Qty 10"),
-                    ("10 Cookies → Golden Scroll", "Qty 10"),
-                    ("10 Cookies → Reset Talents", "Qty 1"),
-                    ("30 Cookies → Legendary Spirit Shard", "Qty 2"),
-                    ("30 Cookies → Legendary Spirit Badge", "Qty 2"),
-                ],
-            },
-        ],
-    },
-
-    "Journey of Us": {
-        "description": "Let’s not forget our journey. Every step has been meaningful.",
-        "duration_days": 2,
-        "days": [
-            {
-                "name": "All Days",
-                "scoring": [],
-                "tasks": [
-                    ("Use Silver Scroll 5 time(s)", "1x Silver Scroll, 1x Book of Experience (1,000), 1x 10,000 Food, 1x 10,000 Wood, 1x 10,000 Stone"),
-                    ("Use Silver Scroll 20 time(s)", "3x Silver Scroll, 1x Book of Experience (5,000), 3x 10,000 Food, 3x 10,000 Wood, 3x 10,000 Stone"),
-                    ("Use Golden Scroll 5 time(s)", "1x Golden Scroll, 1x Book of Experience (1,000), 1x 10,000 Food, 1x 10,000 Wood, 1x 10,000 Stone"),
-                    ("Use Golden Scroll 20 time(s)", "3x Golden Scroll, 1x Book of Experience (1,000), 3x 10,000 Food, 3x 10,000 Wood, 3x 10,000 Stone"),
-                    ("Send airship 4 time(s)", "1x Silver Scroll, 2x Book of Experience (1,000), 5x Construction Speedup 5m, 5x Recruitment Speedup 5m, 5x Research Speedup 5m"),
-                    ("Successfully raid another airship 4 time(s)", "1x Golden Scroll, 1x Book of Experience (5,000), 1x Construction Speedup 60m, 1x Recruitment Speedup 60m, 1x Research Speedup 60m"),
-                ],
-            }
-        ],
-    },
-
-    "Supply Quest": {
-        "description": "Collect as many Supply Chests as possible. Resets daily at 00:00 UTC.",
-        "duration_days": 2,
-        "days": [
-            {
-                "name": "Daily",
-                "scoring": [
-                    ("Defeat Shattered Skulls (per Supply Chest)", 10),
-                    ("Gather Resources (per 50,000 gathered → 1 Supply Chest)", 1),
-                ],
-                "tasks": [
-                    ("Defeat Shattered Skulls", "Earn points via Supply Chests"),
-                    ("Gather Resources on the field", "Earn points via Supply Chests (1 per 50,000)"),
-                ],
-            }
-        ],
-    },
-
-    "Timeless": {
-        "description": "Cherished values transcend the ages.",
-        "duration_days": 1,
-        "days": [
-            {
-                "name": "All Day",
-                "scoring": [],
-                "tasks": [
-                    ("Use 200 Minutes of Speedup items", "100x Gem, 5x Speedup 5m, 1x 150K Food, 1x 150K Wood, 1x 150K Stone, 1x 75,000 Gold"),
-                    ("Use 1,000 Minutes of Speedup items", "150x Gem, 10x Speedup 5m, 2x 150K Food, 2x 150K Wood, 2x 150K Stone, 2x 75,000 Gold"),
-                    ("Use 3,000 Minutes of Speedup items", "200x Gem, 2x Speedup 60m, 3x 150K Food, 3x 150K Wood, 3x 150K Stone, 3x 75,000 Gold"),
-                    ("Use 6,000 Minutes of Speedup items", "250x Gem, 3x Speedup 60m, 4x 150K Food, 4x 150K Wood, 4x 150K Stone, 4x 75,000 Gold"),
-                    ("Use 12,000 Minutes of Speedup items", "400x Gem, 5x Speedup 60m, 5x 150K Food, 5x 150K Wood, 5x 150K Stone, 5x 75,000 Gold"),
-                ],
-            }
-        ],
-    },
-
-    "Unbreakable Will": {
-        "description": "What matters is an unyielding determination! Resets daily at 00:00 UTC.",
-        "duration_days": 3,
-        "days": [
-            {
-                "name": "Daily",
-                "scoring": [],
-                "tasks": [
-                    ("Use 300 AP", "1x Construction Speedup 60m, 1x 10,000 Food, 1x 10,000 Wood, 1x 10,000 Stone"),
-                    ("Use 1,000 AP", "5x Research Speedup 60m, 3x 10,000 Food, 3x 10,000 Wood, 3x 10,000 Stone"),
-                    ("Recruit 1,000 Benders", "1x Book of Experience (5,000), 1x 10,000 Food, 1x 10,000 Wood, 1x 10,000 Stone"),
-                    ("Recruit 2,000 Benders", "1x Rare Spirit Shard, 3x 10,000 Food, 3x 10,000 Wood, 3x 10,000 Stone"),
-                    ("Recruit 6,000 Benders", "1x Epic Spirit Shard, 1x 50,000 Food, 1x 50,000 Wood, 1x 50,000 Stone"),
-                    ("Harvest 20,000 resources in the city", "1x Silver Scroll, 1x Construction Speedup 5m, 1x Recruitment Speedup 5m, 1x Research Speedup 5m"),
-                    ("Harvest 100,000 resources in the city", "1x Golden Scroll, 3x Construction Speedup 5m, 3x Recruitment Speedup 5m, 3x Research Speedup 5m"),
-                ],
-            }
-        ],
-    },
-
-    "Harvest Season": {
-        "description": "Gather abundant resources to build an outstanding city.",
-        "duration_days": 2,
-        "days": [
-            {
-                "name": "All Days",
-                "scoring": [],
-                "tasks": [
-                    ("Gather 200,000 resources from the field", "1x Book of Experience (5,000), 1x 10,000 Food, 1x 10,000 Wood, 1x 10,000 Stone"),
-                    ("Gather 500,000 resources from the field", "1x Silver Scroll, 3x 10,000 Food, 3x 10,000 Wood, 3x 10,000 Stone"),
-                    ("Gather 1,000,000 resources from the field", "1x Golden Scroll, 1x 50,000 Food, 1x 50,000 Wood, 1x 50,000 Stone"),
-                    ("Purchase items at the Trading Post 5 time(s)", "1x Book of Experience (5,000), 5x Research Speedup 5m, 1x AP Potion 100, 1x Seal of Solidarity"),
-                    ("Purchase items at the Trading Post 15 time(s)", "1x Silver Scroll, 1x Research Speedup 60m, 3x AP Potion 100, 2x Seal of Solidarity"),
-                    ("Purchase items at the Trading Post 30 time(s)", "1x Golden Scroll, 2x Research Speedup 60m, 5x AP Potion 100, 3x Seal of Solidarity"),
-                ],
-            }
-        ],
-    },
-}
+# worker.py starts loading it in a thread before importing this module: the bot then starts with an
+# empty catalog and TimeBot.setup_hook installs the real one as soon as it's ready, without holding
+# up the gateway connect. Imported any other way (bench, `python bot.py`) it's loaded right here.
+_CATALOG_PRELOAD = pending_preload()
+CATALOG: Catalog = Catalog.build(0, "", ()) if _CATALOG_PRELOAD is not None else load_catalog()
+CATALOG_READY = asyncio.Event()  # interactions that arrive before the preload finishes wait on this
+if _CATALOG_PRELOAD is None:
+    CATALOG_READY.set()
+
+
+async def wait_for_catalog() -> None:
+    """Hold an interaction until the preloaded catalog is installed, but not past the reply deadline."""
+    if not CATALOG_READY.is_set():  # only right after a cold start
+        try:
+            await asyncio.wait_for(CATALOG_READY.wait(), timeout=RESPONSE_DEADLINE - DEADLINE_MARGIN)
+        except asyncio.TimeoutError:
+            pass
+
+
+# Per-guild state (event anchors, ...) and the schedule engine built on top of it
+STORE = Store()
+SCHEDULE = ScheduleEngine(CATALOG, STORE.get_anchors)
+# Poll the events file every N seconds and hot-reload on change (0 = off; /reload still works)
+CATALOG_WATCH_SECONDS = float(os.getenv("CATALOG_WATCH_SECONDS") or 0)
+
+
+# =========================================
+# INSTRUMENTATION (metrics.py registry, scraped from /metrics)
+# =========================================
+CMD_TOTAL = REGISTRY.counter(
+    "timebot_commands_total", "Slash command invocations by outcome.", ("command", "outcome"))
+CMD_SECONDS = REGISTRY.histogram(
+    "timebot_command_seconds", "Slash command time from receipt until the handler returned.", ("command",))
+CMD_ERRORS = REGISTRY.counter(
+    "timebot_command_errors_total", "Slash command failures by exception type.", ("command", "error"))
+RESPONSE_SECONDS = REGISTRY.histogram(
+    "timebot_response_seconds",
+    "First interaction response. phase=handler: receipt until our code called Discord; "
+    "phase=discord: the response HTTP call itself.",
+    ("command", "phase"))
+AC_TOTAL = REGISTRY.counter(
+    "timebot_autocomplete_total", "Autocomplete handler calls by outcome.", ("handler", "outcome"))
+AC_SECONDS = REGISTRY.histogram(
+    "timebot_autocomplete_seconds", "Autocomplete handler run time.", ("handler",))
+RATE_LIMITED = REGISTRY.counter(
+    "timebot_rate_limited_total", "Public posts refused by the per-user/per-channel limiter.", ("command", "scope"))
+DEDUPED = REGISTRY.counter(
+    "timebot_deduplicated_posts_total", "Public posts answered with a link to an identical recent post.",
+    ("command",))
+SCAN_REPLIES = REGISTRY.counter(
+    "timebot_scan_replies_total", "Chat messages with UTC times found by the passive scanner, by outcome.",
+    ("outcome",))
+
+_EMBED_CACHE_STATS: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def _interaction_label(interaction: discord.Interaction) -> str:
+    name = interaction.command.qualified_name if interaction.command else "unknown"
+    if interaction.type is discord.InteractionType.autocomplete:
+        return f"{name} (autocomplete)"
+    return name
+
+
+async def _timed_first_response(interaction: discord.Interaction, call: Any) -> Any:
+    called_at = time.perf_counter()
+    try:
+        return await call
+    finally:
+        received = interaction.extras.get(RECEIVED_AT)
+        if received is not None and "responded_at" not in interaction.extras:
+            interaction.extras["responded_at"] = called_at
+            label = _interaction_label(interaction)
+            RESPONSE_SECONDS.observe(called_at - received, label, "handler")
+            RESPONSE_SECONDS.observe(time.perf_counter() - called_at, label, "discord")
+
+
+class TimedResponse(discord.InteractionResponse):
+    """InteractionResponse that records how long until, and how long, the first response call took."""
+
+    async def send_message(self, *args: Any, **kwargs: Any) -> Any:
+        return await _timed_first_response(self._parent, super().send_message(*args, **kwargs))
+
+    async def defer(self, *args: Any, **kwargs: Any) -> Any:
+        return await _timed_first_response(self._parent, super().defer(*args, **kwargs))
+
+    async def edit_message(self, *args: Any, **kwargs: Any) -> Any:
+        return await _timed_first_response(self._parent, super().edit_message(*args, **kwargs))
+
+    async def send_modal(self, *args: Any, **kwargs: Any) -> Any:
+        return await _timed_first_response(self._parent, super().send_modal(*args, **kwargs))
+
+    async def autocomplete(self, *args: Any, **kwargs: Any) -> Any:
+        return await _timed_first_response(self._parent, super().autocomplete(*args, **kwargs))
+
+
+class InstrumentedTree(app_commands.CommandTree):
+    """CommandTree that stamps every interaction on receipt and records failures by type.
+
+    Successful commands are recorded by TimeBot.on_app_command_completion."""
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        interaction.extras[RECEIVED_AT] = time.perf_counter()
+        try:
+            interaction._cs_response  # type: ignore[attr-defined]
+        except AttributeError:  # not created yet: swap in the timed one
+            interaction._cs_response = TimedResponse(interaction)  # type: ignore[attr-defined]
+        await wait_for_catalog()
+        return True
+
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError) -> None:
+        label = _interaction_label(interaction)
+        if isinstance(error, PostRateLimited):
+            _record_command(interaction, label, "rate_limited")
+            RATE_LIMITED.inc(label, error.scope)
+            log_json("command", command=label, outcome="rate_limited", scope=error.scope,
+                     retry_after=round(error.retry_after, 1), guild=interaction.guild_id)
+            await interaction.response.send_message(
+                f"Slow down — too many public posts {error.scope_text}. "
+                f"Try again in {error.retry_after:.0f}s, or leave `public` off.",
+                ephemeral=True,
+            )
+            return
+        original = getattr(error, "original", error)  # unwrap CommandInvokeError
+        seconds = _record_command(interaction, label, "error")
+        CMD_ERRORS.inc(label, type(original).__name__)
+        log_json(
+            "command", command=label, outcome="error", error=type(original).__name__,
+            detail=str(original), seconds=round(seconds, 4), guild=interaction.guild_id,
+        )
+        await super().on_error(interaction, error)
+
+
+def _record_command(interaction: discord.Interaction, label: str, outcome: str) -> float:
+    received = interaction.extras.get(RECEIVED_AT)
+    seconds = time.perf_counter() - received if received is not None else 0.0
+    CMD_TOTAL.inc(label, outcome)
+    CMD_SECONDS.observe(seconds, label)
+    return seconds
+
+
+def timed_autocomplete(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Count and time an autocomplete handler (the tree swallows its exceptions, so log them here)."""
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(interaction: discord.Interaction, current: str) -> Any:
+        t0 = time.perf_counter()
+        outcome = "ok"
+        try:
+            return await func(interaction, current)
+        except Exception as e:
+            outcome = "error"
+            log_json("autocomplete", handler=name, outcome="error", error=type(e).__name__, detail=str(e))
+            raise
+        finally:
+            AC_TOTAL.inc(name, outcome)
+            AC_SECONDS.observe(time.perf_counter() - t0, name)
+
+    return wrapper
+
+
+def _gateway_latencies() -> List[Tuple[Tuple[str, ...], float]]:
+    pairs = bot.latencies if isinstance(bot, discord.AutoShardedClient) else [(0, bot.latency)]
+    return [((str(shard_id),), lat) for shard_id, lat in pairs if lat == lat and lat != float("inf")]
+
+
+def _cache_lookups() -> List[Tuple[Tuple[str, ...], float]]:
+    return [
+        ((cache, result), stats[key])
+        for cache, stats in (("embeds", _EMBED_CACHE_STATS), ("search", search.CACHE_STATS))
+        for result, key in (("hit", "hits"), ("miss", "misses"))
+    ]
+
+
+REGISTRY.gauge("timebot_gateway_latency_seconds", "Gateway heartbeat latency per shard.", ("shard",),
+               _gateway_latencies)
+REGISTRY.gauge("timebot_cache_lookups_total", "Embed render cache and autocomplete query cache lookups.",
+               ("cache", "result"), _cache_lookups, kind="counter")
+REGISTRY.gauge("timebot_guilds", "Guilds this process is in.", (), lambda: [((), len(bot.guilds))])
+
 
 # =========================================
 # BOT BOOTSTRAP
 # =========================================
-class TimeBot(discord.Client):
+class TimeBot(discord.AutoShardedClient if SHARDS.enabled else discord.Client):
     def __init__(self):
         intents = discord.Intents.default()
-        super().__init__(intents=intents)
-        self.tree = app_commands.CommandTree(self)
+        intents.message_content = bool(SCAN_CHANNELS)
+        super().__init__(intents=intents, **SHARDS.client_kwargs())
+        if SCAN_CHANNELS:  # no on_message at all otherwise, so other channels' messages cost nothing
+            self.on_message = self._scan_message
+        self.tree = InstrumentedTree(self)
+        self.syncer = SyncManager(self.tree, STORE, concurrency=SYNC_CONCURRENCY)
+        self.shard_stats = ShardStats()
         self._synced = False
+        self._metrics_runner = None
+        self._owner_ids: Optional[Tuple[int, ...]] = None  # application owner / team members, fetched once
 
     async def setup_hook(self):
-        # Prefer fast per-guild sync when GUILD_ID is provided
-        if GUILD_OBJ:
-            cmds = await self.tree.sync(guild=GUILD_OBJ)
-            print(f"[setup_hook] Per-guild sync to {GUILD_ID_ENV}: {len(cmds)} command(s)")
-        else:
-            cmds = await self.tree.sync()  # global sync
-            print(f"[setup_hook] Global sync: {len(cmds)} command(s)")
+        print(f"[setup_hook] Running {SHARDS.describe()}")
+        if METRICS_PORT:
+            self._metrics_runner = await start_http_server(METRICS_HOST, METRICS_PORT)
+            print(f"[setup_hook] Metrics on http://{METRICS_HOST}:{METRICS_PORT}/metrics")
+        if CATALOG_READY.is_set():
+            await self._start_catalog_services()
+        else:  # preloading (worker.py): finish in the background while we sync and connect
+            asyncio.create_task(self._install_preloaded_catalog())
+        if SHARD_REPORT_SECONDS > 0:
+            asyncio.create_task(self._report_shards(SHARD_REPORT_SECONDS))
+        asyncio.create_task(asyncio.to_thread(zone_index))  # /time's zone autocomplete, built off the loop
+        # Prefer fast per-guild sync when GUILD_ID is provided; either way skip it if nothing changed
+        cmds = await self.syncer.sync(GUILD_OBJ)
+        scope = f"Per-guild sync to {GUILD_ID_ENV}" if GUILD_OBJ else "Global sync"
+        print(f"[setup_hook] {scope}: {'unchanged, skipped' if cmds is None else f'{cmds} command(s)'}")
+
+    async def _install_preloaded_catalog(self) -> None:
+        t0 = time.perf_counter()
+        try:
+            catalog = await asyncio.wrap_future(_CATALOG_PRELOAD)
+        except CatalogError as e:
+            print(f"[setup_hook] Invalid events file, shutting down: {e}")
+            await self.close()
+            return
+        install_catalog(catalog, warm=False)
+        print(f"[setup_hook] Catalog ready ({len(catalog)} event(s), waited {time.perf_counter() - t0:.3f}s)")
+        await self._start_catalog_services()
+        CATALOG_READY.set()
+
+    async def _start_catalog_services(self) -> None:
+        """Render cache, reminders and the file watcher: everything that needs the catalog loaded."""
+        ready = await warm_embed_cache_async()
+        print(f"[setup_hook] {ready} event/day embed(s) ready ({'shared ' + RENDERS.path if RENDERS else 'in-process'})")
+        REMINDERS.start()
+        print(f"[setup_hook] Loaded {len(REMINDERS)} pending reminder(s)")
+        if CATALOG_WATCH_SECONDS > 0:
+            asyncio.create_task(_watch_catalog(CATALOG_WATCH_SECONDS))
 
     async def on_ready(self):
         print(f"Logged in as {self.user} (id={self.user.id})")
         # If we didn't have a GUILD_ID, copy globals to each joined guild for immediate availability
         if not GUILD_OBJ and not self._synced:
-            for g in self.guilds:
-                try:
-                    self.tree.copy_global_to(guild=g)
-                    cmds = await self.tree.sync(guild=g)
-                    print(f"[on_ready] Copied and synced to guild {g.name} ({g.id}): {len(cmds)} command(s)")
-                except Exception as e:
-                    print(f"[on_ready] Failed to sync to {g.name} ({g.id}): {type(e).__name__}: {e}")
             self._synced = True
+            synced, skipped, failed = await self.sync_guild_copies()
+            print(f"[on_ready] Guild command copies: {synced} synced, {skipped} unchanged, {len(failed)} failed")
+            for guild_id, e in failed:
+                print(f"[on_ready] Failed to sync to guild {guild_id}: {type(e).__name__}: {e}")
+
+    async def sync_guild_copies(self, force: bool = False) -> Tuple[int, int, List[Tuple[int, Exception]]]:
+        for g in self.guilds:
+            self.tree.copy_global_to(guild=g)
+        return await self.syncer.sync_many(self.guilds, force=force)
+
+    async def close(self):
+        if self._metrics_runner is not None:
+            await self._metrics_runner.cleanup()
+        await super().close()
+
+    async def on_app_command_completion(self, interaction: discord.Interaction, command: Any):
+        label = _interaction_label(interaction)
+        seconds = _record_command(interaction, label, "ok")
+        responded = interaction.extras.get("responded_at")
+        received = interaction.extras.get(RECEIVED_AT)
+        log_json(
+            "command", command=label, outcome="ok", seconds=round(seconds, 4),
+            response_seconds=round(responded - received, 4) if responded and received else None,
+            guild=interaction.guild_id, shard=self.shard_of(interaction.guild_id),
+        )
+
+    async def on_shard_connect(self, shard_id: int):
+        self.shard_stats.record_connect(shard_id)
+
+    async def on_interaction(self, interaction: discord.Interaction):
+        self.shard_stats.record_event(self.shard_of(interaction.guild_id))
+
+    async def _scan_message(self, message: discord.Message) -> None:
+        channel = message.channel
+        if channel.id not in SCAN_CHANNELS and getattr(channel, "parent_id", None) not in SCAN_CHANNELS:
+            return
+        if message.author.bot or "<t:" in message.content:
+            return
+        found = scan_utc_times(message.content)
+        if not found:
+            return
+        if CHANNEL_POSTS is not None and CHANNEL_POSTS.take(channel.id):
+            SCAN_REPLIES.inc("rate_limited")
+            return
+        try:
+            await message.reply(scan_reply(found), mention_author=False,
+                                allowed_mentions=discord.AllowedMentions.none())
+        except discord.HTTPException as e:  # no Send Messages permission, message deleted, ...
+            SCAN_REPLIES.inc("failed")
+            print(f"[scan] Reply in {channel.id} failed: {type(e).__name__}: {e}")
+            return
+        SCAN_REPLIES.inc("replied")
+
+    async def is_owner(self, user: discord.abc.User) -> bool:
+        """Whether `user` owns the application or is on its team (what commands.Bot.is_owner checks)."""
+        if self._owner_ids is None:
+            app = await self.application_info()
+            self._owner_ids = tuple(m.id for m in app.team.members) if app.team else (app.owner.id,)
+        return user.id in self._owner_ids
+
+    def shard_of(self, guild_id: Optional[int]) -> int:
+        if not guild_id or not self.shard_count:
+            return 0
+        return shard_for_guild(guild_id, self.shard_count)
+
+    def shard_report(self) -> List[str]:
+        if isinstance(self, discord.AutoShardedClient):
+            latencies = self.latencies
+        else:
+            latencies = [(0, self.latency)]
+        guild_counts: Dict[int, int] = {}
+        for g in self.guilds:
+            guild_counts[self.shard_of(g.id)] = guild_counts.get(self.shard_of(g.id), 0) + 1
+        lines = []
+        for shard_id, latency in latencies:
+            ms = f"{latency * 1000:.0f} ms" if latency == latency and latency != float("inf") else "n/a"
+            lines.append(
+                f"shard {shard_id}: latency {ms}, {guild_counts.get(shard_id, 0)} guild(s), "
+                f"{self.shard_stats.events_per_minute(shard_id):.0f} interactions/min, "
+                f"{self.shard_stats.totals.get(shard_id, 0)} total, "
+                f"{self.shard_stats.connects.get(shard_id, 0)} connect(s)"
+            )
+        return lines
+
+    async def _report_shards(self, interval: float) -> None:
+        await self.wait_until_ready()
+        while not self.is_closed():
+            for line in self.shard_report():
+                print(f"[shards] {line}")
+            await asyncio.sleep(interval)
 
 
 bot = TimeBot()
@@ -391,84 +402,270 @@ bot = TimeBot()
 # =========================================
 # HELPERS (formatting & data access)
 # =========================================
-def _chunk_lines(lines: List[str], limit: int = 950) -> List[str]:
-    """Split long bullet lists so each chunk stays under ~950 chars (embed field max is 1024)."""
-    chunks: List[str] = []
-    cur = ""
-    for line in lines:
-        add = f"{line}\n"
-        if len(cur) + len(add) > limit:
-            if cur:
-                chunks.append(cur.rstrip())
-            cur = add
-        else:
-            cur += add
-    if cur:
-        chunks.append(cur.rstrip())
-    return chunks
-
-
-def _format_scoring(scoring: List[Tuple[str, int]]) -> List[str]:
-    if not scoring:
-        return ["• *(No point scoring specified for this day)*"]
-    out: List[str] = []
-    for label, pts in scoring:
-        pts_str = f"{pts:,}" if isinstance(pts, int) and pts >= 1000 else str(pts)
-        out.append(f"• **+{pts_str}** — {label}")
+def get_event_names() -> Sequence[str]:
+    return CATALOG.event_names
+
+
+def get_day_names(event_name: str) -> Sequence[str]:
+    return CATALOG.day_names(event_name)
+
+
+# Render cache: (event, day) -> messages of serialized embed payloads, copied per response. A catalog loaded
+# from an events file is rendered once into the shared render file (events.render, memory-mapped
+# by every worker process) and this process only keeps the EMBED_CACHE_SIZE most recently used
+# decodes; an in-memory catalog is pre-rendered here in full.
+EMBED_CACHE_SIZE = 512
+RENDERS: Optional[RenderFile] = None
+RenderCache = "OrderedDict[Tuple[str, str], List[List[Dict[str, Any]]]]"
+_EMBED_CACHE: RenderCache = OrderedDict()
+_RANKINGS_CACHE: Dict[str, List[List[Dict[str, Any]]]] = {}  # event -> rankings page, rendered on first view
+
+
+def _copy_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an embed payload deep enough that discord.Embed can't mutate the cached one."""
+    out = dict(payload)
+    if "fields" in out:
+        out["fields"] = [dict(f) for f in out["fields"]]
+    if "footer" in out:
+        out["footer"] = dict(out["footer"])
     return out
 
 
-def _format_tasks(tasks: List[Tuple[str, str]]) -> List[str]:
-    if not tasks:
-        return ["• *(No tasks listed for this day)*"]
-    return [f"• **{t}**\n  ↳ {r}" for t, r in tasks]
+def _attach_render_file(catalog: Catalog) -> Optional[RenderFile]:
+    """Map the shared render file for `catalog`, writing it first if it's missing or stale."""
+    if not catalog.digest:
+        return None
+    path = render_path(resolve_source())
+    renders = RenderFile.open(path, catalog.digest)
+    if renders is None:
+        try:
+            write_render_file(catalog, path)
+        except OSError as e:
+            print(f"[render] Could not write {path}: {e}")
+            return None
+        renders = RenderFile.open(path, catalog.digest)
+    return renders
 
 
-def get_event_names() -> List[str]:
-    return list(EVENTS.keys())
+def prepare_renders(catalog: Catalog) -> Tuple[Optional[RenderFile], RenderCache]:
+    """Attach the shared render file for `catalog`, or pre-render every (event, day) pair of it.
 
+    Touches no module state, so it can run in a worker thread; install_renders() applies
+    the result on the event loop."""
+    renders = _attach_render_file(catalog)
+    cache: RenderCache = OrderedDict()
+    if renders is None:
+        for event_name in catalog.event_names:
+            for day_name in catalog.day_names(event_name):
+                cache[(event_name, day_name)] = render_event_day(catalog, event_name, day_name)
+    return renders, cache
 
-def get_day_names(event_name: str) -> List[str]:
-    ev = EVENTS.get(event_name)
-    if not ev:
-        return []
-    return [d["name"] for d in ev.get("days", [])]
+
+def install_renders(catalog: Catalog, renders: Optional[RenderFile], cache: RenderCache) -> int:
+    """Swap in what prepare_renders() built, unless CATALOG changed meanwhile. Returns the pairs ready."""
+    global RENDERS, _EMBED_CACHE
+    if catalog is not CATALOG:  # a reload won the race; its own warm-up covers the new catalog
+        if renders is not None:
+            renders.close()
+        return 0
+    if RENDERS is not None:
+        RENDERS.close()
+    RENDERS = renders
+    _EMBED_CACHE = cache
+    return len(renders) if renders is not None else len(cache)
+
+
+def warm_embed_cache() -> int:
+    """Render cache for the current CATALOG, built here (blocking). Returns the pairs ready to serve."""
+    return install_renders(CATALOG, *prepare_renders(CATALOG))
 
 
-def build_event_embeds(event_name: str, day_name: str) -> List[discord.Embed]:
-    ev = EVENTS[event_name]
-    day = next((d for d in ev["days"] if d["name"] == day_name), None)
-    if not day:
-        raise ValueError("Day not found for event.")
+async def warm_embed_cache_async() -> int:
+    """warm_embed_cache() with the rendering on a worker thread; the caches are swapped on the loop."""
+    catalog = CATALOG
+    return install_renders(catalog, *await asyncio.to_thread(prepare_renders, catalog))
 
-    title = f"{event_name} • {day_name}"
-    embed1 = discord.Embed(title=title, description=ev.get("description") or "", color=0x2B6CB0)
 
-    # Meta
-    meta_bits: List[str] = []
-    if ev.get("duration_days"):
-        meta_bits.append(f"**Duration:** {ev['duration_days']} day(s)")
-    if ev.get("repeats"):
-        meta_bits.append(f"**Repeats:** {ev['repeats']}")
-    if meta_bits:
-        embed1.add_field(name="Info", value="\n".join(meta_bits), inline=False)
+def invalidate_embed_cache() -> None:
+    """Drop all cached renders. Call whenever CATALOG changes."""
+    global RENDERS
+    _EMBED_CACHE.clear()
+    _RANKINGS_CACHE.clear()
+    if RENDERS is not None:
+        RENDERS.close()
+        RENDERS = None
 
-    # Scoring
-    scoring_lines = _format_scoring(day.get("scoring", []))
-    for i, chunk in enumerate(_chunk_lines(scoring_lines)):
-        embed1.add_field(name="Scoring" if i == 0 else "Scoring (cont.)", value=chunk, inline=False)
 
-    # Tasks & Rewards — separate embed to avoid hitting field limits
-    embed2 = discord.Embed(color=0x2B6CB0)
-    task_lines = _format_tasks(day.get("tasks", []))
-    for i, chunk in enumerate(_chunk_lines(task_lines)):
-        embed2.add_field(name="Tasks & Rewards" if i == 0 else "Tasks & Rewards (cont.)",
-                         value=chunk, inline=False)
+def _schedule_field(status: Status, day_name: str) -> str:
+    lines: List[str] = []
+    if status.running:
+        lines.append(f"**Live now:** {status.day_name} (day ends <t:{int(status.day_end.timestamp())}:R>)")
+        lines.append(f"**Event ends:** <t:{int(status.end.timestamp())}:F>")
+    else:
+        lines.append(f"**Next start:** <t:{int(status.start.timestamp())}:F> (<t:{int(status.start.timestamp())}:R>)")
+    names = status.event.day_names
+    if day_name in names and len(names) > 1:
+        day_start = int((status.start + names.index(day_name) * DAY).timestamp())
+        lines.append(f"**{day_name}:** <t:{day_start}:F> (<t:{day_start}:R>)")
+    return "\n".join(lines)
 
-    if ev.get("notes"):
-        embed2.set_footer(text=ev["notes"])
 
-    return [embed1, embed2]
+def event_day_payloads(event_name: str, day_name: str) -> List[List[Dict[str, Any]]]:
+    """Cached serialized render of an event day (render file or in-process), per message. Don't mutate."""
+    key = (event_name, day_name)
+    payloads = _EMBED_CACHE.get(key)
+    if payloads is None:
+        _EMBED_CACHE_STATS["misses"] += 1
+        payloads = RENDERS.get(event_name, day_name) if RENDERS is not None else None
+        if payloads is None:
+            payloads = render_event_day(CATALOG, event_name, day_name)
+        _EMBED_CACHE[key] = payloads
+        if RENDERS is not None and len(_EMBED_CACHE) > EMBED_CACHE_SIZE:
+            _EMBED_CACHE.popitem(last=False)
+    else:
+        _EMBED_CACHE_STATS["hits"] += 1
+        _EMBED_CACHE.move_to_end(key)
+    return payloads
+
+
+def build_event_messages(event_name: str, day_name: str,
+                         guild_id: Optional[int] = None) -> List[List[discord.Embed]]:
+    """Embeds for an event day, per message: usually one; very large days have more parts."""
+    payloads = event_day_payloads(event_name, day_name)
+    messages = [[discord.Embed.from_dict(_copy_payload(p)) for p in msg] for msg in payloads]
+    # Guild-specific live schedule goes on top of the shared cached render (which keeps room for it)
+    status = SCHEDULE.for_guild(guild_id).status(event_name) if guild_id else None
+    if status is not None:
+        messages[0][0].add_field(name="Schedule", value=_schedule_field(status, day_name), inline=False)
+    return messages
+
+
+# =========================================
+# CATALOG RELOAD (no gateway reconnect)
+# =========================================
+_catalog_listeners: List[Callable[[Catalog], None]] = []
+_reload_lock = asyncio.Lock()
+
+
+def on_catalog_change(func: Callable[[Catalog], None]) -> Callable[[Catalog], None]:
+    """Register a callback that rebuilds derived state after CATALOG is swapped."""
+    _catalog_listeners.append(func)
+    return func
+
+
+def install_catalog(new_catalog: Catalog, warm: bool = True) -> None:
+    """Swap CATALOG and rebuild everything derived from it."""
+    global CATALOG
+    CATALOG = new_catalog
+    invalidate_embed_cache()
+    for listener in _catalog_listeners:
+        listener(new_catalog)
+    if warm:
+        warm_embed_cache()
+
+
+async def reload_catalog(path: Optional[str] = None) -> Tuple[Catalog, bool]:
+    """Re-read the events file in a worker thread and swap it in atomically.
+
+    Raises CatalogError (and keeps the current catalog) if the file is invalid.
+    Returns (new catalog, whether slash commands had to be re-synced).
+    """
+    async with _reload_lock:
+        new_catalog = await asyncio.to_thread(load_catalog, path, False)
+        install_catalog(new_catalog, warm=False)
+        await warm_embed_cache_async()
+
+        # The sync manager only talks to Discord for scopes whose command payload changed
+        resynced = await bot.syncer.sync(GUILD_OBJ) is not None
+        if not GUILD_OBJ and bot.is_ready():
+            synced, _, _ = await bot.sync_guild_copies()
+            resynced = resynced or synced > 0
+        return new_catalog, resynced
+
+
+async def _watch_catalog(interval: float) -> None:
+    source = resolve_source()
+    try:
+        last_seen = os.stat(source).st_mtime_ns
+    except OSError:
+        last_seen = None
+    while not bot.is_closed():
+        await asyncio.sleep(interval)
+        try:
+            mtime = os.stat(source).st_mtime_ns
+        except OSError:
+            continue
+        if mtime == last_seen:
+            continue
+        last_seen = mtime
+        try:
+            new_catalog, resynced = await reload_catalog()
+            print(f"[watch] Reloaded {len(new_catalog)} event(s) from {source}"
+                  f"{' (commands re-synced)' if resynced else ''}")
+        except CatalogError as e:
+            print(f"[watch] Ignoring invalid {source}: {e}")
+
+
+# =========================================
+# PUBLIC POST LIMITS (token buckets per user + channel, see ratelimit.py)
+# =========================================
+USER_POSTS = TokenBuckets(*RATE_LIMIT_USER) if RATE_LIMIT_USER else None
+CHANNEL_POSTS = TokenBuckets(*RATE_LIMIT_CHANNEL) if RATE_LIMIT_CHANNEL else None
+# (channel, event, day) -> the public /event post made there within DEDUP_SECONDS
+RECENT_EVENT_POSTS = RecentPosts(DEDUP_SECONDS)
+
+
+class PostRateLimited(app_commands.CommandOnCooldown):
+    def __init__(self, scope: str, limiter: TokenBuckets, retry_after: float):
+        super().__init__(app_commands.Cooldown(limiter.burst, limiter.per), retry_after)
+        self.scope = scope  # "user" | "channel"
+        self.scope_text = "from you" if scope == "user" else "in this channel"
+
+
+def _posts_publicly(interaction: discord.Interaction) -> bool:
+    # Commands with a `public` option only post publicly when asked; the others always do
+    cmd = interaction.command
+    if cmd is not None and any(p.name == "public" for p in cmd.parameters):
+        return bool(interaction.namespace.public)
+    return True
+
+
+async def _check_public_post(interaction: discord.Interaction) -> bool:
+    if not _posts_publicly(interaction):
+        return True
+    user_key, channel_key = interaction.user.id, interaction.channel_id
+    if USER_POSTS is not None:
+        wait = USER_POSTS.take(user_key)
+        if wait:
+            raise PostRateLimited("user", USER_POSTS, wait)
+    if CHANNEL_POSTS is not None and channel_key is not None:
+        wait = CHANNEL_POSTS.take(channel_key)
+        if wait:
+            if USER_POSTS is not None:
+                USER_POSTS.refund(user_key)
+            raise PostRateLimited("channel", CHANNEL_POSTS, wait)
+    # Only a real public post costs a token: give them back if the command ends up replying privately
+    # (an error, or a link to an identical recent post)
+    interaction.extras[ON_NO_PUBLIC_POST] = functools.partial(_refund_public_post, user_key, channel_key)
+    return True
+
+
+def _refund_public_post(user_key: int, channel_key: Optional[int]) -> None:
+    if USER_POSTS is not None:
+        USER_POSTS.refund(user_key)
+    if CHANNEL_POSTS is not None and channel_key is not None:
+        CHANNEL_POSTS.refund(channel_key)
+
+
+def _forget_moved_post(interaction: discord.Interaction) -> None:
+    """A public /event post paged to another day no longer shows what the dedup link promises."""
+    url = jump_url(interaction, interaction.message)
+    if url:
+        RECENT_EVENT_POSTS.discard_url(url)
+
+
+# Put above `@deadline_guard` on every command that can post into the channel
+public_post_limit = app_commands.check(_check_public_post)
 
 
 # =========================================
@@ -479,75 +676,352 @@ def build_event_embeds(event_name: str, day_name: str) -> List[discord.Embed]:
     description="Convert a UTC time to a Discord timestamp that renders in everyone's local time.",
     guild=GUILD_OBJ,  # per-guild install if provided
 )
-@app_commands.describe(when="Time in 'HH:MM' or 'YYYY-MM-DD HH:MM' (UTC)")
+@app_commands.describe(when="UTC time: HH:MM, 3pm, YYYY-MM-DD HH:MM, ISO-8601, +2h30m or fri 18:00")
+@public_post_limit
+@deadline_guard(ephemeral=False)
 async def utc(interaction: discord.Interaction, when: str):
     """Examples:
       /utc 15:30
       /utc 2025-08-11 09:00
+      /utc +2h30m
+      /utc fri 18:00
     """
     try:
-        if " " in when:
-            dt = datetime.strptime(when, "%Y-%m-%d %H:%M").replace(tzinfo=timezone.utc)
-        else:
-            t = datetime.strptime(when, "%H:%M").time()
-            today_utc = datetime.now(timezone.utc).date()
-            dt = datetime.combine(today_utc, t).replace(tzinfo=timezone.utc)
-
-        unix_ts = int(dt.timestamp())
-        content = (
-            f"Here’s the time for everyone: <t:{unix_ts}:F>  •  Relative: <t:{unix_ts}:R>\n"
-            f"(Input interpreted as **UTC**)"
+        dt = parse_when(when)
+    except TimeParseError as e:
+        await reply(
+            interaction,
+            f"Couldn’t read that time: {e}.\n```\n{e.pointer()}\n```Use {FORMATS_HELP}.", ephemeral=True
+        )
+        return
+
+    unix_ts = int(dt.timestamp())
+    content = (
+        f"Here’s the time for everyone: <t:{unix_ts}:F>  •  Relative: <t:{unix_ts}:R>\n"
+        f"(Input interpreted as **UTC**)"
+    )
+    await reply(interaction, content)
+
+
+def scan_reply(found: Sequence[FoundTime]) -> str:
+    """The reply to a chat message the passive scanner found UTC times in (TimeBot._scan_message)."""
+    lines: List[str] = []
+    for f in found:
+        unix_ts = int(f.when.timestamp())
+        lines.append(f"**{f.text}** → <t:{unix_ts}:F>  •  <t:{unix_ts}:R>")
+    return "\n".join(lines)
+
+
+# =========================================
+# /utcbatch COMMAND — many times, one reply
+# =========================================
+@bot.tree.command(
+    name="utcbatch",
+    description="Convert a whole list of UTC times at once (comma, semicolon or newline separated).",
+    guild=GUILD_OBJ,  # per-guild install if provided
+)
+@app_commands.describe(
+    times=f"Up to {MAX_BATCH_ENTRIES} UTC times, optionally labelled: 'Reset @ 00:00, Bear @ fri 18:00'",
+)
+@public_post_limit
+@deadline_guard(ephemeral=False)
+async def utcbatch(interaction: discord.Interaction, times: str):
+    """Examples:
+      /utcbatch 15:30, 18:00, 21:00
+      /utcbatch Reset @ 00:00; Bear hunt @ fri 18:00; Finals @ 2025-08-11 09:00
+    """
+    try:
+        entries = parse_batch(times)
+    except TimeParseError as e:
+        await reply(
+            interaction,
+            f"Couldn’t read that time: {e}.\n```\n{e.pointer()}\n```Use {FORMATS_HELP}.", ephemeral=True
+        )
+        return
+
+    lines: List[str] = []
+    for entry in entries:
+        unix_ts = int(entry.when.timestamp())
+        label = f"**{entry.label}** — " if entry.label else "• "
+        lines.append(f"{label}<t:{unix_ts}:F>  •  <t:{unix_ts}:R>")
+    chunks = chunk_lines(lines, limit=1900)  # message content max is 2000
+    chunks[-1] += "\n(Input interpreted as **UTC**)"
+    for chunk in chunks:
+        # Labels are the user's own text: "@everyone @ 18:00" must not ping anyone
+        await reply(interaction, chunk, allowed_mentions=discord.AllowedMentions.none())
+
+
+# =========================================
+# /time + /timezone COMMANDS — from any time zone
+# =========================================
+ZONE_HELP = "an IANA zone (America/Los_Angeles), an abbreviation (PST, CET, KST) or an offset (UTC+2)"
+
+
+@timed_autocomplete
+async def autocomplete_zone(
+    interaction: discord.Interaction,
+    current: str
+) -> List[app_commands.Choice[str]]:
+    return [app_commands.Choice(name=z, value=z) for z in search_zones(current, 25)]
+
+
+def default_zone(user_id: int, guild_id: Optional[int]) -> Tuple[tzinfo, str]:
+    """The caller's zone, else the server's, else UTC; plus where it came from."""
+    user_zone, guild_zone = STORE.get_default_zones(user_id, guild_id)
+    for name, source in ((user_zone, "your default"), (guild_zone, "server default")):
+        tz = resolve_zone(name) if name else None
+        if tz is not None:
+            return tz, source
+    return timezone.utc, "no default set"
+
+
+@bot.tree.command(
+    name="time",
+    description="Convert a time in any time zone to a Discord timestamp that renders in everyone's local time.",
+    guild=GUILD_OBJ,  # per-guild install if provided
+)
+@app_commands.describe(
+    when="Time in that zone: HH:MM, 3pm, YYYY-MM-DD HH:MM, ISO-8601, +2h30m or fri 18:00",
+    zone="Time zone (start typing; PST, CET, KST work too). Defaults to yours, set with /timezone",
+)
+@app_commands.autocomplete(zone=autocomplete_zone)
+@public_post_limit
+@deadline_guard(ephemeral=False)
+async def time_cmd(interaction: discord.Interaction, when: str, zone: str | None = None):
+    """Examples:
+      /time 20:00 zone:CET
+      /time fri 18:00 zone:America/New_York
+      /time 9am            (your /timezone default)
+    """
+    if zone:
+        tz, source = resolve_zone(zone), "given"
+        if tz is None:
+            await reply(interaction, f"Unknown time zone **{zone}**. Use {ZONE_HELP}.", ephemeral=True)
+            return
+    else:
+        tz, source = default_zone(interaction.user.id, interaction.guild_id)
+    try:
+        dt = parse_when(when, tz=tz)
+    except TimeParseError as e:
+        await reply(
+            interaction,
+            f"Couldn’t read that time: {e}.\n```\n{e.pointer()}\n```Use {FORMATS_HELP}.",
+            ephemeral=True,
         )
-        await interaction.response.send_message(content)
+        return
+
+    unix_ts = int(dt.timestamp())
+    note = "" if source == "given" else f", {source}"
+    content = (
+        f"Here’s the time for everyone: <t:{unix_ts}:F>  •  Relative: <t:{unix_ts}:R>\n"
+        f"(Input interpreted as **{describe_zone(tz, dt)}**{note})"
+    )
+    await reply(interaction, content)
+
+
+@bot.tree.command(
+    name="timezone",
+    description="Set your default time zone for /time (or the server's, for admins).",
+    guild=GUILD_OBJ,  # per-guild install if provided
+)
+@app_commands.describe(
+    zone="Time zone (start typing; PST, CET, KST work too). Leave empty to see the current defaults",
+    server="Set the server-wide default instead of yours (needs Manage Server)",
+    clear="Remove the default instead",
+)
+@app_commands.autocomplete(zone=autocomplete_zone)
+@deadline_guard()
+async def timezone_cmd(interaction: discord.Interaction, zone: str | None = None, server: bool = False,
+                       clear: bool = False):
+    if server:
+        if interaction.guild_id is None:
+            await reply(interaction, "Run this in a server, not in DMs.", ephemeral=True)
+            return
+        if not interaction.permissions.manage_guild:
+            await reply(interaction, "Setting the server default needs **Manage Server**.", ephemeral=True)
+            return
+    scope, scope_id, whose = ("guild", interaction.guild_id, "The server’s") if server \
+        else ("user", interaction.user.id, "Your")
 
-    except ValueError:
-        await interaction.response.send_message(
-            "Invalid format. Use **HH:MM** or **YYYY-MM-DD HH:MM** (UTC).", ephemeral=True
+    if clear:
+        STORE.set_default_zone(scope, scope_id, None)
+        await reply(interaction, f"{whose} default time zone is cleared.", ephemeral=True)
+        return
+    if not zone:
+        user_zone, guild_zone = STORE.get_default_zones(interaction.user.id, interaction.guild_id)
+        await reply(
+            interaction,
+            f"Your default: **{user_zone or 'not set'}**  •  Server default: **{guild_zone or 'not set'}**\n"
+            f"/time uses yours, then the server’s, then UTC.",
+            ephemeral=True,
         )
+        return
+    tz = resolve_zone(zone)
+    if tz is None:
+        await reply(interaction, f"Unknown time zone **{zone}**. Use {ZONE_HELP}.", ephemeral=True)
+        return
+    STORE.set_default_zone(scope, scope_id, zone_name(tz))
+    await reply(
+        interaction,
+        f"{whose} default time zone is now **{describe_zone(tz, datetime.now(timezone.utc))}**.", ephemeral=True
+    )
 
 
 # =========================================
 # /event COMMAND — autocomplete + dropdown
 # =========================================
+# Prebuilt search indexes (names + task/reward text), rebuilt whenever the catalog reloads.
+EVENT_INDEX: SearchIndex = build_event_index(CATALOG)
+DAY_INDEXES: Dict[str, SearchIndex] = build_day_indexes(CATALOG)
+
+
+@on_catalog_change
+def _rebuild_search_indexes(catalog: Catalog) -> None:
+    global EVENT_INDEX, DAY_INDEXES
+    EVENT_INDEX, DAY_INDEXES = build_event_index(catalog), build_day_indexes(catalog)
+
+
 # Autocomplete handlers MUST be coroutine functions and defined before use.
+@timed_autocomplete
 async def autocomplete_event(
     interaction: discord.Interaction,
     current: str
 ) -> List[app_commands.Choice[str]]:
-    names = get_event_names()
-    if current:
-        cl = current.lower()
-        names = [n for n in names if cl in n.lower()]
-    return [app_commands.Choice(name=n, value=n) for n in names[:25]]
+    return [app_commands.Choice(name=n, value=n) for n in EVENT_INDEX.search(current, 25)]
 
 
+@timed_autocomplete
 async def autocomplete_day(
     interaction: discord.Interaction,
     current: str
 ) -> List[app_commands.Choice[str]]:
     ns = interaction.namespace
     ev_name = getattr(ns, "event", None)
-    if not ev_name or ev_name not in EVENTS:
+    index = DAY_INDEXES.get(ev_name) if ev_name else None
+    if index is None:
         return []
-    day_names = get_day_names(ev_name)
-    if current:
-        cl = current.lower()
-        day_names = [n for n in day_names if cl in n.lower()]
-    return [app_commands.Choice(name=n, value=n) for n in day_names[:25]]
+    return [app_commands.Choice(name=n, value=n) for n in index.search(current, 25)]
+
+
+# Stateless day picker: the custom_id carries the event id and the owner's user id, so one
+# registered DynamicItem serves every picker ever posted, including ones from before a restart.
+# /event answers with one message that pages through the event in place: Prev/Next walk the days (and
+# the parts of a day too big for one message), Rankings jumps to the ranking rewards, and the day
+# selector jumps to any day. Every button carries its target page in its custom_id, so clicks keep
+# working across restarts and nothing is stored per message. Each page comes straight from the
+# render cache, and building a page's buttons looks up (i.e. prefetches) both neighbouring pages,
+# so the next click is just an edit_message.
+RANKINGS_PAGE = -1  # "day" index of an event's rankings page
+_NAV_LABELS = {"p": "◀ Prev", "n": "Next ▶", "r": "Rankings"}
+
+
+def _ranking_payloads(ev: Event) -> List[List[Dict[str, Any]]]:
+    payloads = _RANKINGS_CACHE.get(ev.name)
+    if payloads is None:
+        sections = [
+            (f"{kind.capitalize()} ranking",
+             [f"• **{b.range}:** {', '.join(f'{r.qty}x {r.item}' for r in b.rewards) or '—'}" for b in brackets])
+            for kind, brackets in ev.rankings
+        ]
+        payloads = layout([EmbedBlock(title=f"{ev.name} • Rankings", color=0x2B6CB0, sections=sections)])
+        _RANKINGS_CACHE[ev.name] = payloads
+    return payloads
+
+
+def _page_payloads(ev: Event, day: int) -> List[List[Dict[str, Any]]]:
+    return _ranking_payloads(ev) if day == RANKINGS_PAGE else event_day_payloads(ev.name, ev.day_names[day])
+
 
+def _has_page(ev: Event, day: int) -> bool:
+    return bool(ev.rankings) if day == RANKINGS_PAGE else 0 <= day < len(ev.days)
 
-# Canonical Select subclass for reliable callbacks across discord.py versions
-class DaySelect(discord.ui.Select):
-    def __init__(self, event_name: str):
-        self.event_name = event_name
-        options = [discord.SelectOption(label=name) for name in get_day_names(event_name)]
-        super().__init__(placeholder="Select a day/stage…", min_values=1, max_values=1, options=options)
+
+def _neighbour(ev: Event, day: int, part: int, step: int) -> Optional[Tuple[int, int]]:
+    """The (day, part) before (step=-1) or after (step=1) a page; the rankings page comes last."""
+    if 0 <= part + step < len(_page_payloads(ev, day)):
+        return day, part + step
+    order = list(range(len(ev.days))) + ([RANKINGS_PAGE] if ev.rankings else [])
+    i = order.index(day) + step
+    if not 0 <= i < len(order):
+        return None
+    parts = len(_page_payloads(ev, order[i]))  # the prefetch
+    return order[i], 0 if step > 0 else parts - 1
+
+
+# Said privately, leaving the message alone: the catalog may still be loading, or come back on reload
+GONE_FROM_CATALOG = "That event/day isn't in the catalog right now. Run `/event` again."
+
+
+class EventPageButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"evpg:(?P<event_id>.+):(?P<day>r|[0-9]+)\.(?P<part>[0-9]+):(?P<owner>[0-9]+):(?P<tag>[pnr])",
+):
+    def __init__(self, event_id: str, day: int, part: int, owner_id: int, tag: str):
+        self.event_id = event_id
+        self.day = day
+        self.part = part
+        self.owner_id = owner_id
+        page = f"{'r' if day == RANKINGS_PAGE else day}.{part}"
+        super().__init__(discord.ui.Button(
+            label=_NAV_LABELS[tag], style=discord.ButtonStyle.secondary,
+            custom_id=f"evpg:{event_id}:{page}:{owner_id}:{tag}",  # <= 97 chars with MAX_EVENT_ID
+        ))
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match[str]):
+        day = RANKINGS_PAGE if match["day"] == "r" else int(match["day"])
+        return cls(match["event_id"], day, int(match["part"]), int(match["owner"]), match["tag"])
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("These buttons aren’t for you — run `/event` yourself.",
+                                                    ephemeral=True)
+            return False
+        await wait_for_catalog()  # components skip the tree's check; a click can land mid-preload
+        return True
+
+    async def callback(self, interaction: discord.Interaction):
+        ev = CATALOG.get_event_by_id(self.event_id)
+        if ev is None or not _has_page(ev, self.day):
+            await interaction.response.send_message(GONE_FROM_CATALOG, ephemeral=True)
+            return
+        part = min(self.part, len(_page_payloads(ev, self.day)) - 1)  # the day may have shrunk since
+        _forget_moved_post(interaction)
+        await interaction.response.edit_message(**event_page(ev, self.day, part, self.owner_id, interaction.guild_id))
+
+
+class DaySelect(discord.ui.DynamicItem[discord.ui.Select], template=r"daypick:(?P<event_id>.+):(?P<owner>[0-9]+)"):
+    def __init__(self, event_id: str, owner_id: int, day_names: Sequence[str] = (), current: Optional[str] = None):
+        self.event_id = event_id
+        self.owner_id = owner_id
+        options = [discord.SelectOption(label=name, default=name == current) for name in day_names[:25]]  # select max
+        super().__init__(discord.ui.Select(
+            placeholder="Select a day/stage…", min_values=1, max_values=1, options=options,
+            custom_id=f"daypick:{event_id}:{owner_id}",
+        ))
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Select, match: re.Match[str]):
+        # Options come from the message itself; only the ids are needed to handle the pick
+        return cls(match["event_id"], int(match["owner"]))
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("This selector isn’t for you.", ephemeral=True)
+            return False
+        await wait_for_catalog()
+        return True
 
     async def callback(self, interaction: discord.Interaction):
         try:
-            day_name = self.values[0]
-            embeds = build_event_embeds(self.event_name, day_name)
-            await interaction.response.edit_message(content=None, embeds=embeds, view=None)
+            ev = CATALOG.get_event_by_id(self.event_id)
+            day_name = self.item.values[0]
+            if ev is None or day_name not in ev.day_names:
+                await interaction.response.send_message(GONE_FROM_CATALOG, ephemeral=True)
+                return
+            page = event_page(ev, ev.day_names.index(day_name), 0, self.owner_id, interaction.guild_id)
+            _forget_moved_post(interaction)
+            await interaction.response.edit_message(**page)
         except Exception as e:
             await interaction.response.send_message(
                 f"Oops, I couldn’t render that day. `{type(e).__name__}: {e}`",
@@ -556,18 +1030,50 @@ class DaySelect(discord.ui.Select):
             raise
 
 
-class DayPickerView(discord.ui.View):
-    def __init__(self, event_name: str, user_id: int):
-        super().__init__(timeout=120)
-        self.event_name = event_name
-        self.user_id = user_id
-        self.add_item(DaySelect(event_name))
+def event_page(ev: Event, day: int, part: int, owner_id: int, guild_id: Optional[int]) -> Dict[str, Any]:
+    """Message kwargs (content, embeds, view) for one page of the /event paginator."""
+    if day == RANKINGS_PAGE:
+        payloads = _ranking_payloads(ev)
+        embeds = [discord.Embed.from_dict(_copy_payload(p)) for p in payloads[part]]
+        day_name, where = None, "Rankings"
+    else:
+        day_name = ev.day_names[day]
+        messages = build_event_messages(ev.name, day_name, guild_id)
+        embeds, payloads = messages[part], messages
+        where = f"{day_name} ({day + 1}/{len(ev.days)})"
+    if len(payloads) > 1:
+        where += f" • part {part + 1}/{len(payloads)}"
 
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This selector isn’t for you.", ephemeral=True)
-            return False
-        return True
+    page: Dict[str, Any] = {"content": f"**{ev.name}** — {where}", "embeds": embeds}
+    targets = (("p", _neighbour(ev, day, part, -1)), ("n", _neighbour(ev, day, part, 1)))
+    if not ev.rankings and all(target is None for _, target in targets):
+        return page  # a single page: nothing to navigate
+    view = discord.ui.View(timeout=None)
+    for tag, target in targets:
+        if target is None:  # disabled buttons are never clicked; they only need an id unique in the message
+            view.add_item(discord.ui.Button(label=_NAV_LABELS[tag], disabled=True, custom_id=f"evpg-off:{tag}"))
+        else:
+            view.add_item(EventPageButton(ev.id, *target, owner_id, tag))
+    if ev.rankings:
+        if day == RANKINGS_PAGE:
+            view.add_item(discord.ui.Button(label=_NAV_LABELS["r"], disabled=True, custom_id="evpg-off:r"))
+        else:
+            view.add_item(EventPageButton(ev.id, RANKINGS_PAGE, 0, owner_id, "r"))
+    if len(ev.days) > 1:
+        view.add_item(DaySelect(ev.id, owner_id, ev.day_names, current=day_name))
+    page["view"] = view
+    return page
+
+
+def day_picker(event_name: str, owner_id: int) -> discord.ui.View:
+    """A throwaway view to send the picker with; nothing is kept once it's posted."""
+    ev = CATALOG.get_event(event_name)
+    view = discord.ui.View(timeout=None)
+    view.add_item(DaySelect(ev.id, owner_id, ev.day_names))
+    return view
+
+
+bot.add_dynamic_items(DaySelect, EventPageButton)
 
 
 @bot.tree.command(
@@ -581,64 +1087,596 @@ class DayPickerView(discord.ui.View):
     public="Post publicly? Defaults to private (ephemeral).",
 )
 @app_commands.autocomplete(event=autocomplete_event, day=autocomplete_day)
+@public_post_limit
+@deadline_guard(ephemeral=lambda public=False, **_: not public)
 async def event(
     interaction: discord.Interaction,
     event: str,
     day: str | None = None,
     public: bool = False,
 ):
-    try:
-        # Guard: no data loaded
-        if not EVENTS:
-            await interaction.response.send_message(
-                "No events are loaded yet. Paste your `EVENTS` dictionary into the bot code and redeploy.",
-                ephemeral=True,
-            )
-            return
+    # Guard: no data loaded
+    if not CATALOG.events:
+        await reply(
+            interaction,
+            "No events are loaded yet. Add them to `events.yaml` and redeploy.",
+            ephemeral=True,
+        )
+        return
 
-        if event not in EVENTS:
-            suggestions = ", ".join(get_event_names()) or "(no events loaded)"
-            await interaction.response.send_message(
-                f"Unknown event **{event}**. Try one of: {suggestions}",
-                ephemeral=True,
-            )
-            return
+    if event not in CATALOG:
+        suggestions = ", ".join(get_event_names()) or "(no events loaded)"
+        await reply(
+            interaction,
+            f"Unknown event **{event}**. Try one of: {suggestions}",
+            ephemeral=True,
+        )
+        return
 
-        day_names = get_day_names(event)
-        if not day_names:
-            await interaction.response.send_message("No days found for that event.", ephemeral=True)
-            return
+    day_names = get_day_names(event)
+    if not day_names:
+        await reply(interaction, "No days found for that event.", ephemeral=True)
+        return
 
-        # If day not provided and multiple exist, show picker
-        if day is None and len(day_names) > 1:
-            view = DayPickerView(event_name=event, user_id=interaction.user.id)
-            await interaction.response.send_message(
-                f"**{event}** has multiple days. Pick one:",
-                view=view,
-                ephemeral=not public,
-            )
-            return
+    # If day not provided and multiple exist, show picker
+    if day is None and len(day_names) > 1:
+        view = day_picker(event, interaction.user.id)
+        await reply(
+            interaction,
+            f"**{event}** has multiple days. Pick one:",
+            view=view,
+            ephemeral=not public,
+        )
+        return
 
-        # Default to only day if single
-        if day is None:
-            day = day_names[0]
-        elif day not in day_names:
-            await interaction.response.send_message(
-                f"**{event}** doesn’t have a day/stage named **{day}**.\n"
-                f"Available: {', '.join(day_names)}",
-                ephemeral=True,
-            )
+    # Default to only day if single
+    if day is None:
+        day = day_names[0]
+    elif day not in day_names:
+        await reply(
+            interaction,
+            f"**{event}** doesn’t have a day/stage named **{day}**.\n"
+            f"Available: {', '.join(day_names)}",
+            ephemeral=True,
+        )
+        return
+
+    post_key = (interaction.channel_id, event, day)
+    if public and DEDUP_SECONDS > 0:
+        recent = RECENT_EVENT_POSTS.get(post_key)
+        if recent is not None:
+            age, url = recent
+            DEDUPED.inc("event")
+            await reply(interaction, f"**{event} — {day}** was posted here {age:.0f}s ago: {url}", ephemeral=True)
             return
 
-        embeds = build_event_embeds(event, day)
-        await interaction.response.send_message(embeds=embeds, ephemeral=not public)
+    ev = CATALOG.get_event(event)
+    page = event_page(ev, ev.day_names.index(day), 0, interaction.user.id, interaction.guild_id)
+    message = await reply(interaction, ephemeral=not public, **page)
+    url = jump_url(interaction, message) if public and DEDUP_SECONDS > 0 else None
+    if url:
+        RECENT_EVENT_POSTS.add(post_key, url)
+
+
+# =========================================
+# /now + /anchor COMMANDS — live event schedule
+# =========================================
+@on_catalog_change
+def _rebuild_schedules(catalog: Catalog) -> None:
+    SCHEDULE.set_catalog(catalog)
+
+
+@bot.tree.command(
+    name="now",
+    description="Show which events are running right now, which day is live, and what's next.",
+    guild=GUILD_OBJ,  # per-guild install if provided
+)
+@app_commands.describe(public="Post publicly? Defaults to private (ephemeral).")
+@public_post_limit
+@deadline_guard(ephemeral=lambda public=False, **_: not public)
+async def now_cmd(interaction: discord.Interaction, public: bool = False):
+    if interaction.guild_id is None:
+        await reply(interaction, "Run this in a server, not in DMs.", ephemeral=True)
+        return
+    sched = SCHEDULE.for_guild(interaction.guild_id)
+    lines: List[str] = []
+    for st in sched.running():
+        lines.append(
+            f"• **{st.event.name}** — {st.day_name} "
+            f"(day ends <t:{int(st.day_end.timestamp())}:R>, event ends <t:{int(st.end.timestamp())}:R>)"
+        )
+    upcoming = [
+        f"• **{st.event.name}** — starts <t:{int(st.start.timestamp())}:F> (<t:{int(st.start.timestamp())}:R>)"
+        for st in sched.upcoming()
+    ]
+    if not lines and not upcoming:
+        await reply(
+            interaction,
+            "No event schedule is set for this server yet. An admin can set one with `/anchor`.",
+            ephemeral=True,
+        )
+        return
+
+    block = EmbedBlock(title="Event schedule", color=0x2B6CB0, sections=[
+        ("Running now", lines or ["• *(Nothing running right now)*"]), ("Up next", upcoming),
+    ])
+    for payloads in layout([block]):  # a server running lots of events spills into follow-ups
+        await reply(interaction, embeds=[discord.Embed.from_dict(p) for p in payloads], ephemeral=not public)
+
+
+@bot.tree.command(
+    name="anchor",
+    description="Set when an event (last) started in this server so /now and /event can track it.",
+    guild=GUILD_OBJ,  # per-guild install if provided
+)
+@app_commands.describe(
+    event="Event name (start typing for suggestions)",
+    start="UTC start of any occurrence, e.g. 2025-08-11 00:00 or mon 00:00",
+    clear="Remove this event's schedule instead",
+)
+@app_commands.autocomplete(event=autocomplete_event)
+@app_commands.default_permissions(manage_guild=True)
+@deadline_guard()
+async def anchor_cmd(interaction: discord.Interaction, event: str, start: str | None = None, clear: bool = False):
+    if interaction.guild_id is None:
+        await reply(interaction, "Run this in a server, not in DMs.", ephemeral=True)
+        return
+    ev = CATALOG.get_event(event)
+    if ev is None:
+        await reply(interaction, f"Unknown event **{event}**.", ephemeral=True)
+        return
+    if clear:
+        STORE.set_anchor(interaction.guild_id, ev.id, None)
+        SCHEDULE.invalidate(interaction.guild_id)
+        await reply(interaction, f"Cleared the schedule for **{ev.name}**.", ephemeral=True)
+        return
+    if not start:
+        await reply(interaction, "Give a `start` time (UTC) or set `clear`.", ephemeral=True)
+        return
+    try:
+        dt = parse_when(start)
+    except TimeParseError as e:
+        await reply(
+            interaction,
+            f"Couldn’t read that time: {e}.\n```\n{e.pointer()}\n```Use {FORMATS_HELP}.", ephemeral=True
+        )
+        return
+
+    STORE.set_anchor(interaction.guild_id, ev.id, dt)
+    SCHEDULE.invalidate(interaction.guild_id)
+    st = SCHEDULE.for_guild(interaction.guild_id).status(ev.name)
+    where = (f"live now on **{st.day_name}**" if st and st.running
+             else f"next starts <t:{int(st.start.timestamp())}:F>" if st else "not scheduled")
+    await reply(
+        interaction,
+        f"Anchored **{ev.name}** to <t:{int(dt.timestamp())}:F> — {where}.", ephemeral=True
+    )
+
+
+# =========================================
+# /rewards + /rank COMMANDS — reward lookup
+# =========================================
+# Inverted index: item -> every task/rank bracket/shop offer that gives it (see rewards.py)
+REWARD_INDEX: RewardIndex = build_reward_index(CATALOG)
+MAX_EMBED_FIELDS = 25
+MAX_EMBED_CHARS = 5500  # Discord's total is 6000; leave room for title and footer
+
+
+@on_catalog_change
+def _rebuild_reward_index(catalog: Catalog) -> None:
+    global REWARD_INDEX
+    REWARD_INDEX = build_reward_index(catalog)
+
+
+@timed_autocomplete
+async def autocomplete_item(
+    interaction: discord.Interaction,
+    current: str
+) -> List[app_commands.Choice[str]]:
+    return [app_commands.Choice(name=n, value=n) for n in REWARD_INDEX.item_search.search(current, 25)]
+
+
+@timed_autocomplete
+async def autocomplete_ranked_event(
+    interaction: discord.Interaction,
+    current: str
+) -> List[app_commands.Choice[str]]:
+    return [app_commands.Choice(name=n, value=n) for n in REWARD_INDEX.ranked_event_search.search(current, 25)]
+
+
+@timed_autocomplete
+async def autocomplete_rank_kind(
+    interaction: discord.Interaction,
+    current: str
+) -> List[app_commands.Choice[str]]:
+    kinds = REWARD_INDEX.rank_kinds(getattr(interaction.namespace, "event", None) or "")
+    cur = current.casefold()
+    return [app_commands.Choice(name=k, value=k) for k in kinds if k.casefold().startswith(cur)][:25]
+
+
+def _source_line(src: RewardSource) -> str:
+    if src.kind == "task":
+        return f"• **{src.where}** — {src.detail}: **{src.qty}x**"
+    if src.kind == "rank":
+        return f"• **{src.where.capitalize()} rank {src.detail}:** {src.qty}x"
+    return f"• **Exchange Shop:** {src.qty}x for {src.detail}"
+
+
+def build_reward_embed(item: str) -> discord.Embed:
+    sources = REWARD_INDEX.sources(item)
+    embed = discord.Embed(title=f"Where to get {item}", color=0x2B6CB0)
+    used = len(embed.title)
+    shown = events = 0
+    full = False
+    # Sources are stored grouped by event, so stop formatting as soon as the embed is full
+    for event_name, group in groupby(sources, key=attrgetter("event")):
+        events += 1
+        for i, chunk in enumerate(chunk_lines([_source_line(src) for src in group])):
+            name = event_name if i == 0 else f"{event_name} (cont.)"
+            full = len(embed.fields) >= MAX_EMBED_FIELDS - 1 or used + len(name) + len(chunk) > MAX_EMBED_CHARS
+            if full:
+                break
+            embed.add_field(name=name, value=chunk, inline=False)
+            used += len(name) + len(chunk)
+            shown += chunk.count("\n• ") + 1
+        if full:
+            break
+    if shown < len(sources):
+        embed.set_footer(text=f"…and {len(sources) - shown} more source(s) not shown")
+    else:
+        embed.set_footer(text=f"{len(sources)} source(s) across {events} event(s)")
+    return embed
+
+
+@bot.tree.command(
+    name="rewards",
+    description="Find every event task, rank bracket and shop offer that gives an item.",
+    guild=GUILD_OBJ,  # per-guild install if provided
+)
+@app_commands.describe(
+    item="Reward item (start typing for suggestions)",
+    public="Post publicly? Defaults to private (ephemeral).",
+)
+@app_commands.autocomplete(item=autocomplete_item)
+@public_post_limit
+@deadline_guard(ephemeral=lambda public=False, **_: not public)
+async def rewards_cmd(interaction: discord.Interaction, item: str, public: bool = False):
+    if item not in REWARD_INDEX:
+        close = REWARD_INDEX.item_search.search(item, 5)
+        hint = f" Did you mean: {', '.join(f'**{c}**' for c in close)}?" if close else ""
+        await reply(interaction, f"No event rewards **{item}**.{hint}", ephemeral=True)
+        return
+    await reply(interaction, embed=build_reward_embed(item), ephemeral=not public)
+
+
+@bot.tree.command(
+    name="rank",
+    description="Show the rewards for finishing an event ranking at a given rank.",
+    guild=GUILD_OBJ,  # per-guild install if provided
+)
+@app_commands.describe(
+    event="Event with rankings (start typing for suggestions)",
+    rank="Your rank, e.g. 4",
+    kind="Which ranking (daily, overall, ...); defaults to the first one listed",
+    public="Post publicly? Defaults to private (ephemeral).",
+)
+@app_commands.autocomplete(event=autocomplete_ranked_event, kind=autocomplete_rank_kind)
+@public_post_limit
+@deadline_guard(ephemeral=lambda public=False, **_: not public)
+async def rank_cmd(
+    interaction: discord.Interaction,
+    event: str,
+    rank: app_commands.Range[int, 1, 1_000_000],
+    kind: str | None = None,
+    public: bool = False,
+):
+    kinds = REWARD_INDEX.rank_kinds(event)
+    if not kinds:
+        ranked = ", ".join(REWARD_INDEX.ranked_events) or "(none)"
+        await reply(interaction, f"**{event}** has no ranking rewards. Events with rankings: {ranked}",
+                    ephemeral=True)
+        return
+    table = REWARD_INDEX.rank_table(event, kind)
+    if table is None:
+        await reply(interaction, f"**{event}** has no **{kind}** ranking. Try: {', '.join(kinds)}", ephemeral=True)
+        return
+    bracket = table.lookup(rank)
+    if bracket is None:
+        last = table.brackets[-1]
+        top = f"{last.hi}" if last.hi is not None else f"{last.lo}+"
+        await reply(interaction, f"Rank **{rank}** gets no **{table.kind}** reward in **{event}** "
+                                 f"(rewards go to ranks {table.brackets[0].lo}–{top}).", ephemeral=True)
+        return
+    embed = discord.Embed(title=f"{event} • {table.kind.capitalize()} rank {rank}", color=0x2B6CB0)
+    lines = [f"• {r.qty}x {r.item}" for r in bracket.rewards] or ["• *(No rewards listed)*"]
+    for i, chunk in enumerate(chunk_lines(lines)):
+        embed.add_field(name=f"Ranks {bracket.range}" if i == 0 else "(cont.)", value=chunk, inline=False)
+    others = [k for k in kinds if k != table.kind]
+    if others:
+        embed.set_footer(text=f"Other rankings: {', '.join(others)} (use the kind option)")
+    await reply(interaction, embed=embed, ephemeral=not public)
+
+
+# =========================================
+# /score COMMAND — points planner
+# =========================================
+# Per-event scoring tables, precompiled for the planner (see scoring.py)
+SCORE_TABLES: Dict[str, ScoreTable] = build_score_tables(CATALOG)
+
+
+@on_catalog_change
+def _rebuild_score_tables(catalog: Catalog) -> None:
+    global SCORE_TABLES
+    SCORE_TABLES = build_score_tables(catalog)
+
+
+@timed_autocomplete
+async def autocomplete_scored_event(
+    interaction: discord.Interaction,
+    current: str
+) -> List[app_commands.Choice[str]]:
+    return [app_commands.Choice(name=n, value=n) for n in EVENT_INDEX.search(current, 25) if n in SCORE_TABLES]
+
+
+def build_score_embed(table: ScoreTable, plan: str, day: Optional[str], target: Optional[int]) -> discord.Embed:
+    entries = table.parse_plan(plan)
+    qty = table.quantities(entries)
+    totals = table.day_totals(qty)
+    embed = discord.Embed(title=f"{table.event.name} • {day or 'All days'} — points plan", color=0x2B6CB0)
+    plan_lines = [f"• {q:,} × {table.actions[a]}" for a, q in enumerate(qty) if q]
+    for i, chunk in enumerate(chunk_lines(plan_lines)):
+        embed.add_field(name="Plan" if i == 0 else "Plan (cont.)", value=chunk, inline=False)
+
+    day_idx = table.days.index(day) if day is not None else None
+    if day_idx is not None:
+        total = totals[day_idx]
+        lines = [f"• **+{pts:,}** — {q:,} × {action}" for action, q, pts in table.breakdown(qty, day_idx)]
+        lines.append(f"**Total: {total:,}**")
+        heading = f"Points on {day}"
+    else:
+        total = sum(totals)
+        lines = [f"• **{name}:** {pts:,}" for name, pts in zip(table.days, totals)]
+        lines.append(f"**If repeated every day: {total:,}** (best day: {table.days[totals.index(max(totals))]})")
+        heading = "Points per day"
+    for i, chunk in enumerate(chunk_lines(lines)):
+        embed.add_field(name=heading if i == 0 else f"{heading} (cont.)", value=chunk, inline=False)
+
+    if target is not None:
+        missing = target - total
+        if missing <= 0:
+            value = f"✅ Reached, with {-missing:,} to spare."
+        else:
+            options = table.shortfall(missing, day_idx)[:6]
+            value = "\n".join(
+                [f"Still **{missing:,}** short. Any one of:"]
+                + [f"• {s.qty:,} more — {s.action}{f' (on {s.day})' if day_idx is None else ''}" for s in options]
+            ) if options else f"Still **{missing:,}** short, and nothing scores on this day."
+        embed.add_field(name=f"To reach {target:,}", value=chunk_lines([value])[0], inline=False)
+    return embed
+
+
+@bot.tree.command(
+    name="score",
+    description="Work out the event points for a plan, or what's still missing to reach a target.",
+    guild=GUILD_OBJ,  # per-guild install if provided
+)
+@app_commands.describe(
+    event="Event name (start typing for suggestions)",
+    plan="Quantities, e.g. 'food 500k, lucky ticket 2, 10 golden scroll'",
+    day="Day/Stage (optional — compares every day if omitted)",
+    target="Points goal: shows how much more of each action would reach it",
+    public="Post publicly? Defaults to private (ephemeral).",
+)
+@app_commands.autocomplete(event=autocomplete_scored_event, day=autocomplete_day)
+@public_post_limit
+@deadline_guard(ephemeral=lambda public=False, **_: not public)
+async def score_cmd(
+    interaction: discord.Interaction,
+    event: str,
+    plan: str,
+    day: str | None = None,
+    target: app_commands.Range[int, 1] | None = None,
+    public: bool = False,
+):
+    table = SCORE_TABLES.get(event)
+    if table is None:
+        scored = ", ".join(SCORE_TABLES) or "(none)"
+        await reply(interaction, f"**{event}** has no point scoring. Events with scoring: {scored}", ephemeral=True)
+        return
+    if day is not None and day not in table.days:
+        await reply(interaction, f"**{event}** doesn’t have a day/stage named **{day}**.\n"
+                                 f"Available: {', '.join(table.days)}", ephemeral=True)
+        return
+    try:
+        embed = build_score_embed(table, plan, day, target)
+    except PlanError as e:
+        await reply(interaction, f"Couldn’t read that plan: {e}.", ephemeral=True)
+        return
+    await reply(interaction, embed=embed, ephemeral=not public)
+
+
+# =========================================
+# /remind COMMANDS — persistent reminders
+# =========================================
+MAX_REMINDERS_PER_USER = 25
+
+
+def _reminder_line(r: Reminder) -> str:
+    who = f"<@{r.user_id}> " if r.ping else ""
+    if r.event_id:
+        ev = CATALOG.get_event_by_id(r.event_id)
+        name = ev.name if ev else r.event_id
+        st = SCHEDULE.for_guild(r.guild_id).status(name) if ev and r.guild_id else None
+        day = r.day_name or (st.day_name if st and st.running else None)
+        return f"• {who}**{name}**{f' — **{day}**' if day else ''} starts now"
+    return f"• {who}{r.label or 'Reminder'} — <t:{r.fire_ts}:F>"
+
+
+async def _deliver_reminders(channel_id: int, batch: List[Reminder]) -> bool:
+    """Post one message (chunked if huge) for all reminders due in a channel."""
+    channel = bot.get_channel(channel_id)
+    try:
+        if channel is None:
+            channel = await bot.fetch_channel(channel_id)
+        lines = [_reminder_line(r) for r in batch]
+        # Only the owners who asked to be pinged; a mention typed into a label must not ping anyone
+        pingers = {r.user_id for r in batch if r.ping}
+        for chunk in chunk_lines(lines, limit=1900):
+            users = [discord.Object(uid) for uid in pingers if f"<@{uid}>" in chunk][:100]  # Discord's cap
+            await channel.send(f"⏰ **Reminder**\n{chunk}",
+                               allowed_mentions=discord.AllowedMentions(users=users, roles=False, everyone=False))
+    except (discord.NotFound, discord.Forbidden):
+        return False
+    return True
+
+
+def _next_reminder_fire(r: Reminder, now_ts: int) -> Optional[int]:
+    """Event subscriptions repeat at the next matching day start; plain reminders fire once."""
+    if not r.event_id or not r.guild_id:
+        return None
+    ev = CATALOG.get_event_by_id(r.event_id)
+    if ev is None:
+        return None
+    nxt = SCHEDULE.for_guild(r.guild_id).next_day_start(
+        ev.name, r.day_name, datetime.fromtimestamp(now_ts, timezone.utc)
+    )
+    return int(nxt[0].timestamp()) if nxt else None
+
+
+REMINDERS = ReminderDispatcher(STORE, _deliver_reminders, _next_reminder_fire, SHARDS.owns_guild)
+
+remind_group = app_commands.Group(name="remind", description="Get pinged at a UTC time or when an event day starts.")
+
+
+async def _check_reminder_quota(interaction: discord.Interaction) -> bool:
+    if STORE.count_user_reminders(interaction.user.id) >= MAX_REMINDERS_PER_USER:
+        await reply(
+            interaction,
+            f"You already have {MAX_REMINDERS_PER_USER} reminders. Cancel some with `/remind cancel`.",
+            ephemeral=True,
+        )
+        return False
+    return True
+
+
+@remind_group.command(name="at", description="Remind this channel at a UTC time.")
+@app_commands.describe(
+    when="UTC time: HH:MM, 3pm, YYYY-MM-DD HH:MM, ISO-8601, +2h30m or fri 18:00",
+    label="What to remind about",
+    ping="Mention you when it fires? Defaults to yes.",
+)
+@deadline_guard()
+async def remind_at(interaction: discord.Interaction, when: str, label: str = "", ping: bool = True):
+    try:
+        dt = parse_when(when)
+    except TimeParseError as e:
+        await reply(
+            interaction,
+            f"Couldn’t read that time: {e}.\n```\n{e.pointer()}\n```Use {FORMATS_HELP}.", ephemeral=True
+        )
+        return
+    if dt <= datetime.now(timezone.utc):
+        await reply(interaction, "That time is already in the past (UTC).", ephemeral=True)
+        return
+    if not await _check_reminder_quota(interaction):
+        return
+    fire_ts = int(dt.timestamp())
+    rid = STORE.add_reminder(fire_ts, interaction.channel_id, interaction.guild_id, interaction.user.id,
+                             ping=ping, label=label[:200])
+    REMINDERS.add(fire_ts, rid)
+    await reply(
+        interaction,
+        f"Reminder **#{rid}** set for <t:{fire_ts}:F> (<t:{fire_ts}:R>).", ephemeral=True
+    )
+
 
-    except Exception as e:
-        await interaction.response.send_message(
-            f"Something went wrong running /event. `{type(e).__name__}: {e}`",
+@remind_group.command(name="event", description="Remind this channel whenever an event day starts.")
+@app_commands.describe(
+    event="Event name (start typing for suggestions)",
+    day="Only this day/stage (optional — every day if omitted)",
+    ping="Mention you when it fires? Defaults to yes.",
+)
+@app_commands.autocomplete(event=autocomplete_event, day=autocomplete_day)
+@deadline_guard()
+async def remind_event(interaction: discord.Interaction, event: str, day: str | None = None, ping: bool = True):
+    if interaction.guild_id is None:
+        await reply(interaction, "Run this in a server, not in DMs.", ephemeral=True)
+        return
+    ev = CATALOG.get_event(event)
+    if ev is None:
+        await reply(interaction, f"Unknown event **{event}**.", ephemeral=True)
+        return
+    if day is not None and day not in ev.day_names:
+        await reply(
+            interaction,
+            f"**{event}** doesn’t have a day/stage named **{day}**.\nAvailable: {', '.join(ev.day_names)}",
             ephemeral=True,
         )
-        raise
+        return
+    nxt = SCHEDULE.for_guild(interaction.guild_id).next_day_start(ev.name, day)
+    if nxt is None:
+        await reply(
+            interaction,
+            f"**{ev.name}** has no upcoming schedule here. An admin can set one with `/anchor`.", ephemeral=True
+        )
+        return
+    if not await _check_reminder_quota(interaction):
+        return
+    fire_ts = int(nxt[0].timestamp())
+    rid = STORE.add_reminder(fire_ts, interaction.channel_id, interaction.guild_id, interaction.user.id,
+                             ping=ping, event_id=ev.id, day_name=day)
+    REMINDERS.add(fire_ts, rid)
+    await reply(
+        interaction,
+        f"Reminder **#{rid}**: **{ev.name}** {f'**{day}**' if day else 'day changes'} — "
+        f"next at <t:{fire_ts}:F> (<t:{fire_ts}:R>).",
+        ephemeral=True,
+    )
+
+
+@remind_group.command(name="list", description="List your reminders.")
+@deadline_guard()
+async def remind_list(interaction: discord.Interaction):
+    rows = STORE.user_reminders(interaction.user.id)
+    if not rows:
+        await reply(interaction, "You have no reminders.", ephemeral=True)
+        return
+    lines = [f"**#{r.id}** <t:{r.fire_ts}:R> in <#{r.channel_id}> — {_reminder_line(r)[2:]}" for r in rows]
+    await reply(interaction, chunk_lines(lines, limit=1900)[0], ephemeral=True)
+
+
+@remind_group.command(name="cancel", description="Cancel one of your reminders.")
+@app_commands.describe(reminder_id="The #number shown by /remind list")
+@deadline_guard()
+async def remind_cancel(interaction: discord.Interaction, reminder_id: int):
+    removed = STORE.delete_reminders([reminder_id], user_id=interaction.user.id)
+    await reply(
+        interaction,
+        f"Cancelled reminder **#{reminder_id}**." if removed else f"You have no reminder **#{reminder_id}**.",
+        ephemeral=True,
+    )
+
+
+bot.tree.add_command(remind_group, guild=GUILD_OBJ)
+
+
+# =========================================
+# /shards COMMAND — per-shard health
+# =========================================
+@bot.tree.command(
+    name="shards",
+    description="Show gateway latency and interaction rate per shard.",
+    guild=GUILD_OBJ,  # per-guild install if provided
+)
+@app_commands.default_permissions(manage_guild=True)
+@deadline_guard()
+async def shards_cmd(interaction: discord.Interaction):
+    here = bot.shard_of(interaction.guild_id)
+    lines = [f"{'▶' if line.startswith(f'shard {here}:') else '•'} {line}" for line in bot.shard_report()]
+    await reply(
+        interaction,
+        f"**{SHARDS.describe()}**\n" + chunk_lines(lines, limit=1800)[0], ephemeral=True
+    )
 
 
 # =========================================
@@ -649,31 +1687,56 @@ async def event(
     description="Force-sync slash commands to this server.",
     guild=GUILD_OBJ,  # per-guild install if provided
 )
+@deadline_guard(slow=True)
 async def sync_cmd(interaction: discord.Interaction):
-    # Works even if you didn't set GUILD_ID
+    # Works even if you didn't set GUILD_ID. Explicit /sync always hits Discord (force=True).
+    # Deferred up front (slow=True): tree.sync regularly takes longer than the 3 s response window.
+    if interaction.guild is None:
+        await reply(interaction, "Run this in a server, not in DMs.")
+        return
+    bot.tree.copy_global_to(guild=interaction.guild)
+    cmds = await bot.syncer.sync(interaction.guild, force=True)
+    await reply(interaction, f"Synced **{cmds}** command(s) to **{interaction.guild.name}**.")
+
+
+# =========================================
+# /reload COMMAND — hot-reload the event catalog
+# =========================================
+@bot.tree.command(
+    name="reload",
+    description="Reload the event catalog from disk without restarting the bot.",
+    guild=GUILD_OBJ,  # per-guild install if provided
+)
+@app_commands.default_permissions(manage_guild=True)
+@deadline_guard(slow=True)
+async def reload_cmd(interaction: discord.Interaction):
+    # The catalog and the command sync are process-wide, so a server's admins alone can't run this
+    if not await bot.is_owner(interaction.user):
+        await reply(interaction, "Only the bot's owner can reload the catalog: it applies to every server.")
+        return
     try:
-        if interaction.guild is None:
-            await interaction.response.send_message("Run this in a server, not in DMs.", ephemeral=True)
-            return
-        bot.tree.copy_global_to(guild=interaction.guild)
-        cmds = await bot.tree.sync(guild=interaction.guild)
-        await interaction.response.send_message(
-            f"Synced **{len(cmds)}** command(s) to **{interaction.guild.name}**.",
-            ephemeral=True,
-        )
-    except Exception as e:
-        await interaction.response.send_message(
-            f"Sync failed: `{type(e).__name__}: {e}`", ephemeral=True
-        )
-        raise
+        new_catalog, resynced = await reload_catalog()
+    except CatalogError as e:
+        await reply(interaction, f"Reload failed, keeping the current catalog: `{e}`")
+        return
+    await reply(
+        interaction,
+        f"Reloaded **{len(new_catalog)}** event(s)."
+        + (" Slash commands changed and were re-synced." if resynced else ""),
+    )
 
 
 # =========================================
 # RUN
 # =========================================
-if not TOKEN:
-    raise SystemExit(
-        "Set your token first: export DISCORD_TOKEN=... (macOS/Linux) or $env:DISCORD_TOKEN='...' (PowerShell)"
-    )
+def main() -> None:
+    if not TOKEN:
+        raise SystemExit(
+            "Set your token first: export DISCORD_TOKEN=... (macOS/Linux) or $env:DISCORD_TOKEN='...' (PowerShell)"
+        )
+
+    bot.run(TOKEN)
+
 
-bot.run(TOKEN)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,626 @@
+"""Event catalog: load events.yaml (or .json) into an immutable, indexed model.
+
+Schema (same for JSON and YAML):
+
+    version: int
+    source: str
+    events:
+      - id, name, summary, description
+        duration_days, repeats, notes        (optional)
+        days:
+          Day1:
+            label, summary
+            scoring: [{action, points, notes}]
+            tasks:   [{task, notes, reward: [{item, qty}]}]
+        extras:                              (optional)
+          rankings: {daily|overall: [{range, rewards: [{item, qty}]}]}
+          exchange: [{cost, currency, item, qty}]
+
+events.yaml is the source of truth. `python catalog.py` compiles it into a
+compact binary artifact (events.catalog: interned strings, a shared reward
+item table, int32 tables) that the bot decodes at startup instead of parsing YAML; the
+bot also writes it itself whenever it is missing or older than the source's contents.
+Each process decodes it into its own Catalog objects: the file saves the parse, it
+is not shared memory.
+"""
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from array import array
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE_CANDIDATES = ("events.yaml", "events.yml", "events.json", "events.catalog")
+MAX_EVENT_ID = 64  # ids are embedded in component custom_ids (100 chars max)
+
+
+class CatalogError(ValueError):
+    """Raised when an events file doesn't match the catalog schema."""
+
+
+# =========================================
+# MODEL
+# =========================================
+@dataclass(frozen=True, slots=True)
+class RewardItem:
+    item: str
+    qty: int
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringRule:
+    action: str
+    points: int
+    notes: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class Task:
+    task: str
+    rewards: Tuple[RewardItem, ...]
+    notes: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class RankBracket:
+    range: str  # as written, e.g. "4 ~ 5"
+    rewards: Tuple[RewardItem, ...]
+    lo: int  # parsed once at compile time: "4 ~ 5" -> 4, 5; "101+" -> 101, None
+    hi: Optional[int]
+
+    def __contains__(self, rank: object) -> bool:
+        return isinstance(rank, int) and self.lo <= rank and (self.hi is None or rank <= self.hi)
+
+
+@dataclass(frozen=True, slots=True)
+class ExchangeOffer:
+    cost: int
+    currency: str
+    item: str
+    qty: int
+
+
+@dataclass(frozen=True, slots=True)
+class Day:
+    key: str  # e.g. "Day1" (stable id from the source file)
+    name: str  # display label, e.g. "Stage 1"
+    summary: str
+    scoring: Tuple[ScoringRule, ...]
+    tasks: Tuple[Task, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    id: str
+    name: str
+    summary: str
+    description: str
+    duration_days: Optional[int]
+    repeats: Optional[str]
+    notes: Optional[str]
+    days: Tuple[Day, ...]
+    rankings: Tuple[Tuple[str, Tuple[RankBracket, ...]], ...]  # (kind, brackets), e.g. ("daily", ...)
+    exchange: Tuple[ExchangeOffer, ...]
+
+    @property
+    def day_names(self) -> Tuple[str, ...]:
+        return tuple(d.name for d in self.days)
+
+
+@dataclass(frozen=True, slots=True)
+class Catalog:
+    version: int
+    source: str
+    events: Tuple[Event, ...]
+    event_names: Tuple[str, ...]
+    _by_name: Dict[str, Event]
+    _by_id: Dict[str, Event]
+    _by_day: Dict[Tuple[str, str], Day]
+    digest: bytes = b""  # source_digest() of the events file it came from; b"" if built in memory
+
+    @classmethod
+    def build(cls, version: int, source: str, events: Tuple[Event, ...], digest: bytes = b"") -> "Catalog":
+        by_name = {ev.name: ev for ev in events}
+        by_id = {ev.id: ev for ev in events}
+        by_day = {(ev.name, d.name): d for ev in events for d in ev.days}
+        return cls(version, source, events, tuple(by_name), by_name, by_id, by_day, digest)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __contains__(self, event_name: object) -> bool:
+        return event_name in self._by_name
+
+    def get_event(self, event_name: str) -> Optional[Event]:
+        return self._by_name.get(event_name)
+
+    def get_event_by_id(self, event_id: str) -> Optional[Event]:
+        return self._by_id.get(event_id)
+
+    def get_day(self, event_name: str, day_name: str) -> Optional[Day]:
+        return self._by_day.get((event_name, day_name))
+
+    def day_names(self, event_name: str) -> Tuple[str, ...]:
+        ev = self._by_name.get(event_name)
+        return ev.day_names if ev else ()
+
+
+# =========================================
+# SCHEMA VALIDATION + COMPILE
+# =========================================
+_RANK_RANGE = re.compile(r"^\s*#?(\d+)\s*(?:(?:~|-|–|to)\s*#?(\d+)|(\+))?\s*$")
+
+
+def parse_rank_range(text: str) -> Tuple[int, Optional[int]]:
+    """'1' -> (1, 1); '4 ~ 5' / '4-5' -> (4, 5); '101+' -> (101, None). Raises ValueError."""
+    m = _RANK_RANGE.match(text)
+    if not m:
+        raise ValueError(f"unrecognised rank range {text!r}")
+    lo = int(m.group(1))
+    hi = None if m.group(3) else int(m.group(2) or lo)
+    if lo < 1 or (hi is not None and hi < lo):
+        raise ValueError(f"empty rank range {text!r}")
+    return lo, hi
+
+
+def _expect(value: Any, kind: type, path: str, optional: bool = False) -> Any:
+    if value is None and optional:
+        return None
+    # bool is an int subclass; never accept it where a number is expected
+    if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+        raise CatalogError(f"{path}: expected {kind.__name__}, got {type(value).__name__}")
+    return value
+
+
+def _compile_rewards(raw: Any, path: str) -> Tuple[RewardItem, ...]:
+    out: List[RewardItem] = []
+    for i, r in enumerate(_expect(raw, list, path)):
+        p = f"{path}[{i}]"
+        _expect(r, dict, p)
+        out.append(RewardItem(_expect(r.get("item"), str, f"{p}.item"),
+                              _expect(r.get("qty"), int, f"{p}.qty")))
+    return tuple(out)
+
+
+def _compile_day(key: str, raw: Any, path: str) -> Day:
+    _expect(raw, dict, path)
+    scoring: List[ScoringRule] = []
+    for i, s in enumerate(_expect(raw.get("scoring") or [], list, f"{path}.scoring")):
+        p = f"{path}.scoring[{i}]"
+        _expect(s, dict, p)
+        scoring.append(ScoringRule(_expect(s.get("action"), str, f"{p}.action"),
+                                   _expect(s.get("points"), int, f"{p}.points"),
+                                   _expect(s.get("notes"), str, f"{p}.notes", optional=True)))
+    tasks: List[Task] = []
+    for i, t in enumerate(_expect(raw.get("tasks") or [], list, f"{path}.tasks")):
+        p = f"{path}.tasks[{i}]"
+        _expect(t, dict, p)
+        tasks.append(Task(_expect(t.get("task"), str, f"{p}.task"),
+                          _compile_rewards(t.get("reward") or [], f"{p}.reward"),
+                          _expect(t.get("notes"), str, f"{p}.notes", optional=True)))
+    return Day(key=key,
+               name=_expect(raw.get("label") or key, str, f"{path}.label"),
+               summary=_expect(raw.get("summary") or "", str, f"{path}.summary"),
+               scoring=tuple(scoring),
+               tasks=tuple(tasks))
+
+
+def _compile_event(raw: Any, path: str) -> Event:
+    _expect(raw, dict, path)
+    name = _expect(raw.get("name"), str, f"{path}.name")
+    days_raw = _expect(raw.get("days"), dict, f"{path}.days")
+    if not days_raw:
+        raise CatalogError(f"{path}.days: event '{name}' has no days")
+    days = tuple(_compile_day(k, v, f"{path}.days.{k}") for k, v in days_raw.items())
+    seen = set()
+    for d in days:
+        if d.name in seen:
+            raise CatalogError(f"{path}.days: duplicate day label '{d.name}' in '{name}'")
+        seen.add(d.name)
+
+    extras = _expect(raw.get("extras") or {}, dict, f"{path}.extras")
+    rankings: List[Tuple[str, Tuple[RankBracket, ...]]] = []
+    for kind, brackets in _expect(extras.get("rankings") or {}, dict, f"{path}.extras.rankings").items():
+        bp = f"{path}.extras.rankings.{kind}"
+        if not _expect(brackets, list, bp):
+            raise CatalogError(f"{bp}: no brackets (drop the '{kind}' key instead)")
+        compiled: List[RankBracket] = []
+        for i, b in enumerate(brackets):
+            _expect(b, dict, f"{bp}[{i}]")
+            text = _expect(b.get("range"), str, f"{bp}[{i}].range")
+            try:
+                lo, hi = parse_rank_range(text)
+            except ValueError as e:
+                raise CatalogError(f"{bp}[{i}].range: {e}") from None
+            if compiled and (compiled[-1].hi is None or lo <= compiled[-1].hi):
+                raise CatalogError(f"{bp}[{i}].range: {text!r} overlaps or precedes {compiled[-1].range!r}")
+            compiled.append(RankBracket(text, _compile_rewards(b.get("rewards") or [], f"{bp}[{i}].rewards"),
+                                        lo, hi))
+        rankings.append((kind, tuple(compiled)))
+    exchange: List[ExchangeOffer] = []
+    for i, x in enumerate(_expect(extras.get("exchange") or [], list, f"{path}.extras.exchange")):
+        p = f"{path}.extras.exchange[{i}]"
+        _expect(x, dict, p)
+        exchange.append(ExchangeOffer(_expect(x.get("cost"), int, f"{p}.cost"),
+                                      _expect(x.get("currency"), str, f"{p}.currency"),
+                                      _expect(x.get("item"), str, f"{p}.item"),
+                                      _expect(x.get("qty"), int, f"{p}.qty")))
+
+    event_id = _expect(raw.get("id") or name, str, f"{path}.id")
+    if len(event_id) > MAX_EVENT_ID:
+        raise CatalogError(f"{path}.id: '{event_id}' is longer than {MAX_EVENT_ID} characters")
+
+    return Event(id=event_id,
+                 name=name,
+                 summary=_expect(raw.get("summary") or "", str, f"{path}.summary"),
+                 description=_expect(raw.get("description") or "", str, f"{path}.description"),
+                 duration_days=_expect(raw.get("duration_days"), int, f"{path}.duration_days", optional=True),
+                 repeats=_expect(raw.get("repeats"), str, f"{path}.repeats", optional=True),
+                 notes=_expect(raw.get("notes"), str, f"{path}.notes", optional=True),
+                 days=days,
+                 rankings=tuple(rankings),
+                 exchange=tuple(exchange))
+
+
+def compile_catalog(doc: Any, digest: bytes = b"") -> Catalog:
+    """Validate a parsed events document and compile it. Raises CatalogError on the first problem."""
+    _expect(doc, dict, "$")
+    events = tuple(_compile_event(e, f"events[{i}]")
+                   for i, e in enumerate(_expect(doc.get("events"), list, "events")))
+    for attr in ("name", "id"):
+        values = [getattr(ev, attr) for ev in events]
+        dupes = sorted({v for v in values if values.count(v) > 1})
+        if dupes:
+            raise CatalogError(f"events: duplicate event {attr}(s): {', '.join(dupes)}")
+    return Catalog.build(int(doc.get("version") or 1), str(doc.get("source") or ""), events, digest)
+
+
+# =========================================
+# BINARY ARTIFACT (events.catalog)
+# =========================================
+# Layout (native byte order, recorded in the header; everything after it is 4-byte aligned):
+#   header   ARTIFACT_MAGIC, format, byte-order mark, catalog version, source string id,
+#            16-byte source digest, then (offset, rows) for each section in _TABLES order
+#   strings  int32 offsets[n + 1] followed by one UTF-8 blob; every string in the catalog
+#            (names, actions, item names, ...) is stored once and referenced by id
+#   items    the distinct reward item names; reward rows reference an item id, not a string
+#   tables   flat int32 rows of fixed width (see _TABLES); children are (start, count)
+#            slices of the next table down, optional strings/ints use -1
+# The loader memory-maps the file and reads the tables in place, decoding each string and
+# building each distinct RewardItem / ScoringRule exactly once. The result is ordinary Python
+# objects owned by the process; the map is closed before read_artifact returns.
+ARTIFACT_SUFFIX = ".catalog"
+ARTIFACT_MAGIC = b"UTCCATLG"
+ARTIFACT_FORMAT = 2
+_BOM = 0x01020304
+_NONE = -1
+_INT32_MIN, _INT32_MAX = -(2 ** 31), 2 ** 31 - 1
+
+# name -> columns per row
+_TABLES: Tuple[Tuple[str, int], ...] = (
+    ("items", 1),      # string id
+    ("rewards", 2),    # item id, qty
+    ("scoring", 3),    # action, points, notes
+    ("tasks", 4),      # task, notes, reward start, reward count
+    ("days", 7),       # key, name, summary, scoring start/count, task start/count
+    ("brackets", 5),   # range, lo, hi, reward start, reward count
+    ("rankings", 3),   # kind, bracket start, bracket count
+    ("exchange", 4),   # cost, currency, item, qty
+    ("events", 15),    # id, name, summary, description, duration_days, repeats, notes,
+                       # day start/count, ranking start/count, exchange start/count, 2 reserved
+)
+_HEADER = struct.Struct(f"=8sIIii16s{2 * (len(_TABLES) + 1)}i")  # + the strings section
+
+
+def source_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class _ArtifactWriter:
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.items: Dict[str, int] = {}
+        self.tables: Dict[str, array] = {name: array("i") for name, _ in _TABLES}
+
+    def s(self, value: Optional[str]) -> int:
+        if value is None:
+            return _NONE
+        sid = self.strings.get(value)
+        if sid is None:
+            sid = self.strings[value] = len(self.strings)
+        return sid
+
+    def n(self, value: Optional[int]) -> int:
+        if value is None:
+            return _NONE
+        if not _INT32_MIN < value <= _INT32_MAX:
+            raise CatalogError(f"{value} doesn't fit the binary catalog (32-bit integers)")
+        return value
+
+    def row(self, table: str, *values: int) -> None:
+        self.tables[table].extend(values)
+
+    def rows(self, table: str) -> int:
+        return len(self.tables[table]) // dict(_TABLES)[table]
+
+    def rewards(self, rewards: Tuple[RewardItem, ...]) -> Tuple[int, int]:
+        start = self.rows("rewards")
+        for r in rewards:
+            item = self.items.get(r.item)
+            if item is None:
+                item = self.items[r.item] = len(self.items)
+                self.row("items", self.s(r.item))
+            self.row("rewards", item, self.n(r.qty))
+        return start, len(rewards)
+
+    def add_event(self, ev: Event) -> None:
+        day_start = self.rows("days")
+        for d in ev.days:
+            sc_start = self.rows("scoring")
+            for rule in d.scoring:
+                self.row("scoring", self.s(rule.action), self.n(rule.points), self.s(rule.notes))
+            task_start = self.rows("tasks")
+            for t in d.tasks:
+                self.row("tasks", self.s(t.task), self.s(t.notes), *self.rewards(t.rewards))
+            self.row("days", self.s(d.key), self.s(d.name), self.s(d.summary),
+                     sc_start, len(d.scoring), task_start, len(d.tasks))
+        rank_start = self.rows("rankings")
+        for kind, brackets in ev.rankings:
+            br_start = self.rows("brackets")
+            for b in brackets:
+                self.row("brackets", self.s(b.range), self.n(b.lo), self.n(b.hi), *self.rewards(b.rewards))
+            self.row("rankings", self.s(kind), br_start, len(brackets))
+        ex_start = self.rows("exchange")
+        for x in ev.exchange:
+            self.row("exchange", self.n(x.cost), self.s(x.currency), self.s(x.item), self.n(x.qty))
+        self.row("events", self.s(ev.id), self.s(ev.name), self.s(ev.summary), self.s(ev.description),
+                 self.n(ev.duration_days), self.s(ev.repeats), self.s(ev.notes),
+                 day_start, len(ev.days), rank_start, len(ev.rankings), ex_start, len(ev.exchange), 0, 0)
+
+    def to_bytes(self, catalog: Catalog, digest: bytes) -> bytes:
+        source_id = self.s(catalog.source)
+        blobs = [v.encode("utf-8") for v in self.strings]  # dict order == id order
+        offsets = array("i", [0])
+        for b in blobs:
+            offsets.append(offsets[-1] + len(b))
+        blob = b"".join(blobs)
+        blob += b"\0" * (-len(blob) % 4)
+
+        sections: List[int] = []
+        body: List[bytes] = []
+        pos = _HEADER.size
+        sections += [pos, len(blobs)]
+        body += [offsets.tobytes(), blob]
+        pos += len(body[0]) + len(blob)
+        for name, cols in _TABLES:
+            data = self.tables[name].tobytes()
+            sections += [pos, len(self.tables[name]) // cols]
+            body.append(data)
+            pos += len(data)
+        header = _HEADER.pack(ARTIFACT_MAGIC, ARTIFACT_FORMAT, _BOM, catalog.version, source_id, digest, *sections)
+        return header + b"".join(body)
+
+
+def write_artifact(catalog: Catalog, path: str, digest: bytes = b"\0" * 16) -> int:
+    """Write `catalog` as a binary artifact (atomically). Returns its size in bytes."""
+    writer = _ArtifactWriter()
+    for ev in catalog.events:
+        writer.add_event(ev)
+    data = writer.to_bytes(catalog, digest)
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return len(data)
+
+
+def read_artifact(path: str, expect_digest: Optional[bytes] = None) -> Optional[Catalog]:
+    """Decode an artifact into a Catalog (read through a temporary memory map).
+
+    Returns None if the file is missing, from another format/byte order, or (with
+    `expect_digest`) was compiled from a different source file."""
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _decode_artifact(mm, expect_digest)
+    except (OSError, ValueError, struct.error, IndexError, UnicodeDecodeError):
+        return None
+
+
+def _decode_artifact(mm: mmap.mmap, expect_digest: Optional[bytes]) -> Optional[Catalog]:
+    magic, fmt, bom, version, source_id, digest, *sections = _HEADER.unpack_from(mm, 0)
+    if magic != ARTIFACT_MAGIC or fmt != ARTIFACT_FORMAT or bom != _BOM:
+        return None
+    if expect_digest is not None and digest != expect_digest:
+        return None
+    views = [memoryview(mm)]
+    mv = views[0]
+    try:
+        str_pos, n_strings = sections[0], sections[1]
+        offsets = mv[str_pos:str_pos + 4 * (n_strings + 1)].cast("i")
+        views.append(offsets)
+        blob_pos = str_pos + 4 * (n_strings + 1)
+        cache: List[Optional[str]] = [None] * n_strings
+
+        def s(sid: int) -> Optional[str]:
+            if sid == _NONE:
+                return None
+            value = cache[sid]
+            if value is None:
+                value = cache[sid] = str(mv[blob_pos + offsets[sid]:blob_pos + offsets[sid + 1]], "utf-8")
+            return value
+
+        tables: Dict[str, memoryview] = {}
+        for i, (name, cols) in enumerate(_TABLES):
+            pos, rows = sections[2 + 2 * i], sections[3 + 2 * i]
+            tables[name] = mv[pos:pos + 4 * rows * cols].cast("i")
+            views.append(tables[name])
+        return _build_from_tables(tables, s, version, s(source_id) or "", digest)
+    finally:
+        for view in reversed(views):  # the mmap can't close while views are exported
+            view.release()
+
+
+def _build_from_tables(t: Dict[str, memoryview], s: Callable[[int], Optional[str]],
+                       version: int, source: str, digest: bytes) -> Catalog:
+    items, rewards_t, scoring_t, tasks_t = t["items"], t["rewards"], t["scoring"], t["tasks"]
+    reward_objs: Dict[Tuple[int, int], RewardItem] = {}
+    rule_objs: Dict[Tuple[int, int, int], ScoringRule] = {}
+
+    def n(value: int) -> Optional[int]:
+        return None if value == _NONE else value
+
+    def rewards(start: int, count: int) -> Tuple[RewardItem, ...]:
+        out = []
+        for r in range(start, start + count):
+            key = (rewards_t[2 * r], rewards_t[2 * r + 1])
+            obj = reward_objs.get(key)
+            if obj is None:
+                obj = reward_objs[key] = RewardItem(s(items[key[0]]), key[1])
+            out.append(obj)
+        return tuple(out)
+
+    def rule(i: int) -> ScoringRule:
+        key = (scoring_t[3 * i], scoring_t[3 * i + 1], scoring_t[3 * i + 2])
+        obj = rule_objs.get(key)
+        if obj is None:
+            obj = rule_objs[key] = ScoringRule(s(key[0]), key[1], s(key[2]))
+        return obj
+
+    days_t, brackets_t, rankings_t, exchange_t = t["days"], t["brackets"], t["rankings"], t["exchange"]
+    events_t = t["events"]
+    events: List[Event] = []
+    for e in range(len(events_t) // 15):
+        row = events_t[15 * e:15 * e + 15].tolist()
+        days = []
+        for d in range(row[7], row[7] + row[8]):
+            key, name, summary, sc0, scn, tk0, tkn = days_t[7 * d:7 * d + 7].tolist()
+            tasks = tuple(Task(s(tasks_t[4 * k]), rewards(tasks_t[4 * k + 2], tasks_t[4 * k + 3]), s(tasks_t[4 * k + 1]))
+                          for k in range(tk0, tk0 + tkn))
+            days.append(Day(s(key), s(name), s(summary), tuple(rule(i) for i in range(sc0, sc0 + scn)), tasks))
+        rankings = []
+        for k in range(row[9], row[9] + row[10]):
+            kind, b0, bn = rankings_t[3 * k:3 * k + 3].tolist()
+            rankings.append((s(kind), tuple(RankBracket(s(brackets_t[5 * b]),
+                                                        rewards(brackets_t[5 * b + 3], brackets_t[5 * b + 4]),
+                                                        brackets_t[5 * b + 1], n(brackets_t[5 * b + 2]))
+                                            for b in range(b0, b0 + bn))))
+        exchange = tuple(ExchangeOffer(exchange_t[4 * x], s(exchange_t[4 * x + 1]), s(exchange_t[4 * x + 2]),
+                                       exchange_t[4 * x + 3])
+                         for x in range(row[11], row[11] + row[12]))
+        events.append(Event(id=s(row[0]), name=s(row[1]), summary=s(row[2]), description=s(row[3]),
+                            duration_days=n(row[4]), repeats=s(row[5]), notes=s(row[6]),
+                            days=tuple(days), rankings=tuple(rankings), exchange=exchange))
+    return Catalog.build(version, source, tuple(events), digest)
+
+
+# =========================================
+# LOADING
+# =========================================
+def resolve_source(path: Optional[str] = None) -> str:
+    """Explicit path > EVENTS_FILE env > first of events.yaml / events.json / events.catalog next to this module."""
+    path = path or os.getenv("EVENTS_FILE")
+    if path:
+        return path
+    for name in SOURCE_CANDIDATES:
+        candidate = os.path.join(HERE, name)
+        if os.path.exists(candidate):
+            return candidate
+    raise CatalogError(f"No events file found (looked for {', '.join(SOURCE_CANDIDATES)} in {HERE})")
+
+
+def parse_source(path: str, data: Optional[bytes] = None) -> Any:
+    if data is None:
+        with open(path, "rb") as f:
+            data = f.read()
+    if path.endswith((".yaml", ".yml")):
+        import yaml  # only needed when the artifact is missing or stale
+        try:
+            return yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        except yaml.YAMLError as e:
+            raise CatalogError(f"{path}: invalid YAML: {e}") from e
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError as e:
+        raise CatalogError(f"{path}: invalid JSON: {e}") from e
+
+
+def artifact_path(source: str) -> str:
+    return os.path.splitext(source)[0] + ARTIFACT_SUFFIX
+
+
+def load_catalog(path: Optional[str] = None, use_artifact: bool = True) -> Catalog:
+    """Load the catalog from its compiled artifact when that matches the source file's
+    contents; otherwise compile the source and (re)write the artifact."""
+    source = resolve_source(path)
+    if source.endswith(ARTIFACT_SUFFIX):  # deployed without the source file
+        catalog = read_artifact(source)
+        if catalog is None:
+            raise CatalogError(f"{source}: not a readable catalog artifact (format {ARTIFACT_FORMAT})")
+        return catalog
+    try:
+        with open(source, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        raise CatalogError(f"{source}: {e}") from e
+    digest = source_digest(data)
+    if use_artifact:
+        cached = read_artifact(artifact_path(source), expect_digest=digest)
+        if cached is not None:
+            return cached
+    catalog = compile_catalog(parse_source(source, data), digest)
+    try:
+        write_artifact(catalog, artifact_path(source), digest)
+    except (OSError, CatalogError) as e:
+        print(f"[catalog] Could not write {artifact_path(source)}: {e}")
+    return catalog
+
+
+_preload: Optional["Future[Catalog]"] = None
+
+
+def preload_catalog(path: Optional[str] = None) -> "Future[Catalog]":
+    """Start `load_catalog(path)` on a background thread; `pending_preload()` hands it to the bot.
+
+    worker.py calls this before importing discord, so reading (or compiling) the catalog
+    overlaps the imports, the login and the gateway connect."""
+    global _preload
+    future: "Future[Catalog]" = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(load_catalog(path))
+        except BaseException as e:  # delivered to whoever waits on the future
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="catalog-preload", daemon=True).start()
+    _preload = future
+    return future
+
+
+def pending_preload() -> Optional["Future[Catalog]"]:
+    return _preload
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    src = resolve_source(sys.argv[1] if len(sys.argv) > 1 else None)
+    with open(src, "rb") as fh:
+        raw = fh.read()
+    t0 = time.perf_counter()
+    cat = compile_catalog(parse_source(src, raw), source_digest(raw))
+    t1 = time.perf_counter()
+    out = artifact_path(src)
+    size = write_artifact(cat, out, source_digest(raw))
+    t2 = time.perf_counter()
+    read_artifact(out)
+    t3 = time.perf_counter()
+    print(f"Compiled {len(cat)} event(s) from {src} ({len(raw):,} bytes) in {(t1 - t0) * 1000:.1f} ms")
+    print(f"Wrote {out} ({size:,} bytes) in {(t2 - t1) * 1000:.1f} ms; it loads in {(t3 - t2) * 1000:.1f} ms")
@@ -0,0 +1,168 @@
+"""Run the bot as several worker processes, each owning a slice of the shards.
+
+    WORKERS=4 SHARD_COUNT=16 python launcher.py
+
+The launcher compiles the catalog (events.catalog) and the shared render file
+(events.render) once, then starts `python worker.py` per worker with SHARD_COUNT and
+that worker's SHARD_IDS. Workers memory-map the render file and decode embeds from
+it on demand, so the OS keeps one copy of the rendered catalog in the page cache
+however many workers run. events.catalog only spares each worker the YAML parse:
+every worker still decodes its own Catalog and search indexes, so that part of the
+memory grows with the worker count. Workers share bot.db (SQLite, WAL) for
+anchors, reminders and command-sync state. A worker that exits is restarted
+with backoff; SIGINT/SIGTERM stop them all.
+"""
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WORKER = os.path.join(HERE, "worker.py")
+IDENTIFY_INTERVAL = 5.0  # Discord allows one gateway IDENTIFY per 5 s per bot (max_concurrency 1)
+MAX_BACKOFF = 60.0  # seconds between restarts of a crash-looping worker
+STABLE_AFTER = 120.0  # a worker that ran this long is considered healthy again
+STOP_TIMEOUT = 15.0  # seconds to wait for workers to close before killing them
+
+
+def plan_workers(workers: int, shard_count: int) -> List[List[int]]:
+    """Split shard ids 0..shard_count-1 into contiguous slices, one per worker."""
+    workers = max(1, min(workers, shard_count))
+    base, extra = divmod(shard_count, workers)
+    slices: List[List[int]] = []
+    start = 0
+    for w in range(workers):
+        size = base + (1 if w < extra else 0)
+        slices.append(list(range(start, start + size)))
+        start += size
+    return slices
+
+
+def prepare() -> None:
+    """Compile the catalog artifact and the render file up front so workers only map them."""
+    from catalog import load_catalog, resolve_source
+    from render import RenderFile, render_path, write_render_file
+
+    t0 = time.perf_counter()
+    catalog = load_catalog()
+    path = render_path(resolve_source())
+    existing = RenderFile.open(path, catalog.digest)
+    if existing is not None:
+        existing.close()
+        print(f"[launcher] {len(catalog)} event(s); {path} is up to date ({time.perf_counter() - t0:.2f}s)")
+        return
+    size = write_render_file(catalog, path)
+    print(f"[launcher] {len(catalog)} event(s); wrote {path} ({size:,} bytes) in {time.perf_counter() - t0:.2f}s")
+
+
+class Worker:
+    def __init__(self, index: int, shard_ids: List[int], shard_count: int):
+        self.index = index
+        self.shard_ids = shard_ids
+        self.shard_count = shard_count
+        self.proc: Optional[subprocess.Popen] = None
+        self.started_at = 0.0
+        self.restarts = 0
+        self.restart_at: Optional[float] = None
+
+    @property
+    def name(self) -> str:
+        first, last = self.shard_ids[0], self.shard_ids[-1]
+        shards = f"shards {first}-{last}" if last > first else f"shard {first}"
+        return f"worker {self.index} ({shards})"
+
+    def env(self) -> Dict[str, str]:
+        env = dict(os.environ)
+        env["SHARD_COUNT"] = str(self.shard_count)
+        env["SHARD_IDS"] = f"{self.shard_ids[0]}-{self.shard_ids[-1]}"
+        env.pop("SHARD_MODE", None)
+        if env.get("METRICS_PORT"):  # one scrape target per worker: 9100, 9101, ...
+            env["METRICS_PORT"] = str(int(env["METRICS_PORT"]) + self.index)
+        # /reload only reaches the worker that received it; polling keeps the others in step
+        env.setdefault("CATALOG_WATCH_SECONDS", "30")
+        return env
+
+    def start(self) -> None:
+        self.proc = subprocess.Popen([sys.executable, WORKER], env=self.env(), cwd=HERE)
+        self.started_at = time.monotonic()
+        self.restart_at = None
+        print(f"[launcher] Started {self.name} as pid {self.proc.pid}")
+
+    def check(self, now: float) -> None:
+        """Restart the worker (with backoff) if it exited."""
+        if self.restart_at is not None:
+            if now >= self.restart_at:
+                self.start()
+            return
+        code = self.proc.poll() if self.proc else None
+        if code is None:
+            return
+        if now - self.started_at >= STABLE_AFTER:
+            self.restarts = 0
+        delay = min(MAX_BACKOFF, IDENTIFY_INTERVAL * len(self.shard_ids) * 2 ** self.restarts)
+        self.restarts += 1
+        self.restart_at = now + delay
+        print(f"[launcher] {self.name} exited with {code}; restarting in {delay:.0f}s")
+
+    def stop(self) -> None:
+        if self.proc and self.proc.poll() is None:
+            # SIGINT lets discord.py close the gateway cleanly (KeyboardInterrupt in Client.run)
+            self.proc.send_signal(signal.SIGINT if os.name == "posix" else signal.SIGTERM)
+
+    def wait(self, deadline: float) -> None:
+        if not self.proc:
+            return
+        try:
+            self.proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            print(f"[launcher] {self.name} didn't stop in time; killing it")
+            self.proc.kill()
+            self.proc.wait()
+
+
+def main() -> int:
+    if not os.getenv("DISCORD_TOKEN"):
+        raise SystemExit("Set DISCORD_TOKEN first; every worker logs in with it.")
+    workers = int(os.getenv("WORKERS") or 2)
+    shard_count = int(os.getenv("SHARD_COUNT") or workers)
+    pool = [Worker(i, ids, shard_count) for i, ids in enumerate(plan_workers(workers, shard_count))]
+    print(f"[launcher] {len(pool)} worker(s) for {shard_count} shard(s)")
+    prepare()
+
+    stopping = False
+
+    def request_stop(signum: int, frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    # Stagger logins: each worker identifies its shards one every IDENTIFY_INTERVAL
+    for w in pool:
+        if stopping:
+            break
+        w.start()
+        wake = time.monotonic() + IDENTIFY_INTERVAL * len(w.shard_ids)
+        while not stopping and time.monotonic() < wake:
+            time.sleep(0.2)
+
+    while not stopping:
+        now = time.monotonic()
+        for w in pool:
+            w.check(now)
+        time.sleep(0.5)
+
+    print("[launcher] Stopping workers")
+    for w in pool:
+        w.stop()
+    deadline = time.monotonic() + STOP_TIMEOUT
+    for w in pool:
+        w.wait(deadline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
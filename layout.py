@@ -0,0 +1,187 @@
+"""Embed layout: pack titled line lists into embeds and messages under every Discord limit.
+
+A caller describes what to show as `EmbedBlock`s: one logical embed each (title,
+description, colour, footer) with `(section name, lines)` sections. `layout()`
+flows the lines into fields, the fields into embeds and the embeds into
+messages, in order:
+
+    field value   <= 1024 chars; a section spills into "Name (cont.)" fields
+    embed         <= 25 fields; a block spills into untitled continuation embeds
+    message       <= 10 embeds and <= 6000 chars summed over all of them
+                  (titles, descriptions, field names/values, footers)
+
+Each line is measured once. Fields are filled greedily up to whatever room is
+left in the message rather than to a fixed size, so a message only ends when
+the next line really doesn't fit, and since order must be kept that greedy fill
+is also the fewest messages possible. The result is a list of messages, each a
+list of embed payloads (`discord.Embed.to_dict()` shape): the first is the reply,
+the rest go out as follow-ups.
+"""
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# https://discord.com/developers/docs/resources/message#embed-object-embed-limits
+TITLE_LIMIT = 256
+DESCRIPTION_LIMIT = 4096
+FIELD_NAME_LIMIT = 256
+FIELD_VALUE_LIMIT = 1024
+FOOTER_LIMIT = 2048
+FIELDS_PER_EMBED = 25
+EMBEDS_PER_MESSAGE = 10
+MESSAGE_EMBED_CHARS = 6000  # across every embed of one message
+
+Payload = Dict[str, Any]
+
+
+class EmbedBlock(NamedTuple):
+    title: str = ""
+    description: str = ""
+    color: Optional[int] = None
+    sections: Sequence[Tuple[str, Sequence[str]]] = ()
+    footer: str = ""
+
+
+def _clip(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+
+def _split_line(line: str, limit: int) -> List[str]:
+    """Break a line longer than `limit` at spaces where possible (hard cuts otherwise)."""
+    pieces: List[str] = []
+    while len(line) > limit:
+        cut = line.rfind(" ", limit // 2, limit)
+        if cut == -1:
+            cut = limit
+        pieces.append(line[:cut].rstrip())
+        line = line[cut:].lstrip()
+    if line:
+        pieces.append(line)
+    return pieces
+
+
+def chunk_lines(lines: Sequence[str], limit: int = 950) -> List[str]:
+    """Join lines into newline-separated chunks of at most `limit - 1` chars each (fits a field
+    value at the default, a message at limit=1900). Lines that are too long on their own are split."""
+    chunks: List[str] = []
+    cur: List[str] = []
+    size = 0  # len("\n".join(cur)) + 1
+    for line in lines:
+        add = len(line) + 1
+        if add > limit:
+            if cur:
+                chunks.append("\n".join(cur).rstrip())
+                cur, size = [], 0
+            chunks.extend(_split_line(line, limit - 1))
+            continue
+        if size + add > limit and cur:
+            chunks.append("\n".join(cur).rstrip())
+            cur, size = [], 0
+        cur.append(line)
+        size += add
+    if cur:
+        chunks.append("\n".join(cur).rstrip())
+    return [c for c in chunks if c]
+
+
+def message_chars(embeds: Sequence[Payload]) -> int:
+    """Characters counted against MESSAGE_EMBED_CHARS for a message's embed payloads."""
+    total = 0
+    for e in embeds:
+        total += len(e.get("title", "")) + len(e.get("description", ""))
+        total += len(e.get("footer", {}).get("text", "")) + len(e.get("author", {}).get("name", ""))
+        total += sum(len(f["name"]) + len(f["value"]) for f in e.get("fields", ()))
+    return total
+
+
+def _continuation(color: Optional[int]) -> Payload:
+    payload: Payload = {"type": "rich"}
+    if color is not None:
+        payload["color"] = color
+    return payload
+
+
+class _Packer:
+    def __init__(self, reserve_fields: int, reserve_chars: int):
+        self.messages: List[List[Payload]] = [[]]
+        self.chars = reserve_chars  # used in the current message
+        self.embed: Payload = {}
+        self.fields_left = 0
+        self._reserve_fields = reserve_fields
+        self._reserve_chars = reserve_chars
+
+    def open_embed(self, payload: Payload, cost: int, footer_cost: int) -> None:
+        msg = self.messages[-1]
+        if msg and (len(msg) >= EMBEDS_PER_MESSAGE or self.chars + cost + footer_cost > MESSAGE_EMBED_CHARS):
+            self.messages.append([])
+            self.chars = 0
+        self.messages[-1].append(payload)
+        self.chars += cost
+        self.embed = payload
+        self.fields_left = FIELDS_PER_EMBED - self._reserve_fields
+        self._reserve_fields = self._reserve_chars = 0
+
+    def next_message(self, color: Optional[int]) -> None:
+        """Continue in a new message (moving the current embed along if nothing was put in it yet)."""
+        if self.embed and not any(k in self.embed for k in ("title", "description", "fields")):
+            self.messages[-1].pop()
+            payload = self.embed
+        else:
+            payload = _continuation(color)
+        self.messages.append([payload])
+        self.chars = 0
+        self.embed = payload
+        self.fields_left = FIELDS_PER_EMBED
+
+    def add_block(self, block: EmbedBlock) -> None:
+        footer = _clip(block.footer, FOOTER_LIMIT)
+        title = _clip(block.title, TITLE_LIMIT)
+        # Even in a message of its own, the head must leave room for the footer
+        room = MESSAGE_EMBED_CHARS - self._reserve_chars - len(title) - len(footer)
+        description = _clip(block.description, min(DESCRIPTION_LIMIT, room))
+        footer_cost = len(footer)
+        head = _continuation(block.color)
+        if title:
+            head["title"] = title
+        if description:
+            head["description"] = description
+        self.open_embed(head, len(title) + len(description), footer_cost)
+
+        for section, lines in block.sections:
+            name = _clip(section, FIELD_NAME_LIMIT)
+            cont = _clip(f"{section} (cont.)", FIELD_NAME_LIMIT)
+            pieces: List[str] = []
+            for line in lines:
+                if len(line) > FIELD_VALUE_LIMIT:
+                    pieces.extend(_split_line(line, FIELD_VALUE_LIMIT))
+                elif line:
+                    pieces.append(line)
+            i, field_name = 0, name
+            while i < len(pieces):
+                room = min(FIELD_VALUE_LIMIT, MESSAGE_EMBED_CHARS - self.chars - footer_cost - len(field_name))
+                if len(pieces[i]) > room:
+                    self.next_message(block.color)
+                    continue
+                if self.fields_left == 0:
+                    self.open_embed(_continuation(block.color), 0, footer_cost)
+                    continue
+                j, size = i + 1, len(pieces[i])
+                while j < len(pieces) and size + 1 + len(pieces[j]) <= room:
+                    size += 1 + len(pieces[j])
+                    j += 1
+                self.embed.setdefault("fields", []).append(
+                    {"name": field_name, "value": "\n".join(pieces[i:j]), "inline": False})
+                self.chars += len(field_name) + size
+                self.fields_left -= 1
+                i, field_name = j, cont
+
+        if footer:
+            self.embed["footer"] = {"text": footer}
+            self.chars += footer_cost
+
+
+def layout(blocks: Sequence[EmbedBlock], reserve_fields: int = 0, reserve_chars: int = 0) -> List[List[Payload]]:
+    """Messages of embed payloads for `blocks`. `reserve_fields`/`reserve_chars` keep room in the
+    first embed (and its message) for a field the caller adds afterwards."""
+    packer = _Packer(reserve_fields, reserve_chars)
+    for block in blocks:
+        packer.add_block(block)
+    return [m for m in packer.messages if m]
@@ -0,0 +1,158 @@
+"""Minimal in-process metrics: counters, histograms and callback gauges.
+
+Rendered in the Prometheus text exposition format by `render()` and served by
+`start_http_server()` (aiohttp, which discord.py already depends on).
+`log_json()` writes one structured JSON line per event when JSON_LOGS is set.
+"""
+import json
+import logging
+import os
+import sys
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+JSON_LOGS = (os.getenv("JSON_LOGS") or "").lower() in ("1", "true", "yes", "on")
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_log = logging.getLogger("timebot.metrics")
+if JSON_LOGS and not _log.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    _log.addHandler(_handler)
+    _log.setLevel(logging.INFO)
+    _log.propagate = False
+
+Labels = Tuple[str, ...]
+
+
+def _fmt_labels(names: Sequence[str], values: Labels, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name, self.help, self.labelnames = name, help, tuple(labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def collect(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        for labels, v in sorted(self._values.items()):
+            yield f"{self.name}{_fmt_labels(self.labelnames, labels)} {v:g}"
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name, self.help, self.labelnames = name, help, tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._counts: Dict[Labels, List[int]] = {}  # per bucket (not cumulative) + overflow
+        self._sums: Dict[Labels, float] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        counts = self._counts.get(labels)
+        if counts is None:
+            counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+            self._sums[labels] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[labels] += value
+
+    def count(self, *labels: str) -> int:
+        return sum(self._counts.get(labels, ()))
+
+    def collect(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, counts in sorted(self._counts.items()):
+            running = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                running += n
+                le = 'le="%s"' % ("+Inf" if bound == float("inf") else f"{bound:g}")
+                yield f"{self.name}_bucket{_fmt_labels(self.labelnames, labels, le)} {running}"
+            yield f"{self.name}_sum{_fmt_labels(self.labelnames, labels)} {self._sums[labels]:g}"
+            yield f"{self.name}_count{_fmt_labels(self.labelnames, labels)} {running}"
+
+
+class Gauge:
+    """Value read from a callback at scrape time: fn() -> [(label values, value)]."""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str],
+                 fn: Callable[[], Iterable[Tuple[Labels, float]]], kind: str = "gauge"):
+        self.name, self.help, self.labelnames, self.fn, self.kind = name, help, tuple(labelnames), fn, kind
+
+    def collect(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for labels, v in self.fn():
+            yield f"{self.name}{_fmt_labels(self.labelnames, labels)} {v:g}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[object] = []
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help, labelnames, buckets))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str],
+              fn: Callable[[], Iterable[Tuple[Labels, float]]], kind: str = "gauge") -> Gauge:
+        return self._add(Gauge(name, help, labelnames, fn, kind))
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for m in self._metrics:
+            try:
+                lines.extend(m.collect())
+            except Exception as e:  # one broken gauge callback shouldn't take down the endpoint
+                lines.append(f"# error collecting {getattr(m, 'name', m)}: {type(e).__name__}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def log_json(event: str, **fields: object) -> None:
+    if JSON_LOGS:
+        _log.info(json.dumps({"ts": round(time.time(), 3), "event": event, **fields}, default=str))
+
+
+async def start_http_server(host: str, port: int, registry: Registry = REGISTRY):
+    """Serve GET /metrics (Prometheus text) and GET /healthz. Returns the aiohttp AppRunner."""
+    from aiohttp import web
+
+    async def handle_metrics(request: "web.Request") -> "web.Response":
+        return web.Response(text=registry.render(), content_type="text/plain", charset="utf-8",
+                            headers={"X-Content-Type-Options": "nosniff"})
+
+    async def handle_health(request: "web.Request") -> "web.Response":
+        return web.Response(text="ok\n")
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle_metrics)
+    app.router.add_get("/healthz", handle_health)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
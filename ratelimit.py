@@ -0,0 +1,107 @@
+"""Token-bucket rate limits and short-window de-duplication for public posts.
+
+Both structures are bounded LRU maps: each active key costs one small entry, and
+the least recently used key is evicted once `max_keys` is reached. An evicted
+bucket simply starts over full, which only ever errs on the side of allowing.
+"""
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAX_KEYS = 10_000
+
+
+def parse_rate(spec: str) -> Optional[Tuple[int, float]]:
+    """'5/60' -> (5, 60.0): a burst of 5, refilled at 5 per 60 s. '' / '0' -> None (no limit)."""
+    spec = spec.strip()
+    if not spec or spec == "0":
+        return None
+    burst, _, per = spec.partition("/")
+    try:
+        count, seconds = int(burst), float(per.rstrip("s") or 60)
+    except ValueError:
+        raise ValueError(f"bad rate '{spec}' (expected e.g. '5/60')") from None
+    if count <= 0 or seconds <= 0:
+        raise ValueError(f"bad rate '{spec}' (both numbers must be positive)")
+    return count, seconds
+
+
+class TokenBuckets:
+    """One token bucket per key: up to `burst` tokens, refilled at `burst / per` tokens a second."""
+
+    def __init__(self, burst: int, per: float, max_keys: int = DEFAULT_MAX_KEYS):
+        self.burst = burst
+        self.per = per
+        self.rate = burst / per
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[Hashable, list]" = OrderedDict()  # key -> [tokens, updated_at]
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def take(self, key: Hashable, now: Optional[float] = None) -> float:
+        """Spend one token. Returns 0.0 if allowed, else the seconds until one is available."""
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._buckets.popitem(last=False)
+            bucket = self._buckets[key] = [float(self.burst), now]
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            return 0.0
+        return (1.0 - bucket[0]) / self.rate
+
+    def refund(self, key: Hashable) -> None:
+        """Give back a token spent by `take` (e.g. when a second limiter refused the same call)."""
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket[0] = min(self.burst, bucket[0] + 1.0)
+
+
+class RecentPosts:
+    """Remembers where a public post went for `window` seconds, keyed by what was posted."""
+
+    def __init__(self, window: float, max_keys: int = DEFAULT_MAX_KEYS):
+        self.window = window
+        self.max_keys = max_keys
+        self._posts: "OrderedDict[Hashable, Tuple[float, str]]" = OrderedDict()  # key -> (posted_at, jump url)
+        self._keys: Dict[str, Hashable] = {}  # jump url -> key, for discard_url
+
+    def __len__(self) -> int:
+        return len(self._posts)
+
+    def get(self, key: Hashable, now: Optional[float] = None) -> Optional[Tuple[float, str]]:
+        """(seconds ago, jump url) of the last post under `key` within the window, else None."""
+        entry = self._posts.get(key)
+        if entry is None:
+            return None
+        now = time.monotonic() if now is None else now
+        age = now - entry[0]
+        if age >= self.window:
+            self._drop(key)
+            return None
+        return age, entry[1]
+
+    def add(self, key: Hashable, url: str, now: Optional[float] = None) -> None:
+        if key in self._posts:
+            self._drop(key)
+        elif len(self._posts) >= self.max_keys:
+            self._drop(next(iter(self._posts)))
+        self._posts[key] = (time.monotonic() if now is None else now, url)
+        self._keys[url] = key
+
+    def discard_url(self, url: str) -> None:
+        """Forget the post at `url` (it was edited and no longer shows what it was recorded under)."""
+        key = self._keys.get(url)
+        if key is not None:
+            self._drop(key)
+
+    def _drop(self, key: Hashable) -> None:
+        _, url = self._posts.pop(key)
+        if self._keys.get(url) == key:
+            del self._keys[url]
@@ -0,0 +1,121 @@
+"""Reminder dispatcher: one asyncio task and one min-heap for every stored reminder.
+
+Reminders live in SQLite (store.reminders); in memory the dispatcher only keeps
+(fire_ts, id) tuples. It sleeps until the earliest one is due (or until an
+earlier reminder is added), pulls every due row in one query, and hands them
+to `deliver` grouped by channel so each channel gets a single message per tick.
+Recurring reminders (event/day subscriptions) are rescheduled through
+`next_fire`; everything else is deleted once delivered. With several worker
+processes sharing one database, `owns(guild_id)` limits each dispatcher to the
+guilds on its own shards so every reminder fires exactly once.
+"""
+import asyncio
+import heapq
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from store import Reminder, Store
+
+MAX_SLEEP = 300.0  # re-check the heap at least this often (clock drift, suspended hosts)
+RETRY_DELAY = 60  # seconds before retrying a channel whose delivery failed
+
+
+class ReminderDispatcher:
+    def __init__(
+        self,
+        store: Store,
+        deliver: Callable[[int, List[Reminder]], Awaitable[bool]],
+        next_fire: Callable[[Reminder, int], Optional[int]],
+        owns: Optional[Callable[[Optional[int]], bool]] = None,
+    ):
+        """`deliver(channel_id, reminders)` returns False if the channel is gone (its reminders are dropped).
+        `next_fire(reminder, now_ts)` returns the next fire time for recurring reminders, else None.
+        `owns(guild_id)` says whether this process handles a guild's reminders (default: all)."""
+        self.store = store
+        self._deliver = deliver
+        self._next_fire = next_fire
+        self._owns = owns
+        self._heap: List[Tuple[int, int]] = []
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def start(self) -> None:
+        owns = self._owns
+        self._heap = [(fire_ts, rid) for fire_ts, rid, guild_id in self.store.pending_reminders()
+                      if owns is None or owns(guild_id)]
+        heapq.heapify(self._heap)
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+
+    def add(self, fire_ts: int, reminder_id: int) -> None:
+        wake = not self._heap or fire_ts < self._heap[0][0]
+        heapq.heappush(self._heap, (fire_ts, reminder_id))
+        if wake:
+            self._wake.set()
+
+    async def _run(self) -> None:
+        while True:
+            now = time.time()
+            delay = MAX_SLEEP if not self._heap else min(MAX_SLEEP, self._heap[0][0] - now)
+            if delay > 0:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await self.fire_due(int(now))
+            except Exception as e:  # keep the dispatcher alive no matter what one batch does
+                print(f"[reminders] Dispatch failed: {type(e).__name__}: {e}")
+                await asyncio.sleep(5)
+
+    async def fire_due(self, now_ts: int) -> int:
+        """Deliver everything due at `now_ts`. Returns the number of reminders delivered."""
+        due_ids: List[int] = []
+        while self._heap and self._heap[0][0] <= now_ts:
+            due_ids.append(heapq.heappop(self._heap)[1])
+        if not due_ids:
+            return 0
+
+        by_channel: Dict[int, List[Reminder]] = defaultdict(list)
+        for r in self.store.get_reminders(due_ids):  # cancelled reminders simply aren't found
+            if r.fire_ts <= now_ts:  # otherwise a newer heap entry for it is still queued
+                by_channel[r.channel_id].append(r)
+
+        delivered = 0
+        done: List[int] = []
+        rescheduled: List[Tuple[int, int]] = []
+        for channel_id, batch in by_channel.items():
+            batch.sort(key=lambda r: r.fire_ts)
+            try:
+                ok = await self._deliver(channel_id, batch)
+            except Exception as e:
+                print(f"[reminders] Delivery to {channel_id} failed, retrying: {type(e).__name__}: {e}")
+                for r in batch:
+                    heapq.heappush(self._heap, (now_ts + RETRY_DELAY, r.id))
+                    rescheduled.append((now_ts + RETRY_DELAY, r.id))
+                continue
+            if not ok:
+                self.store.delete_channel_reminders(channel_id)
+                continue
+            delivered += len(batch)
+            for r in batch:
+                nxt = self._next_fire(r, now_ts)
+                if nxt is None:
+                    done.append(r.id)
+                else:
+                    rescheduled.append((nxt, r.id))
+                    heapq.heappush(self._heap, (nxt, r.id))
+        if done:
+            self.store.delete_reminders(done)
+        if rescheduled:
+            self.store.reschedule_reminders(rescheduled)
+        return delivered
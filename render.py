@@ -0,0 +1,167 @@
+"""Event/day embed rendering and the render file shared by worker processes.
+
+`render_event_day()` formats one (event, day) of a catalog into messages of
+serialized embed payloads, laid out by layout.py. `write_render_file()` renders
+every pair once into a single file (events.render, next to the events file)
+that `RenderFile` memory-maps: all processes mapping it share the same pages,
+so N workers don't each hold N copies of every rendered embed, and a restarted
+worker skips pre-rendering.
+
+Layout (native byte order):
+    header   RENDER_MAGIC, format, 16-byte catalog digest, index offset, index length
+    blobs    one compact JSON list of messages (lists of embed payloads) per (event, day)
+    index    JSON [[event, day, offset, length], ...]
+The digest ties the file to one version of the events file; a stale file is
+simply rewritten.
+"""
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from catalog import Catalog, ScoringRule, Task
+from layout import EmbedBlock, layout
+
+RENDER_SUFFIX = ".render"
+RENDER_MAGIC = b"UTCRENDR"
+RENDER_FORMAT = 2
+EMBED_COLOR = 0x2B6CB0
+SCHEDULE_FIELD_CHARS = 400  # room kept for the per-guild Schedule field bot.py adds to the first embed
+_HEADER = struct.Struct("=8sI16sII")
+
+
+# =========================================
+# FORMATTING
+# =========================================
+def format_scoring(scoring: Sequence[ScoringRule]) -> List[str]:
+    if not scoring:
+        return ["• *(No point scoring specified for this day)*"]
+    out: List[str] = []
+    for rule in scoring:
+        pts = rule.points
+        pts_str = f"{pts:,}" if pts >= 1000 else str(pts)
+        line = f"• **+{pts_str}** — {rule.action}"
+        if rule.notes:
+            line += f" *({rule.notes})*"
+        out.append(line)
+    return out
+
+
+def format_rewards(task: Task) -> str:
+    return ", ".join(f"{r.qty}x {r.item}" for r in task.rewards) or "—"
+
+
+def format_tasks(tasks: Sequence[Task]) -> List[str]:
+    if not tasks:
+        return ["• *(No tasks listed for this day)*"]
+    return [f"• **{t.task}**\n  ↳ {format_rewards(t)}" for t in tasks]
+
+
+def render_event_day(catalog: Catalog, event_name: str, day_name: str) -> List[List[Dict[str, Any]]]:
+    """Format one (event, day) into messages of serialized embed payloads (the expensive part).
+
+    Usually that's one message of two embeds; very large days continue in more embeds and
+    follow-up messages (see layout.py). The first embed keeps room for the Schedule field."""
+    ev = catalog.get_event(event_name)
+    day = catalog.get_day(event_name, day_name)
+    if not ev or not day:
+        raise ValueError("Day not found for event.")
+
+    # Meta
+    meta_bits: List[str] = []
+    if ev.duration_days:
+        meta_bits.append(f"**Duration:** {ev.duration_days} day(s)")
+    if ev.repeats:
+        meta_bits.append(f"**Repeats:** {ev.repeats}")
+    overview = EmbedBlock(
+        title=f"{event_name} • {day_name}", description=ev.description or ev.summary, color=EMBED_COLOR,
+        sections=[("Info", meta_bits), ("Scoring", format_scoring(day.scoring))],
+    )
+
+    # Tasks & Rewards — separate embed to avoid hitting field limits
+    sections = [("Tasks & Rewards", format_tasks(day.tasks))]
+    # Exchange shop opens on the last day of the event
+    if ev.exchange and day is ev.days[-1]:
+        shop_lines = [f"• **{x.cost} {x.currency}** → {x.qty}x {x.item}" for x in ev.exchange]
+        sections.append(("Exchange Shop", shop_lines))
+    details = EmbedBlock(color=EMBED_COLOR, sections=sections, footer=ev.notes or "")
+
+    return layout([overview, details], reserve_fields=1, reserve_chars=SCHEDULE_FIELD_CHARS)
+
+
+# =========================================
+# SHARED RENDER FILE (events.render)
+# =========================================
+def render_path(source: str) -> str:
+    """events.yaml -> events.render (also for a deployed events.catalog)."""
+    return os.path.splitext(source)[0] + RENDER_SUFFIX
+
+
+def write_render_file(catalog: Catalog, path: str) -> int:
+    """Render every (event, day) of `catalog` into `path` (atomically). Returns the file size."""
+    if not catalog.digest:
+        raise ValueError("only catalogs loaded from an events file can be shared (no digest)")
+    blobs: List[bytes] = []
+    index: List[Tuple[str, str, int, int]] = []
+    pos = _HEADER.size
+    for ev in catalog.events:
+        for day in ev.days:
+            blob = json.dumps(render_event_day(catalog, ev.name, day.name),
+                              separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+            index.append((ev.name, day.name, pos, len(blob)))
+            blobs.append(blob)
+            pos += len(blob)
+    index_blob = json.dumps(index, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(RENDER_MAGIC, RENDER_FORMAT, catalog.digest, pos, len(index_blob)))
+        for blob in blobs:
+            f.write(blob)
+        f.write(index_blob)
+    os.replace(tmp, path)
+    return pos + len(index_blob)
+
+
+class RenderFile:
+    """A memory-mapped render file. Only the (event, day) -> offset index lives in this process."""
+
+    def __init__(self, path: str, mm: mmap.mmap, digest: bytes, index: Dict[Tuple[str, str], Tuple[int, int]]):
+        self.path = path
+        self.digest = digest
+        self._mm = mm
+        self._index = index
+
+    @classmethod
+    def open(cls, path: str, expect_digest: Optional[bytes] = None) -> Optional["RenderFile"]:
+        """Map `path`; None if it's missing, unreadable, or (with `expect_digest`) for another catalog."""
+        try:
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            magic, fmt, digest, index_pos, index_len = _HEADER.unpack_from(mm, 0)
+            if magic != RENDER_MAGIC or fmt != RENDER_FORMAT:
+                raise ValueError("not a render file")
+            if expect_digest is not None and digest != expect_digest:
+                raise ValueError("stale render file")
+            rows = json.loads(mm[index_pos:index_pos + index_len])
+        except (ValueError, struct.error):
+            mm.close()
+            return None
+        return cls(path, mm, digest, {(ev, day): (pos, size) for ev, day, pos, size in rows})
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, event_name: str, day_name: str) -> Optional[List[List[Dict[str, Any]]]]:
+        """Fresh payloads for (event, day), decoded from the shared pages; None if not in the file."""
+        entry = self._index.get((event_name, day_name))
+        if entry is None:
+            return None
+        pos, size = entry
+        return json.loads(self._mm[pos:pos + size])
+
+    def close(self) -> None:
+        self._mm.close()
@@ -0,0 +1,232 @@
+"""Deadline-aware replies for slash commands.
+
+Discord invalidates an interaction token that hasn't been answered within 3
+seconds ("The application did not respond"). Commands wrapped with
+`deadline_guard` reply through `reply()`; the guard defers up front when the
+command has recently been slow (or is declared `slow`), and otherwise a shared
+watch task defers it shortly before the deadline if no reply has been sent yet. After
+a deferral `reply()` transparently switches to followups; a reply whose visibility
+differs from the deferral's (say, an ephemeral error after a public defer) replaces
+the "thinking..." message with a separate followup instead of inheriting its
+visibility. Uncaught errors get one uniform message and are re-raised for the
+tree's error handler.
+"""
+import asyncio
+import functools
+import time
+from typing import Any, Callable, Dict, Optional, Union
+
+import discord
+
+from metrics import REGISTRY, log_json
+
+RESPONSE_DEADLINE = 3.0  # seconds Discord waits for the initial response
+DEADLINE_MARGIN = 1.0  # defer this long before the deadline if nothing was sent yet
+PROJECTED_DEFER = 1.5  # defer up front if the command's recent run time exceeds this
+EWMA_ALPHA = 0.3
+
+RECEIVED_AT = "received_at"  # interaction.extras: perf_counter() when the interaction arrived
+RESPONDER = "responder"  # interaction.extras: this interaction's Responder
+# interaction.extras: called if the guarded command ends without posting publicly (e.g. to refund
+# the rate-limit token a public_post_limit check spent on a reply that turned out ephemeral)
+ON_NO_PUBLIC_POST = "on_no_public_post"
+
+DEFERRALS = REGISTRY.counter(
+    "timebot_deferrals_total",
+    "Responses deferred by the deadline guard. reason=projected: up front from recent run times "
+    "or a slow command; reason=deadline: no reply was sent 2 s after receipt.",
+    ("command", "reason"))
+LATE_RESPONSES = REGISTRY.counter(
+    "timebot_late_responses_total", "Initial responses attempted after the 3 s deadline.", ("command",))
+
+
+class RunTimes:
+    """Exponentially weighted moving average of handler run time per command."""
+
+    def __init__(self, alpha: float = EWMA_ALPHA):
+        self.alpha = alpha
+        self._avg: Dict[str, float] = {}
+
+    def observe(self, command: str, seconds: float) -> None:
+        prev = self._avg.get(command)
+        self._avg[command] = seconds if prev is None else prev + self.alpha * (seconds - prev)
+
+    def projected(self, command: str) -> float:
+        return self._avg.get(command, 0.0)
+
+
+RUN_TIMES = RunTimes()
+
+
+class DeadlineWatch:
+    """One polling task for every in-flight command, instead of a timer per interaction."""
+
+    def __init__(self, tick: float = 0.25):
+        self.tick = tick
+        self._active: Dict[int, "Responder"] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def track(self, resp: "Responder") -> None:
+        self._active[id(resp)] = resp
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def untrack(self, resp: "Responder") -> None:
+        self._active.pop(id(resp), None)
+
+    async def _run(self) -> None:
+        cutoff = RESPONSE_DEADLINE - DEADLINE_MARGIN
+        try:
+            while self._active:
+                await asyncio.sleep(self.tick)
+                for key, resp in list(self._active.items()):
+                    if resp.elapsed >= cutoff:
+                        del self._active[key]
+                        asyncio.ensure_future(resp._deadline_defer())
+        finally:
+            self._task = None
+
+
+WATCH = DeadlineWatch()
+
+
+class Responder:
+    """Serializes one interaction's replies so a deadline defer can't race the handler."""
+
+    __slots__ = ("interaction", "command", "ephemeral", "received_at", "deferred_by", "placeholder", "public_posts",
+                 "_lock")
+
+    def __init__(self, interaction: discord.Interaction, command: str, ephemeral: bool,
+                 received_at: Optional[float] = None):
+        self.interaction = interaction
+        self.command = command
+        self.ephemeral = ephemeral
+        self.received_at = received_at if received_at is not None else time.perf_counter()
+        self.deferred_by: Optional[str] = None
+        self.placeholder = False  # the deferral's "thinking..." message hasn't been replaced yet
+        self.public_posts = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.received_at
+
+    async def defer(self, reason: str = "handler") -> bool:
+        """Defer (showing "thinking...") unless a reply already went out. Returns True if it deferred."""
+        async with self._lock:
+            if self.interaction.response.is_done():
+                return False
+            await self._initial(self.interaction.response.defer(ephemeral=self.ephemeral, thinking=True))
+            self.deferred_by = reason
+            self.placeholder = True
+        DEFERRALS.inc(self.command, reason)
+        log_json("defer", command=self.command, reason=reason, elapsed=round(self.elapsed, 4))
+        return True
+
+    async def _deadline_defer(self) -> None:
+        try:
+            await self.defer("deadline")
+        except discord.HTTPException as e:  # token already gone; the handler's own reply will fail too
+            log_json("defer", command=self.command, reason="deadline", error=type(e).__name__, detail=str(e))
+
+    async def send(self, content: Optional[str] = None, *, ephemeral: Optional[bool] = None,
+                   **kwargs: Any) -> Optional[discord.abc.Snowflake]:
+        """Initial response if none was sent yet, otherwise a followup. Returns the posted message if known.
+
+        After a deferral the first followup replaces the "thinking..." message, which keeps
+        the visibility chosen at defer time; if this reply asks for the other visibility the
+        placeholder is deleted and the reply goes out as its own followup."""
+        eph = self.ephemeral if ephemeral is None else ephemeral
+        async with self._lock:
+            if not self.interaction.response.is_done():
+                callback = await self._initial(self.interaction.response.send_message(content, ephemeral=eph, **kwargs))
+                message = getattr(callback, "resource", None)
+            else:
+                if self.placeholder:
+                    self.placeholder = False
+                    if eph != self.ephemeral:
+                        await self._drop_placeholder()
+                message = await self.interaction.followup.send(content, ephemeral=eph, **kwargs)
+            if not eph:
+                self.public_posts += 1
+            return message
+
+    async def _drop_placeholder(self) -> None:
+        try:
+            await self.interaction.delete_original_response()
+        except discord.HTTPException as e:  # the followup is still sent, just without the cleanup
+            log_json("defer", command=self.command, reason="placeholder", error=type(e).__name__, detail=str(e))
+
+    async def _initial(self, call: Any) -> Any:
+        if self.elapsed > RESPONSE_DEADLINE:
+            LATE_RESPONSES.inc(self.command)
+        return await call
+
+    async def report(self, error: Exception) -> None:
+        """Tell the user a command failed; never raises (the original error matters more)."""
+        try:
+            await self.send(f"Something went wrong running /{self.command}. `{type(error).__name__}: {error}`",
+                            ephemeral=True)
+        except Exception:
+            pass
+
+
+def reply_target(interaction: discord.Interaction) -> Responder:
+    resp = interaction.extras.get(RESPONDER)
+    if resp is None:  # called outside deadline_guard: behave like a plain response
+        resp = interaction.extras[RESPONDER] = Responder(interaction, _command_name(interaction, "?"), False)
+    return resp
+
+
+async def reply(interaction: discord.Interaction, content: Optional[str] = None,
+                **kwargs: Any) -> Optional[discord.abc.Snowflake]:
+    """Answer a guarded command: initial response, or followup once deferred/answered."""
+    return await reply_target(interaction).send(content, **kwargs)
+
+
+def jump_url(interaction: discord.Interaction, message: Optional[discord.abc.Snowflake]) -> Optional[str]:
+    """Link to a message `reply()` posted in the interaction's channel (None if it wasn't returned)."""
+    if message is None or interaction.channel_id is None:
+        return None
+    return f"https://discord.com/channels/{interaction.guild_id or '@me'}/{interaction.channel_id}/{message.id}"
+
+
+def _command_name(interaction: discord.Interaction, fallback: str) -> str:
+    cmd = getattr(interaction, "command", None)
+    return cmd.qualified_name if cmd is not None else fallback
+
+
+def deadline_guard(ephemeral: Union[bool, Callable[..., bool]] = True, slow: bool = False):
+    """Wrap a slash command callback (put it directly above `async def`).
+
+    `ephemeral` is the visibility used for a deferral and for `reply()` calls that don't
+    pass one; pass a callable to derive it from the command's arguments, e.g.
+    `lambda public=False, **_: not public`. `slow=True` always defers before running."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        async def wrapper(interaction: discord.Interaction, *args: Any, **kwargs: Any) -> Any:
+            command = _command_name(interaction, func.__name__)
+            eph = ephemeral(**kwargs) if callable(ephemeral) else ephemeral
+            resp = Responder(interaction, command, eph, interaction.extras.get(RECEIVED_AT))
+            interaction.extras[RESPONDER] = resp
+            if slow or RUN_TIMES.projected(command) > PROJECTED_DEFER:
+                await resp.defer("projected")
+            else:
+                WATCH.track(resp)
+            started = time.perf_counter()
+            try:
+                return await func(interaction, *args, **kwargs)
+            except Exception as e:
+                await resp.report(e)
+                raise
+            finally:
+                WATCH.untrack(resp)
+                RUN_TIMES.observe(command, time.perf_counter() - started)
+                on_no_public_post = interaction.extras.pop(ON_NO_PUBLIC_POST, None)
+                if on_no_public_post is not None and not resp.public_posts:
+                    on_no_public_post()
+
+        return wrapper
+
+    return decorator
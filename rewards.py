@@ -0,0 +1,81 @@
+"""Inverted reward indexes for /rewards and /rank.
+
+Built once per catalog: every reward item maps to everywhere it can be earned
+(day tasks, ranking brackets, the exchange shop), and every ranking table keeps
+its brackets' lower bounds sorted so a rank resolves with one bisect.
+"""
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from catalog import Catalog, RankBracket
+from search import SearchIndex
+
+
+class RewardSource(NamedTuple):
+    kind: str  # "task" | "rank" | "exchange"
+    event: str  # event name
+    where: str  # day name, ranking kind ("daily") or currency
+    detail: str  # task text, bracket range or cost
+    qty: int
+
+
+class RankTable(NamedTuple):
+    kind: str
+    los: List[int]  # bracket lower bounds, ascending
+    brackets: Tuple[RankBracket, ...]
+
+    def lookup(self, rank: int) -> Optional[RankBracket]:
+        i = bisect_right(self.los, rank) - 1
+        if i < 0:
+            return None
+        bracket = self.brackets[i]
+        return bracket if rank in bracket else None
+
+
+class RewardIndex:
+    def __init__(self, catalog: Catalog):
+        by_item: Dict[str, List[RewardSource]] = {}
+        rank_tables: Dict[str, Dict[str, RankTable]] = {}
+        for ev in catalog.events:
+            for day in ev.days:
+                for task in day.tasks:
+                    for r in task.rewards:
+                        by_item.setdefault(r.item, []).append(RewardSource("task", ev.name, day.name, task.task, r.qty))
+            tables: Dict[str, RankTable] = {}
+            for kind, brackets in ev.rankings:
+                tables[kind] = RankTable(kind, [b.lo for b in brackets], brackets)
+                for b in brackets:
+                    for r in b.rewards:
+                        by_item.setdefault(r.item, []).append(RewardSource("rank", ev.name, kind, b.range, r.qty))
+            if tables:
+                rank_tables[ev.name] = tables
+            for x in ev.exchange:
+                by_item.setdefault(x.item, []).append(
+                    RewardSource("exchange", ev.name, x.currency, f"{x.cost} {x.currency}", x.qty))
+        self._by_item = by_item
+        self._rank_tables = rank_tables
+        self.items: Tuple[str, ...] = tuple(sorted(by_item, key=str.casefold))
+        self.ranked_events: Tuple[str, ...] = tuple(ev.name for ev in catalog.events if ev.name in rank_tables)
+        self.item_search = SearchIndex((item, item, ()) for item in self.items)
+        self.ranked_event_search = SearchIndex((name, name, ()) for name in self.ranked_events)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._by_item
+
+    def sources(self, item: str) -> List[RewardSource]:
+        return self._by_item.get(item, [])
+
+    def rank_kinds(self, event_name: str) -> Tuple[str, ...]:
+        return tuple(self._rank_tables.get(event_name, {}))
+
+    def rank_table(self, event_name: str, kind: Optional[str] = None) -> Optional[RankTable]:
+        tables = self._rank_tables.get(event_name)
+        if not tables:
+            return None
+        if kind is None:
+            return next(iter(tables.values()))
+        return tables.get(kind)
+
+
+def build_reward_index(catalog: Catalog) -> RewardIndex:
+    return RewardIndex(catalog)
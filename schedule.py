@@ -0,0 +1,167 @@
+"""Schedule engine: where recurring events are in their cycle, per guild.
+
+A guild anchors an event to one known start time; together with the event's
+`duration_days` and `repeats` ("Every 2 weeks") that defines every occurrence.
+GuildSchedule keeps the current status of each anchored event plus a min-heap
+of the next moment any of them changes (day flip, start, end), so answering
+"what's running now" only recomputes the events whose boundary has passed.
+"""
+import heapq
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from catalog import Catalog, Event
+
+DAY = timedelta(days=1)
+_REPEAT = re.compile(r"^\s*(?:every\s+(?:(\d+)\s+)?(day|week)s?|(daily|weekly|fortnightly|biweekly))\s*$", re.I)
+_REPEAT_WORDS = {"daily": DAY, "weekly": 7 * DAY, "fortnightly": 14 * DAY, "biweekly": 14 * DAY}
+
+
+def parse_repeat(text: Optional[str]) -> Optional[timedelta]:
+    """'Every 2 weeks' -> 14 days. None for one-off events or unrecognised text."""
+    if not text:
+        return None
+    m = _REPEAT.match(text)
+    if not m:
+        return None
+    if m[3]:
+        return _REPEAT_WORDS[m[3].lower()]
+    return int(m[1] or 1) * (7 * DAY if m[2].lower() == "week" else DAY)
+
+
+class Status(NamedTuple):
+    event: Event
+    start: datetime  # start of the current (or next) occurrence
+    end: datetime
+    day_index: Optional[int]  # index into event.days while running, else None
+    day_start: Optional[datetime]
+    day_end: Optional[datetime]
+
+    @property
+    def running(self) -> bool:
+        return self.day_index is not None
+
+    @property
+    def day_name(self) -> Optional[str]:
+        return self.event.days[self.day_index].name if self.day_index is not None else None
+
+
+def event_status(ev: Event, anchor: datetime, now: datetime) -> Status:
+    """Status of `ev` at `now` given one known start time."""
+    length = (ev.duration_days or 1) * DAY
+    period = parse_repeat(ev.repeats)
+    if period and period < length:
+        period = length  # overlapping cycles make no sense; treat as back-to-back
+
+    start = anchor
+    if period:
+        # Anchors may be any occurrence, past or future
+        start = anchor + ((now - anchor) // period) * period
+    end = start + length
+    if now >= end and period:
+        start, end = start + period, end + period
+
+    if start <= now < end:
+        elapsed = (now - start) // DAY
+        # Events with fewer day entries than days (e.g. one "Daily" entry) reuse the last one
+        idx = min(elapsed, len(ev.days) - 1)
+        day_start = start + elapsed * DAY
+        return Status(ev, start, end, idx, day_start, day_start + DAY)
+    return Status(ev, start, end, None, None, None)
+
+
+def _change_after(st: Status, now: datetime) -> Optional[datetime]:
+    if st.running:
+        return st.day_end
+    if st.start > now:
+        return st.start
+    return None  # one-off event that already ended
+
+
+class GuildSchedule:
+    """Statuses for one guild's anchored events, refreshed lazily from a min-heap of boundaries."""
+
+    def __init__(self, catalog: Catalog, anchors: Dict[str, datetime], now: Optional[datetime] = None):
+        now = now or datetime.now(timezone.utc)
+        self._anchors: Dict[str, Tuple[Event, datetime]] = {}
+        for ev in catalog.events:
+            if ev.id in anchors:
+                self._anchors[ev.name] = (ev, anchors[ev.id])
+        self._status: Dict[str, Status] = {}
+        self._heap: List[Tuple[datetime, str]] = []
+        for name in self._anchors:
+            self._refresh(name, now)
+
+    def _refresh(self, name: str, now: datetime) -> None:
+        ev, anchor = self._anchors[name]
+        st = self._status[name] = event_status(ev, anchor, now)
+        change = _change_after(st, now)
+        if change is not None:
+            heapq.heappush(self._heap, (change, name))
+
+    def _advance(self, now: datetime) -> None:
+        while self._heap and self._heap[0][0] <= now:
+            _, name = heapq.heappop(self._heap)
+            self._refresh(name, now)
+
+    def status(self, event_name: str, now: Optional[datetime] = None) -> Optional[Status]:
+        if event_name not in self._anchors:
+            return None
+        self._advance(now or datetime.now(timezone.utc))
+        return self._status[event_name]
+
+    def running(self, now: Optional[datetime] = None) -> List[Status]:
+        self._advance(now or datetime.now(timezone.utc))
+        return sorted((st for st in self._status.values() if st.running), key=lambda st: st.end)
+
+    def upcoming(self, now: Optional[datetime] = None) -> List[Status]:
+        now = now or datetime.now(timezone.utc)
+        self._advance(now)
+        return sorted((st for st in self._status.values() if not st.running and st.start > now),
+                      key=lambda st: st.start)
+
+    def next_day_start(self, event_name: str, day_name: Optional[str] = None,
+                       now: Optional[datetime] = None) -> Optional[Tuple[datetime, int]]:
+        """(start, day index) of the next time any day — or the named day — of an event begins
+        strictly after `now`. Pure: doesn't advance the cached statuses."""
+        entry = self._anchors.get(event_name)
+        if entry is None:
+            return None
+        ev, anchor = entry
+        t = now or datetime.now(timezone.utc)
+        for _ in range((ev.duration_days or 1) + 2):
+            st = event_status(ev, anchor, t)
+            if st.running and st.day_end < st.end:
+                start, idx = st.day_end, min((st.day_end - st.start) // DAY, len(ev.days) - 1)
+            else:
+                nxt = st if st.start > t else event_status(ev, anchor, st.end)
+                if nxt.start <= t:
+                    return None  # one-off event that's over
+                start, idx = nxt.start, 0
+            if day_name is None or ev.days[idx].name == day_name:
+                return start, idx
+            t = start
+        return None
+
+
+class ScheduleEngine:
+    """Per-guild GuildSchedule cache; rebuilt when the catalog or a guild's anchors change."""
+
+    def __init__(self, catalog: Catalog, load_anchors: Callable[[int], Dict[str, datetime]]):
+        self._catalog = catalog
+        self._load_anchors = load_anchors  # guild_id -> {event_id: anchor start}
+        self._guilds: Dict[int, GuildSchedule] = {}
+
+    def set_catalog(self, catalog: Catalog) -> None:
+        self._catalog = catalog
+        self._guilds.clear()
+
+    def invalidate(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+    def for_guild(self, guild_id: int) -> GuildSchedule:
+        sched = self._guilds.get(guild_id)
+        if sched is None:
+            sched = self._guilds[guild_id] = GuildSchedule(self._catalog, self._load_anchors(guild_id))
+        return sched
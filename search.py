@@ -0,0 +1,172 @@
+"""Prebuilt fuzzy search for the autocomplete handlers.
+
+Everything expensive happens once when the index is built: text is
+accent-stripped and lowercased, split into tokens, and each distinct token is
+put in a sorted vocabulary (prefix lookups via bisect) and a trigram index
+(typo-tolerant lookups). A query then only touches the handful of vocabulary
+tokens it matches and sums their postings per document.
+"""
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from catalog import Catalog, Day, Event
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+NAME_WEIGHT = 1.0  # tokens from the display name
+TEXT_WEIGHT = 0.5  # tokens from descriptions, tasks and rewards
+PREFIX_QUALITY = 0.9
+FUZZY_QUALITY = 0.8
+FUZZY_MIN_SIMILARITY = 0.45
+QUERY_CACHE_SIZE = 2048
+# Query-cache hits/misses across all indexes (survives index rebuilds; read by the metrics endpoint)
+CACHE_STATS: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def normalize(text: str) -> str:
+    """'Épic  Spirit-Shard' -> 'epic spirit shard'."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", stripped.casefold()).strip()
+
+
+def _trigrams(token: str) -> Set[str]:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Ranks documents (value, display name, extra searchable texts) against a query."""
+
+    def __init__(self, docs: Iterable[Tuple[str, str, Sequence[str]]]):
+        self.values: List[str] = []
+        self._names: List[str] = []
+        postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        for doc_id, (value, name, texts) in enumerate(docs):
+            self.values.append(value)
+            norm_name = normalize(name)
+            self._names.append(norm_name)
+            for text in texts:
+                for tok in normalize(text).split():
+                    postings[tok].setdefault(doc_id, TEXT_WEIGHT)
+            for tok in norm_name.split():
+                postings[tok][doc_id] = NAME_WEIGHT
+
+        self._vocab: List[str] = sorted(postings)
+        self._postings: List[Dict[int, float]] = [postings[t] for t in self._vocab]
+        self._vocab_ids: Dict[str, int] = {t: i for i, t in enumerate(self._vocab)}
+        self._tri_lens: List[int] = []
+        trigram_index: Dict[str, List[int]] = defaultdict(list)
+        for i, tok in enumerate(self._vocab):
+            grams = _trigrams(tok)
+            self._tri_lens.append(len(grams))
+            for g in grams:
+                trigram_index[g].append(i)
+        self._trigram_index = dict(trigram_index)
+        self._cache: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _token_matches(self, qtok: str) -> Dict[int, float]:
+        """Vocabulary ids matching one query token -> match quality in (0, 1]."""
+        matches: Dict[int, float] = {}
+        # Prefix (includes the exact match, which sorts first)
+        i = bisect_left(self._vocab, qtok)
+        while i < len(self._vocab) and self._vocab[i].startswith(qtok):
+            matches[i] = 1.0 if self._vocab[i] == qtok else PREFIX_QUALITY
+            i += 1
+        # Typos: Dice coefficient over shared trigrams
+        if len(qtok) >= 3:
+            qgrams = _trigrams(qtok)
+            shared: Dict[int, int] = defaultdict(int)
+            for g in qgrams:
+                for vid in self._trigram_index.get(g, ()):
+                    shared[vid] += 1
+            for vid, n in shared.items():
+                sim = 2 * n / (len(qgrams) + self._tri_lens[vid])
+                if sim >= FUZZY_MIN_SIMILARITY and vid not in matches:
+                    matches[vid] = FUZZY_QUALITY * sim
+        return matches
+
+    def search(self, query: str, limit: int = 25) -> List[str]:
+        """Values ranked by match quality; catalog order for an empty query."""
+        q = normalize(query)
+        if not q:
+            return self.values[:limit]
+        cached = self._cache.get(q)
+        if cached is None:
+            CACHE_STATS["misses"] += 1
+            cached = self._rank(q)
+            if len(self._cache) >= QUERY_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[q] = cached
+        else:
+            CACHE_STATS["hits"] += 1
+        return cached[:limit]
+
+    def _rank(self, q: str) -> List[str]:
+        qtoks = q.split()
+        scores: Dict[int, float] = {}
+        for n, qtok in enumerate(qtoks):
+            best: Dict[int, float] = {}
+            for vid, quality in self._token_matches(qtok).items():
+                for doc_id, weight in self._postings[vid].items():
+                    s = quality * weight
+                    if s > best.get(doc_id, 0.0):
+                        best[doc_id] = s
+            if n == 0:
+                scores = best
+            else:
+                # Every query token must match something in the document
+                scores = {d: s + best[d] for d, s in scores.items() if d in best}
+            if not scores:
+                return []
+
+        ranked: List[Tuple[float, int]] = []
+        for doc_id, s in scores.items():
+            name = self._names[doc_id]
+            if name == q:
+                s += 3.0
+            elif name.startswith(q):
+                s += 2.0
+            elif q in name:
+                s += 1.0
+            ranked.append((-s, doc_id))
+        ranked.sort()
+        return [self.values[d] for _, d in ranked]
+
+
+# =========================================
+# CATALOG INDEXES
+# =========================================
+def _day_texts(day: Day) -> List[str]:
+    texts: List[str] = [day.summary]
+    texts.extend(rule.action for rule in day.scoring)
+    for task in day.tasks:
+        texts.append(task.task)
+        texts.extend(r.item for r in task.rewards)
+    return texts
+
+
+def _event_texts(ev: Event) -> List[str]:
+    texts: List[str] = [ev.summary, ev.description]
+    for day in ev.days:
+        texts.append(day.name)
+        texts.extend(_day_texts(day))
+    texts.extend(x.item for x in ev.exchange)
+    return texts
+
+
+def build_event_index(catalog: Catalog) -> SearchIndex:
+    return SearchIndex((ev.name, ev.name, _event_texts(ev)) for ev in catalog.events)
+
+
+def build_day_indexes(catalog: Catalog) -> Dict[str, SearchIndex]:
+    return {
+        ev.name: SearchIndex((d.name, d.name, _day_texts(d)) for d in ev.days)
+        for ev in catalog.events
+    }
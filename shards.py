@@ -0,0 +1,109 @@
+"""Sharding configuration (from env) and per-shard stats.
+
+    SHARD_MODE=auto                  AutoShardedClient, Discord picks the shard count
+    SHARD_COUNT=8 SHARD_IDS=0-3      this process runs shards 0..3 of 8 (multi-process deployments)
+    (neither set)                    plain single-connection Client, as before
+"""
+import os
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+RATE_WINDOW = 60  # seconds of history behind the events/min figure
+
+
+class ShardConfig(NamedTuple):
+    enabled: bool
+    shard_count: Optional[int]  # None = ask Discord (auto)
+    shard_ids: Optional[List[int]]  # None = all shards of shard_count
+
+    def client_kwargs(self) -> Dict[str, object]:
+        kwargs: Dict[str, object] = {}
+        if self.shard_count is not None:
+            kwargs["shard_count"] = self.shard_count
+        if self.shard_ids is not None:
+            kwargs["shard_ids"] = self.shard_ids
+        return kwargs
+
+    def owns_guild(self, guild_id: Optional[int]) -> bool:
+        """Whether this process's shards receive `guild_id`'s events (DMs arrive on shard 0)."""
+        if self.shard_count is None or self.shard_ids is None:
+            return True
+        return (shard_for_guild(guild_id, self.shard_count) if guild_id else 0) in self.shard_ids
+
+    def describe(self) -> str:
+        if not self.enabled:
+            return "unsharded"
+        count = self.shard_count if self.shard_count is not None else "auto"
+        ids = ",".join(map(str, self.shard_ids)) if self.shard_ids is not None else "all"
+        return f"sharded (count={count}, ids={ids})"
+
+
+def parse_shard_ids(text: str) -> List[int]:
+    """'0-3,6' -> [0, 1, 2, 3, 6]."""
+    ids: List[int] = []
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        if "-" in part:
+            lo, hi = part.split("-", 1)
+            ids.extend(range(int(lo), int(hi) + 1))
+        else:
+            ids.append(int(part))
+    return sorted(set(ids))
+
+
+def config_from_env() -> ShardConfig:
+    mode = (os.getenv("SHARD_MODE") or "").strip().lower()
+    count_env = os.getenv("SHARD_COUNT")
+    ids_env = os.getenv("SHARD_IDS")
+    count = int(count_env) if count_env and count_env.isdigit() else None
+    ids = parse_shard_ids(ids_env) if ids_env else None
+    if ids is not None and count is None:
+        raise SystemExit("SHARD_IDS needs SHARD_COUNT (the total across all processes).")
+    if ids is not None and any(i >= count for i in ids):
+        raise SystemExit(f"SHARD_IDS {ids_env!r} must all be below SHARD_COUNT={count}.")
+    enabled = mode in ("auto", "on", "1", "true") or count is not None
+    return ShardConfig(enabled, count, ids)
+
+
+def shard_for_guild(guild_id: int, shard_count: int) -> int:
+    """Discord's shard routing formula."""
+    return (guild_id >> 22) % max(shard_count, 1)
+
+
+class ShardStats:
+    """Per-shard counters: a ring of one-second buckets (events/min) plus totals.
+
+    Memory is fixed per shard no matter how busy it is."""
+
+    def __init__(self):
+        self._buckets: Dict[int, List[int]] = {}
+        self._bucket_sec: Dict[int, List[int]] = {}
+        self.totals: Dict[int, int] = {}
+        self.connects: Dict[int, int] = {}
+
+    def record_event(self, shard_id: int, now: Optional[float] = None) -> None:
+        sec = int(now if now is not None else time.monotonic())
+        buckets = self._buckets.get(shard_id)
+        if buckets is None:
+            buckets = self._buckets[shard_id] = [0] * RATE_WINDOW
+            self._bucket_sec[shard_id] = [0] * RATE_WINDOW
+        stamps = self._bucket_sec[shard_id]
+        i = sec % RATE_WINDOW
+        if stamps[i] != sec:  # bucket last used a full window ago: recycle it
+            stamps[i] = sec
+            buckets[i] = 0
+        buckets[i] += 1
+        self.totals[shard_id] = self.totals.get(shard_id, 0) + 1
+
+    def record_connect(self, shard_id: int) -> None:
+        self.connects[shard_id] = self.connects.get(shard_id, 0) + 1
+
+    def events_per_minute(self, shard_id: int, now: Optional[float] = None) -> float:
+        sec = int(now if now is not None else time.monotonic())
+        buckets = self._buckets.get(shard_id)
+        if buckets is None:
+            return 0.0
+        stamps = self._bucket_sec[shard_id]
+        recent = sum(n for n, t in zip(buckets, stamps) if sec - t < RATE_WINDOW)
+        return recent * 60.0 / RATE_WINDOW
@@ -0,0 +1,185 @@
+"""Small local SQLite store for per-guild bot state.
+
+One file (BOT_DB_PATH, default bot.db next to this module) holds everything;
+each feature owns a table in SCHEMA. Calls are short and synchronous — they run
+on the event loop thread, which also keeps sqlite3's thread checks happy.
+"""
+import os
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.getenv("BOT_DB_PATH") or os.path.join(HERE, "bot.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS event_anchors (
+    guild_id   INTEGER NOT NULL,
+    event_id   TEXT    NOT NULL,
+    start_ts   INTEGER NOT NULL,   -- unix seconds (UTC) of any known start of the event
+    PRIMARY KEY (guild_id, event_id)
+);
+
+CREATE TABLE IF NOT EXISTS reminders (
+    id         INTEGER PRIMARY KEY,
+    fire_ts    INTEGER NOT NULL,   -- unix seconds (UTC)
+    channel_id INTEGER NOT NULL,
+    guild_id   INTEGER,
+    user_id    INTEGER NOT NULL,   -- who created it (pinged unless ping = 0)
+    ping       INTEGER NOT NULL DEFAULT 1,
+    event_id   TEXT,               -- set for event/day subscriptions (recurring)
+    day_name   TEXT,               -- NULL = every day of the event
+    label      TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS reminders_fire_ts ON reminders (fire_ts);
+CREATE INDEX IF NOT EXISTS reminders_user ON reminders (user_id);
+
+CREATE TABLE IF NOT EXISTS default_zones (
+    scope      TEXT    NOT NULL,   -- 'user' or 'guild'
+    scope_id   INTEGER NOT NULL,
+    zone       TEXT    NOT NULL,   -- IANA name or fixed offset as zones.zone_name() writes it
+    PRIMARY KEY (scope, scope_id)
+);
+
+CREATE TABLE IF NOT EXISTS command_sync (
+    scope_id   INTEGER PRIMARY KEY,  -- guild id, or 0 for global commands
+    hash       TEXT    NOT NULL,     -- hash of the command payload last synced to that scope
+    synced_ts  INTEGER NOT NULL
+);
+"""
+
+
+class Reminder(NamedTuple):
+    id: int
+    fire_ts: int
+    channel_id: int
+    guild_id: Optional[int]
+    user_id: int
+    ping: bool
+    event_id: Optional[str]
+    day_name: Optional[str]
+    label: str
+
+
+_REMINDER_COLS = "id, fire_ts, channel_id, guild_id, user_id, ping, event_id, day_name, label"
+
+
+class Store:
+    def __init__(self, path: str = DB_PATH):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        self.db.commit()
+
+    def close(self) -> None:
+        self.db.close()
+
+    # ---- event anchors ----
+    def get_anchors(self, guild_id: int) -> Dict[str, datetime]:
+        rows = self.db.execute(
+            "SELECT event_id, start_ts FROM event_anchors WHERE guild_id = ?", (guild_id,)
+        )
+        return {event_id: datetime.fromtimestamp(ts, timezone.utc) for event_id, ts in rows}
+
+    def set_anchor(self, guild_id: int, event_id: str, start: Optional[datetime]) -> None:
+        """Set (or with start=None, clear) the anchor start for an event in a guild."""
+        with self.db:
+            if start is None:
+                self.db.execute(
+                    "DELETE FROM event_anchors WHERE guild_id = ? AND event_id = ?", (guild_id, event_id)
+                )
+            else:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO event_anchors (guild_id, event_id, start_ts) VALUES (?, ?, ?)",
+                    (guild_id, event_id, int(start.timestamp())),
+                )
+
+    # ---- default time zones (/time) ----
+    def get_default_zones(self, user_id: int, guild_id: Optional[int]) -> Tuple[Optional[str], Optional[str]]:
+        """(user's zone, guild's zone); either is None if not set."""
+        rows = self.db.execute(
+            "SELECT scope, zone FROM default_zones WHERE (scope = 'user' AND scope_id = ?)"
+            " OR (scope = 'guild' AND scope_id = ?)", (user_id, guild_id if guild_id is not None else -1)
+        )
+        zones = dict(rows.fetchall())
+        return zones.get("user"), zones.get("guild")
+
+    def set_default_zone(self, scope: str, scope_id: int, zone: Optional[str]) -> None:
+        """Set (or with zone=None, clear) the default zone of a user or guild."""
+        with self.db:
+            if zone is None:
+                self.db.execute("DELETE FROM default_zones WHERE scope = ? AND scope_id = ?", (scope, scope_id))
+            else:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO default_zones (scope, scope_id, zone) VALUES (?, ?, ?)",
+                    (scope, scope_id, zone),
+                )
+
+    # ---- command sync hashes ----
+    def get_sync_hash(self, scope_id: int) -> Optional[str]:
+        row = self.db.execute("SELECT hash FROM command_sync WHERE scope_id = ?", (scope_id,)).fetchone()
+        return row[0] if row else None
+
+    def set_sync_hash(self, scope_id: int, digest: str) -> None:
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO command_sync (scope_id, hash, synced_ts) VALUES (?, ?, ?)",
+                (scope_id, digest, int(datetime.now(timezone.utc).timestamp())),
+            )
+
+    # ---- reminders ----
+    def add_reminder(self, fire_ts: int, channel_id: int, guild_id: Optional[int], user_id: int,
+                     ping: bool = True, event_id: Optional[str] = None, day_name: Optional[str] = None,
+                     label: str = "") -> int:
+        with self.db:
+            cur = self.db.execute(
+                "INSERT INTO reminders (fire_ts, channel_id, guild_id, user_id, ping, event_id, day_name, label)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (fire_ts, channel_id, guild_id, user_id, int(ping), event_id, day_name, label),
+            )
+        return cur.lastrowid
+
+    def pending_reminders(self) -> List[Tuple[int, int, Optional[int]]]:
+        """(fire_ts, id, guild_id) for every stored reminder; the dispatcher keeps (fire_ts, id)."""
+        return self.db.execute("SELECT fire_ts, id, guild_id FROM reminders").fetchall()
+
+    def get_reminders(self, ids: Iterable[int]) -> List[Reminder]:
+        ids = list(ids)
+        out: List[Reminder] = []
+        for i in range(0, len(ids), 500):  # stay under SQLite's bound-parameter limit
+            batch = ids[i:i + 500]
+            rows = self.db.execute(
+                f"SELECT {_REMINDER_COLS} FROM reminders WHERE id IN ({','.join('?' * len(batch))})", batch
+            )
+            out.extend(Reminder(*r[:5], bool(r[5]), *r[6:]) for r in rows)
+        return out
+
+    def user_reminders(self, user_id: int) -> List[Reminder]:
+        rows = self.db.execute(
+            f"SELECT {_REMINDER_COLS} FROM reminders WHERE user_id = ? ORDER BY fire_ts", (user_id,)
+        )
+        return [Reminder(*r[:5], bool(r[5]), *r[6:]) for r in rows]
+
+    def count_user_reminders(self, user_id: int) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM reminders WHERE user_id = ?", (user_id,)).fetchone()[0]
+
+    def reschedule_reminders(self, updates: Iterable[Tuple[int, int]]) -> None:
+        """Apply (new fire_ts, id) pairs in one transaction."""
+        with self.db:
+            self.db.executemany("UPDATE reminders SET fire_ts = ? WHERE id = ?", updates)
+
+    def delete_reminders(self, ids: Iterable[int], user_id: Optional[int] = None) -> int:
+        """Delete by id (optionally only the given user's). Returns the number removed."""
+        with self.db:
+            if user_id is None:
+                cur = self.db.executemany("DELETE FROM reminders WHERE id = ?", ((i,) for i in ids))
+            else:
+                cur = self.db.executemany(
+                    "DELETE FROM reminders WHERE id = ? AND user_id = ?", ((i, user_id) for i in ids)
+                )
+        return cur.rowcount
+
+    def delete_channel_reminders(self, channel_id: int) -> None:
+        with self.db:
+            self.db.execute("DELETE FROM reminders WHERE channel_id = ?", (channel_id,))
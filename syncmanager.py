@@ -0,0 +1,92 @@
+"""Diff-based slash command sync.
+
+The serialized command tree for a scope (global or one guild) is hashed and
+compared with the hash recorded after the last successful sync of that scope
+(store.command_sync). Unchanged scopes are skipped without any HTTP call; the
+rest are synced with bounded concurrency, backing off on 429s.
+"""
+import asyncio
+import hashlib
+import json
+import random
+from typing import Iterable, List, Optional, Tuple
+
+import discord
+from discord import app_commands
+
+from store import Store
+
+DEFAULT_CONCURRENCY = 5
+MAX_ATTEMPTS = 5
+
+
+def _scope_id(guild: Optional[discord.abc.Snowflake]) -> int:
+    return guild.id if guild is not None else 0  # 0 = global commands
+
+
+def _retry_after(error: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying `error`, or None if it isn't worth retrying."""
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+    if isinstance(error, discord.HTTPException):
+        if error.status == 429:
+            header = error.response.headers.get("Retry-After") if error.response is not None else None
+            try:
+                return float(header)
+            except (TypeError, ValueError):
+                return 2.0 ** attempt
+        if error.status >= 500:
+            return 2.0 ** attempt
+    return None
+
+
+class SyncManager:
+    def __init__(self, tree: app_commands.CommandTree, store: Store, concurrency: int = DEFAULT_CONCURRENCY):
+        self.tree = tree
+        self.store = store
+        self._sem = asyncio.Semaphore(concurrency)
+        self.http_syncs = 0  # how many sync calls actually hit Discord
+
+    def signature(self, guild: Optional[discord.abc.Snowflake] = None) -> str:
+        payload = sorted(
+            (cmd.to_dict(self.tree) for cmd in self.tree.get_commands(guild=guild)),
+            key=lambda d: (d.get("type", 1), d["name"]),
+        )
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    async def sync(self, guild: Optional[discord.abc.Snowflake] = None, force: bool = False) -> Optional[int]:
+        """Sync one scope if its commands changed (or `force`). Returns the command count, or None if skipped."""
+        sig = self.signature(guild)
+        scope = _scope_id(guild)
+        if not force and self.store.get_sync_hash(scope) == sig:
+            return None
+        async with self._sem:
+            for attempt in range(MAX_ATTEMPTS):
+                try:
+                    self.http_syncs += 1
+                    cmds = await self.tree.sync(guild=guild)
+                    break
+                except Exception as e:
+                    delay = _retry_after(e, attempt)
+                    if delay is None or attempt == MAX_ATTEMPTS - 1:
+                        raise
+                    await asyncio.sleep(delay + random.uniform(0, 0.5))
+        self.store.set_sync_hash(scope, sig)
+        return len(cmds)
+
+    async def sync_many(
+        self, guilds: Iterable[discord.abc.Snowflake], force: bool = False
+    ) -> Tuple[int, int, List[Tuple[int, Exception]]]:
+        """Sync many guild scopes concurrently. Returns (synced, skipped, [(guild id, error)])."""
+        guilds = list(guilds)
+        results = await asyncio.gather(*(self.sync(g, force) for g in guilds), return_exceptions=True)
+        synced = skipped = 0
+        failed: List[Tuple[int, Exception]] = []
+        for g, result in zip(guilds, results):
+            if isinstance(result, Exception):
+                failed.append((g.id, result))
+            elif result is None:
+                skipped += 1
+            else:
+                synced += 1
+        return synced, skipped, failed
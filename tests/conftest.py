@@ -0,0 +1,12 @@
+"""Shared setup: import the top-level modules and the bench's fake Interaction from here."""
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "bench")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# Importing bot opens its SQLite store; keep the tests' away from the real bot.db
+os.environ.setdefault("BOT_DB_PATH", os.path.join(tempfile.mkdtemp(prefix="timebot-tests-"), "bot.db"))
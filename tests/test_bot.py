@@ -0,0 +1,92 @@
+"""Regression tests for command and component handlers, driven through the bench's fake Interaction."""
+import asyncio
+
+import pytest
+
+from harness import FakeInteraction, import_bot
+from store import Reminder
+
+bot = import_bot()
+
+
+class FakeChannel:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content, **kwargs):
+        self.sent.append((content, kwargs))
+
+
+def test_reminder_labels_cannot_ping(monkeypatch):
+    channel = FakeChannel()
+    monkeypatch.setattr(bot.bot, "get_channel", lambda channel_id: channel)
+    batch = [
+        Reminder(1, 0, 10, 1, 111, True, None, None, "raid <@222> <@&333> @everyone"),
+        Reminder(2, 0, 10, 1, 444, False, None, None, "quiet one"),
+    ]
+    assert asyncio.run(bot._deliver_reminders(10, batch))
+    [(content, kwargs)] = channel.sent
+    assert "<@111>" in content and "<@444>" not in content
+    mentions = kwargs["allowed_mentions"]
+    assert [u.id for u in mentions.users] == [111]
+    assert mentions.roles is False and mentions.everyone is False
+
+
+def test_page_button_for_a_missing_event_leaves_the_message_alone():
+    interaction = FakeInteraction(user_id=5)
+    button = bot.EventPageButton("no-such-event", 0, 0, 5, "n")
+    asyncio.run(button.callback(interaction))
+    [(kind, args, kwargs)] = interaction.sent
+    assert kind == "send_message" and kwargs["ephemeral"] is True
+    assert args[0] == bot.GONE_FROM_CATALOG
+
+
+def test_components_wait_for_the_preloaded_catalog(monkeypatch):
+    async def scenario():
+        ready = asyncio.Event()
+        monkeypatch.setattr(bot, "CATALOG_READY", ready)
+        check = asyncio.create_task(bot.EventPageButton("x", 0, 0, 5, "n").interaction_check(FakeInteraction(user_id=5)))
+        await asyncio.sleep(0.01)
+        assert not check.done()
+        ready.set()
+        return await check
+
+    assert asyncio.run(scenario()) is True
+
+
+def test_reload_is_owner_only(monkeypatch):
+    async def not_owner(user):
+        return False
+
+    async def must_not_run(*args, **kwargs):
+        raise AssertionError("reloaded for a non-owner")
+
+    monkeypatch.setattr(bot.bot, "is_owner", not_owner)
+    monkeypatch.setattr(bot, "reload_catalog", must_not_run)
+    interaction = FakeInteraction(command_name="reload")
+    asyncio.run(bot.reload_cmd.callback(interaction))
+    kinds = [(kind, kwargs.get("ephemeral")) for kind, _, kwargs in interaction.sent]
+    assert kinds == [("defer", True), ("followup", True)]
+    assert "owner" in interaction.sent[-1][1][0]
+
+
+def test_error_after_a_public_defer_stays_private():
+    from responder import deadline_guard, reply
+
+    @deadline_guard(ephemeral=False, slow=True)
+    async def cmd(interaction):
+        await reply(interaction, "bad input", ephemeral=True)
+
+    interaction = FakeInteraction(command_name="x")
+    asyncio.run(cmd(interaction))
+    assert [(kind, kwargs.get("ephemeral")) for kind, _, kwargs in interaction.sent] == [
+        ("defer", False), ("delete_original", None), ("followup", True)]
+
+
+@pytest.mark.parametrize("when", ["2025-08-11T09:00+99:99", "+99999999999w"])
+def test_utc_answers_out_of_range_input_with_a_parse_error(when):
+    interaction = FakeInteraction(command_name="utc")
+    asyncio.run(bot.utc.callback(interaction, when=when))
+    [(kind, args, kwargs)] = interaction.sent
+    assert kind == "send_message" and kwargs["ephemeral"] is True
+    assert args[0].startswith("Couldn’t read that time") and "out of range" in args[0]
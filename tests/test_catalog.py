@@ -0,0 +1,97 @@
+import copy
+import os
+
+import pytest
+
+from catalog import CatalogError, compile_catalog, load_catalog, parse_rank_range, read_artifact, write_artifact
+from harness import synthetic_doc
+from rewards import build_reward_index
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EVENTS_YAML = os.path.join(os.path.dirname(HERE), "events.yaml")
+
+
+def small_doc():
+    return synthetic_doc(events=3, days=2, tasks=2, scoring=2)
+
+
+@pytest.mark.parametrize("make", [
+    lambda: load_catalog(EVENTS_YAML, use_artifact=False),
+    lambda: compile_catalog(small_doc()),
+], ids=["events.yaml", "synthetic"])
+def test_artifact_round_trip(tmp_path, make):
+    catalog = make()
+    path = str(tmp_path / "events.catalog")
+    digest = bytes(range(16))
+    write_artifact(catalog, path, digest)
+
+    back = read_artifact(path, expect_digest=digest)
+    assert back is not None
+    assert back.events == catalog.events
+    assert back.event_names == catalog.event_names
+    assert back.digest == digest
+    ev = catalog.events[0]
+    assert back.get_event_by_id(ev.id) == ev
+    assert back.get_day(ev.name, ev.days[-1].name) == ev.days[-1]
+
+
+def test_artifact_rejects_stale_or_foreign_files(tmp_path):
+    path = str(tmp_path / "events.catalog")
+    write_artifact(compile_catalog(small_doc()), path, b"a" * 16)
+    assert read_artifact(path, expect_digest=b"b" * 16) is None
+    assert read_artifact(str(tmp_path / "missing.catalog")) is None
+    (tmp_path / "junk.catalog").write_bytes(b"not a catalog at all")
+    assert read_artifact(str(tmp_path / "junk.catalog")) is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1", (1, 1)), ("4 ~ 5", (4, 5)), ("4-5", (4, 5)), ("#6 to #10", (6, 10)), ("101+", (101, None)),
+])
+def test_parse_rank_range(text, expected):
+    assert parse_rank_range(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "top 10", "5 ~ 4", "0"])
+def test_parse_rank_range_rejects(text):
+    with pytest.raises(ValueError):
+        parse_rank_range(text)
+
+
+def test_rank_lookup():
+    catalog = compile_catalog(small_doc())
+    index = build_reward_index(catalog)
+    ev = catalog.events[0].name
+    assert index.rank_kinds(ev) == ("daily", "overall")
+    table = index.rank_table(ev, "daily")
+    assert table.lookup(1).range == "1"
+    assert table.lookup(5).range == "4 ~ 5"
+    assert table.lookup(100).range == "51 ~ 100"
+    assert table.lookup(101) is None
+    assert index.rank_table(ev, "weekly") is None
+
+
+def test_empty_ranking_kind_is_rejected():
+    doc = small_doc()
+    doc["events"][1]["extras"]["rankings"]["weekly"] = []
+    with pytest.raises(CatalogError, match=r"events\[1\]\.extras\.rankings\.weekly: no brackets"):
+        compile_catalog(doc)
+
+
+def test_overlapping_brackets_are_rejected():
+    doc = small_doc()
+    brackets = doc["events"][0]["extras"]["rankings"]["daily"]
+    brackets[2] = dict(brackets[2], range="2 ~ 3")
+    with pytest.raises(CatalogError, match=r"rankings\.daily\[2\]\.range"):
+        compile_catalog(doc)
+
+
+@pytest.mark.parametrize("mutate, where", [
+    (lambda d: d["events"][0].update(days={}), r"events\[0\]\.days"),
+    (lambda d: d["events"][0].pop("name"), r"events\[0\]\.name"),
+    (lambda d: d["events"][2]["days"]["Day1"]["scoring"][0].update(points="ten"), r"scoring\[0\]\.points"),
+])
+def test_schema_errors_name_the_path(mutate, where):
+    doc = copy.deepcopy(small_doc())
+    mutate(doc)
+    with pytest.raises(CatalogError, match=where):
+        compile_catalog(doc)
@@ -0,0 +1,75 @@
+import pytest
+
+from ratelimit import RecentPosts, TokenBuckets, parse_rate
+
+
+@pytest.mark.parametrize("spec, expected", [("5/60", (5, 60.0)), ("12/30s", (12, 30.0)), ("3", (3, 60.0)),
+                                            ("", None), ("0", None)])
+def test_parse_rate(spec, expected):
+    assert parse_rate(spec) == expected
+
+
+@pytest.mark.parametrize("spec", ["x/60", "5/0", "-1/60"])
+def test_parse_rate_rejects(spec):
+    with pytest.raises(ValueError):
+        parse_rate(spec)
+
+
+def test_burst_then_refill():
+    buckets = TokenBuckets(3, 60)  # one token per 20 s
+    assert [buckets.take("u", now=0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert buckets.take("u", now=0.0) == pytest.approx(20.0)
+    assert buckets.take("u", now=5.0) == pytest.approx(15.0)
+    assert buckets.take("u", now=20.0) == 0.0
+    assert buckets.take("other", now=20.0) == 0.0  # keys are independent
+
+
+def test_refund_gives_back_one_token_up_to_the_burst():
+    buckets = TokenBuckets(2, 60)
+    buckets.take("u", now=0.0)
+    buckets.take("u", now=0.0)
+    assert buckets.take("u", now=0.0) > 0
+    buckets.refund("u")
+    assert buckets.take("u", now=0.0) == 0.0
+    for _ in range(5):
+        buckets.refund("u")
+    assert [buckets.take("u", now=0.0) == 0.0 for _ in range(3)] == [True, True, False]  # capped at 2
+    buckets.refund("never-seen")  # no-op, doesn't create an entry
+    assert len(buckets) == 1
+
+
+def test_least_recently_used_key_is_evicted():
+    buckets = TokenBuckets(1, 60, max_keys=2)
+    buckets.take("a", now=0.0)
+    buckets.take("b", now=0.0)
+    buckets.take("a", now=1.0)  # touches a, so b is the oldest
+    buckets.take("c", now=1.0)
+    assert len(buckets) == 2
+    assert buckets.take("b", now=1.0) == 0.0  # evicted, starts over full
+    assert buckets.take("c", now=1.0) > 0  # still tracked, still empty
+
+
+def test_recent_posts_window_and_replacement():
+    posts = RecentPosts(30)
+    posts.add(("ch", "ev", "d1"), "url-1", now=0.0)
+    assert posts.get(("ch", "ev", "d1"), now=10.0) == (10.0, "url-1")
+    assert posts.get(("ch", "ev", "d1"), now=30.0) is None
+    assert len(posts) == 0
+
+    posts.add("k", "url-1", now=0.0)
+    posts.add("k", "url-2", now=1.0)
+    posts.discard_url("url-1")  # the replaced link no longer maps to k
+    assert posts.get("k", now=2.0) == (1.0, "url-2")
+
+
+def test_recent_posts_discard_url_and_eviction():
+    posts = RecentPosts(30, max_keys=2)
+    posts.add("a", "url-a", now=0.0)
+    posts.add("b", "url-b", now=0.0)
+    posts.discard_url("url-a")
+    assert posts.get("a", now=1.0) is None and len(posts) == 1
+    posts.add("c", "url-c", now=1.0)
+    posts.add("d", "url-d", now=1.0)
+    assert posts.get("b", now=2.0) is None  # oldest, evicted
+    posts.discard_url("url-b")  # its link went with it
+    assert len(posts) == 2
@@ -0,0 +1,55 @@
+import pytest
+
+from catalog import compile_catalog
+from harness import synthetic_doc
+from scoring import PlanError, ScoreTable, action_unit, parse_quantity
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("500k", 500_000), ("1.5m", 1_500_000), ("100.000", 100_000), ("100,000", 100_000), ("2x", 2), ("3b", 3 * 10 ** 9),
+])
+def test_parse_quantity(text, expected):
+    assert parse_quantity(text) == expected
+
+
+@pytest.mark.parametrize("text", ["lots", "1.5", "1.2.3"])
+def test_parse_quantity_rejects(text):
+    with pytest.raises(PlanError):
+        parse_quantity(text)
+
+
+def test_action_unit():
+    assert action_unit("Per gathering 100 Food on the field") == 100
+    assert action_unit("Increase Power by 1") == 1
+    assert action_unit("Use a Lucky Ticket") == 1
+
+
+@pytest.fixture(scope="module")
+def tables():
+    pytest.importorskip("numpy")  # in requirements.txt; the tests below compare both paths
+    event = compile_catalog(synthetic_doc(events=1, days=3, tasks=1, scoring=3)).events[0]
+    return ScoreTable(event), ScoreTable(event, vectorized=False)
+
+
+def test_both_paths_agree(tables):
+    vectorized, plain = tables
+    assert vectorized.np and not plain.np
+    plan = vectorized.quantities(vectorized.parse_plan("per gathering 100 food tier 0 500k, tier 2 300 food 12.000"))
+    assert vectorized.day_totals(plan) == plain.day_totals(plan)
+    assert vectorized.day_totals(plan)[0] == 5000 * 3 + 40 * 9  # 500k / 100 * 3 + 12000 / 300 * 9
+
+
+@pytest.mark.parametrize("qty", [2 ** 62, 10 ** 30])
+def test_huge_quantities_are_exact(tables, qty):
+    vectorized, plain = tables
+    quantities = [qty] * len(vectorized.actions)
+    expected = sum(qty // unit * points for unit, points in zip(plain.unit_sizes, plain.rows[0]))
+    assert vectorized.day_totals(quantities)[0] == plain.day_totals(quantities)[0] == expected
+
+
+def test_shortfall_rounds_up(tables):
+    _, plain = tables
+    best = plain.shortfall(10 ** 20 + 1, day=0)[0]
+    pts = plain.rows[0][plain.actions.index(best.action)]
+    unit = plain.unit_sizes[plain.actions.index(best.action)]
+    assert best.qty // unit * pts >= 10 ** 20 + 1 > (best.qty // unit - 1) * pts
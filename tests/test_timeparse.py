@@ -0,0 +1,91 @@
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from timeparse import TimeParseError, parse_batch, parse_when, scan_utc_times
+
+NOW = datetime(2025, 8, 11, 10, 0, tzinfo=timezone.utc)  # a Monday
+
+
+def utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("15:30", utc(2025, 8, 11, 15, 30)),
+    ("  15:30:45 ", utc(2025, 8, 11, 15, 30, 45)),
+    ("12am", utc(2025, 8, 11, 0, 0)),
+    ("12pm", utc(2025, 8, 11, 12, 0)),
+    ("3:30 p.m.", utc(2025, 8, 11, 15, 30)),
+    ("2025-08-11", utc(2025, 8, 11)),
+    ("2025-08-11 9pm", utc(2025, 8, 11, 21, 0)),
+    ("2025-08-11T09:00Z", utc(2025, 8, 11, 9, 0)),
+    ("2025-08-11T09:00:00.123Z", utc(2025, 8, 11, 9, 0)),
+    ("2025-08-11T09:00+02:00", utc(2025, 8, 11, 7, 0)),
+    ("2025-08-11T09:00-0530", utc(2025, 8, 11, 14, 30)),
+    ("2025-08-11T09:00+14:00", utc(2025, 8, 10, 19, 0)),
+    ("+2h30m", utc(2025, 8, 11, 12, 30)),
+    ("+1w 1d", utc(2025, 8, 19, 10, 0)),
+    ("fri 18:00", utc(2025, 8, 15, 18, 0)),
+    ("mon 11:00", utc(2025, 8, 11, 11, 0)),  # later today
+    ("monday 09:00", utc(2025, 8, 18, 9, 0)),  # already passed today: next week
+])
+def test_parse_when(text, expected):
+    assert parse_when(text, NOW) == expected
+
+
+@pytest.mark.parametrize("text, offset, message", [
+    ("", 0, "no time given"),
+    ("25:00", 0, "hour must be 0-23"),
+    ("10:60", 3, "minutes must be 0-59"),
+    ("13pm", 0, "12-hour"),
+    ("15", 2, "add minutes"),
+    ("2025-02-30 10:00", 0, "invalid date"),
+    ("2025-08-11 10:00 tomorrow", 16, "unexpected text"),
+    ("2025-08-11T09:00+99:99", 16, "UTC offset out of range"),
+    ("2025-08-11T09:00+14:30", 16, "UTC offset out of range"),
+    ("2025-08-11T09:00-03:60", 16, "UTC offset out of range"),
+    ("+2h 3x", 4, "duration"),
+    ("blursday 10:00", 0, "unknown weekday"),
+    ("+99999999999w", 0, "time out of range"),
+    ("9999-12-31T23:59-01:00", 0, "time out of range"),
+    ("0001-01-01 00:30+01:00", 0, "time out of range"),
+])
+def test_parse_errors_point_at_the_problem(text, offset, message):
+    with pytest.raises(TimeParseError) as info:
+        parse_when(text, NOW)
+    assert message in str(info.value)
+    assert info.value.offset == offset
+
+
+def test_parse_in_zone():
+    la = ZoneInfo("America/Los_Angeles")
+    assert parse_when("09:00", NOW, tz=la) == utc(2025, 8, 11, 16, 0)  # PDT
+    assert parse_when("2025-01-15 09:00", NOW, tz=la) == utc(2025, 1, 15, 17, 0)  # PST
+    assert parse_when("2025-08-11T09:00Z", NOW, tz=la) == utc(2025, 8, 11, 9, 0)  # explicit offset wins
+
+
+def test_batch_labels_and_shared_now():
+    entries = parse_batch("Reset @ 00:00, Bear hunt @ fri 18:00;\n+1h", NOW)
+    assert [e.label for e in entries] == ["Reset", "Bear hunt", ""]
+    assert [e.when for e in entries] == [utc(2025, 8, 11), utc(2025, 8, 15, 18), utc(2025, 8, 11, 11)]
+
+
+def test_batch_label_keeps_everything_before_the_last_separator():
+    [entry] = parse_batch("@everyone @ 18:00", NOW)
+    assert entry.label == "@everyone"
+
+
+def test_batch_error_offset_is_into_the_whole_text():
+    text = "Reset @ 00:00, Bear hunt @ 25:00"
+    with pytest.raises(TimeParseError) as info:
+        parse_batch(text, NOW)
+    assert info.value.offset == text.index("25:00")
+    assert info.value.pointer().endswith("^") and info.value.pointer().split("\n")[1].index("^") == info.value.offset
+
+
+def test_scan_finds_only_utc_times():
+    found = scan_utc_times("reset at 00:00 UTC, bear fri 18:00 utc, at 5 UTC, 15:00 UTC+2, 00:00 UTC again", NOW)
+    assert [f.when for f in found] == [utc(2025, 8, 11), utc(2025, 8, 15, 18)]
+    assert scan_utc_times("no times here at 15:00", NOW) == []
@@ -0,0 +1,259 @@
+"""Time parser for /utc and /time (input is read as UTC unless /time passes a zone).
+
+Accepted forms:
+    15:30            HH:MM (today)
+    15:30:45         HH:MM:SS (today)
+    3pm, 3:30 pm     12-hour clock (today)
+    2025-08-11 09:00 date + time (the time may use any clock form above)
+    2025-08-11T09:00:00Z / 2025-08-11T09:00+02:00   ISO-8601, offsets converted to UTC
+                     (fractional seconds, as in 09:00:00.123Z, are accepted and dropped:
+                     Discord timestamps are whole seconds)
+    2025-08-11       midnight on that date
+    +2h30m, +90m     relative to now (units: w d h m s)
+    fri 18:00        next Friday at 18:00 (today if that time hasn't passed yet)
+
+The parser is a hand-rolled scanner over a few precompiled regexes, each
+anchored at the current position, so a failure knows exactly where the input
+stopped making sense (TimeParseError.offset). `scan_utc_times()` finds the same
+forms in free chat text, as long as they're followed by "UTC".
+"""
+import re
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import List, NamedTuple, Optional, Tuple
+
+_CLOCK = re.compile(r"(\d{1,2})(?::(\d{2}))?(?::(\d{2})(?:[.,]\d+)?)?(?:\s*([ap])\.?m\.?)?")
+_DATE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_DATE_SEP = re.compile(r"t|\s+")
+MAX_OFFSET_HOURS = 14  # real UTC offsets run from -12:00 to +14:00
+_OFFSET = re.compile(r"\s*(?:(z|utc)|([+-])(\d{2}):?(\d{2}))")
+_REL_PART = re.compile(r"\s*(\d+)\s*([wdhms])")
+_WORD = re.compile(r"[a-z]+")
+_SPACE = re.compile(r"\s*")
+_BATCH_ENTRY = re.compile(r"[^,;\n]+")
+_LABEL_SEP = re.compile(r"\s*[@=]\s*")
+
+_WEEKDAYS = {
+    "mon": 0, "monday": 0,
+    "tue": 1, "tues": 1, "tuesday": 1,
+    "wed": 2, "weds": 2, "wednesday": 2,
+    "thu": 3, "thur": 3, "thurs": 3, "thursday": 3,
+    "fri": 4, "friday": 4,
+    "sat": 5, "saturday": 5,
+    "sun": 6, "sunday": 6,
+}
+_UNIT_SECONDS = {"w": 604800, "d": 86400, "h": 3600, "m": 60, "s": 1}
+
+MAX_BATCH_ENTRIES = 50
+# Shared by /utc, /utcbatch and /time; no zone named since /time reads input in any zone
+FORMATS_HELP = "HH:MM, HH:MM:SS, 3pm, YYYY-MM-DD HH:MM, ISO-8601, +2h30m or fri 18:00"
+
+
+class TimeParseError(ValueError):
+    """Input couldn't be parsed; `offset` is the index into the original string where it went wrong."""
+
+    def __init__(self, message: str, text: str, offset: int):
+        super().__init__(message)
+        self.text = text
+        self.offset = offset
+
+    def pointer(self) -> str:
+        """Two-line rendering of the offending input line with a caret under the bad position."""
+        start = self.text.rfind("\n", 0, self.offset) + 1
+        end = self.text.find("\n", self.offset)
+        line = self.text[start:end if end != -1 else len(self.text)]
+        return f"{line}\n{' ' * (self.offset - start)}^"
+
+
+def _clock(s: str, pos: int, text: str, lead: int) -> Tuple[int, int, int, int]:
+    """Parse a clock at `pos`. Returns (hour, minute, second, end)."""
+    m = _CLOCK.match(s, pos)
+    if not m:
+        raise TimeParseError("expected a time like 15:30 or 3pm", text, lead + pos)
+    hour, minute, second = int(m[1]), int(m[2] or 0), int(m[3] or 0)
+    if m[4]:
+        if not 1 <= hour <= 12:
+            raise TimeParseError("12-hour times need an hour from 1 to 12", text, lead + m.start(1))
+        hour = hour % 12 + (12 if m[4] == "p" else 0)
+    elif m[2] is None:
+        # A bare number ("15") is too ambiguous to accept
+        raise TimeParseError("add minutes (15:00) or am/pm (3pm)", text, lead + m.end())
+    if hour > 23:
+        raise TimeParseError("hour must be 0-23", text, lead + m.start(1))
+    if minute > 59:
+        raise TimeParseError("minutes must be 0-59", text, lead + m.start(2))
+    if second > 59:
+        raise TimeParseError("seconds must be 0-59", text, lead + m.start(3))
+    return hour, minute, second, m.end()
+
+
+def _at(d: date, hour: int, minute: int, second: int, tz: tzinfo = timezone.utc) -> datetime:
+    dt = datetime(d.year, d.month, d.day, hour, minute, second, tzinfo=tz)
+    return dt if tz is timezone.utc else dt.astimezone(timezone.utc)
+
+
+def parse_when(text: str, now: Optional[datetime] = None, tz: tzinfo = timezone.utc) -> datetime:
+    """Parse `text` into an aware UTC datetime. Raises TimeParseError.
+
+    Wall-clock input is read in `tz` (UTC unless given, as for /utc), including what "today" and
+    "fri" mean; an explicit offset or Z/UTC suffix still wins.
+    """
+    try:
+        return _parse_when(text, now, tz)
+    except OverflowError:  # "+99999999999w", "9999-12-31T23:59-01:00": past what datetime can hold
+        raise TimeParseError("time out of range", text, len(text) - len(text.lstrip())) from None
+
+
+def _parse_when(text: str, now: Optional[datetime], tz: tzinfo) -> datetime:
+    s = text.strip().lower()
+    lead = len(text) - len(text.lstrip())
+    if not s:
+        raise TimeParseError("no time given", text, 0)
+    now = now or datetime.now(timezone.utc)
+    today = (now if tz is timezone.utc else now.astimezone(tz)).date()
+    first = s[0]
+
+    # Relative: +2h30m
+    if first == "+":
+        pos, total = 1, 0
+        while pos < len(s):
+            m = _REL_PART.match(s, pos)
+            if not m:
+                raise TimeParseError("expected a duration like +2h30m", text, lead + _SPACE.match(s, pos).end())
+            total += int(m[1]) * _UNIT_SECONDS[m[2]]
+            pos = m.end()
+        if pos == 1:
+            raise TimeParseError("expected a duration like +2h30m", text, lead + 1)
+        return now + timedelta(seconds=total)
+
+    # Weekday: fri 18:00
+    if first.isalpha():
+        m = _WORD.match(s)
+        weekday = _WEEKDAYS.get(m[0])
+        if weekday is None:
+            raise TimeParseError(f"unknown weekday '{m[0]}'", text, lead)
+        pos = _SPACE.match(s, m.end()).end()
+        hour, minute, second, pos = _clock(s, pos, text, lead)
+        if pos != len(s):
+            raise TimeParseError("unexpected text after the time", text, lead + pos)
+        days_ahead = (weekday - today.weekday()) % 7
+        dt = _at(today + timedelta(days=days_ahead), hour, minute, second, tz)
+        return _at(today + timedelta(days=days_ahead + 7), hour, minute, second, tz) if dt < now else dt
+
+    # Date (+ optional time and offset)
+    m = _DATE.match(s)
+    if m:
+        try:
+            day = date(int(m[1]), int(m[2]), int(m[3]))
+        except ValueError as e:
+            raise TimeParseError(f"invalid date: {e}", text, lead) from None
+        pos = m.end()
+        if pos == len(s):
+            return _at(day, 0, 0, 0, tz)
+        sep = _DATE_SEP.match(s, pos)
+        if not sep:
+            raise TimeParseError("expected a space or 'T' between date and time", text, lead + pos)
+        hour, minute, second, pos = _clock(s, sep.end(), text, lead)
+        if pos == len(s):
+            return _at(day, hour, minute, second, tz)
+        off = _OFFSET.match(s, pos)
+        if not off or off.end() != len(s):
+            raise TimeParseError("unexpected text after the time", text, lead + pos)
+        dt = _at(day, hour, minute, second)
+        if off[2]:
+            if int(off[4]) > 59 or int(off[3]) * 60 + int(off[4]) > MAX_OFFSET_HOURS * 60:
+                raise TimeParseError("UTC offset out of range (-14:00 to +14:00)", text, lead + off.start(2))
+            delta = timedelta(hours=int(off[3]), minutes=int(off[4]))
+            dt -= delta if off[2] == "+" else -delta
+        return dt
+
+    # Clock only (today)
+    hour, minute, second, pos = _clock(s, 0, text, lead)
+    if pos != len(s):
+        off = _OFFSET.match(s, pos)
+        if not off or off.end() != len(s) or off[2]:
+            raise TimeParseError("unexpected text after the time", text, lead + pos)
+        return _at(now.date(), hour, minute, second)  # "15:00 UTC"
+    return _at(today, hour, minute, second, tz)
+
+
+class BatchEntry(NamedTuple):
+    label: str
+    when: datetime
+
+
+def parse_batch(text: str, now: Optional[datetime] = None) -> List[BatchEntry]:
+    """Parse a comma/semicolon/newline separated list of times, each optionally labelled
+    as "Label @ time" (or "Label = time"). All entries share one `now`.
+
+    Raises TimeParseError with the offset into the whole `text`.
+    """
+    now = now or datetime.now(timezone.utc)
+    entries: List[BatchEntry] = []
+    for m in _BATCH_ENTRY.finditer(text):
+        chunk = m[0]
+        if not chunk.strip():
+            continue
+        label, start = "", m.start()
+        sep = None
+        for sep in _LABEL_SEP.finditer(chunk):
+            pass  # the last separator wins, so labels may contain '@' or '='
+        if sep:
+            label = chunk[:sep.start()].strip()
+            start += sep.end()
+            chunk = chunk[sep.end():]
+        try:
+            when = parse_when(chunk, now)
+        except TimeParseError as e:
+            raise TimeParseError(str(e), text, start + e.offset) from None
+        entries.append(BatchEntry(label, when))
+        if len(entries) > MAX_BATCH_ENTRIES:
+            raise TimeParseError(f"at most {MAX_BATCH_ENTRIES} times per batch", text, m.start())
+    if not entries:
+        raise TimeParseError("no times given", text, 0)
+    return entries
+
+
+# =========================================
+# PASSIVE SCANNING (chat messages)
+# =========================================
+MAX_SCAN_CHARS = 2000  # a message's content limit; anything longer isn't chat
+MAX_SCAN_RESULTS = 10
+
+# One pass over the message for "<time> UTC": an optional weekday or date, then a clock, then the word
+# UTC (not "UTC+2"). Only the candidates go through parse_when, so /utc's rules decide what's a time.
+_WEEKDAY_WORDS = "|".join(sorted(_WEEKDAYS, key=len, reverse=True))
+_SCAN = re.compile(
+    r"(?<![\w:+-])("
+    rf"(?:(?:{_WEEKDAY_WORDS})\s+)?"
+    r"(?:\d{4}-\d{1,2}-\d{1,2}(?:(?:t|\s+)\d{1,2}(?::\d{2}){1,2})?"
+    r"|\d{1,2}(?::\d{2}){0,2}(?:\s*[ap]\.?m\.?)?)"
+    r")\s*utc\b(?![+-]\d)",
+    re.IGNORECASE,
+)
+
+
+class FoundTime(NamedTuple):
+    text: str
+    when: datetime
+
+
+def scan_utc_times(text: str, now: Optional[datetime] = None) -> List[FoundTime]:
+    """Every "<time> UTC" in a chat message ("reset at 00:00 UTC", "fri 18:00 utc", "3pm UTC"),
+    in order and without repeats. Messages that never say UTC are rejected before any regex runs."""
+    if "utc" not in text.lower() or len(text) > MAX_SCAN_CHARS:
+        return []
+    now = now or datetime.now(timezone.utc)
+    found: List[FoundTime] = []
+    seen = set()
+    for m in _SCAN.finditer(text):
+        try:
+            when = parse_when(m[1], now)
+        except TimeParseError:
+            continue  # looked like a time but isn't one by /utc's rules ("at 5 UTC", "25:00 UTC")
+        if when in seen:
+            continue
+        seen.add(when)
+        found.append(FoundTime(m[0], when))
+        if len(found) >= MAX_SCAN_RESULTS:
+            break
+    return found
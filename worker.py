@@ -0,0 +1,91 @@
+"""Worker entry point with a fast cold start (what the Procfile and launcher.py run).
+
+    python worker.py                    # run the bot
+    python worker.py --profile-startup  # print an import-time breakdown and exit (no token needed)
+
+Before anything heavy is imported, the event catalog starts loading on a
+background thread (memory-mapping events.catalog, or compiling events.yaml if
+that's stale). bot.py then comes up with an empty catalog and installs the real
+one once the thread finishes, so neither the discord import nor the login and
+gateway connect wait for it. YAML and NumPy are only imported when actually
+needed (compiling the source, /score).
+"""
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROFILE_TOP = 15  # modules listed by --profile-startup
+
+
+def run() -> None:
+    from catalog import preload_catalog
+
+    preload_catalog()
+    import bot
+
+    bot.main()
+
+
+# =========================================
+# --profile-startup
+# =========================================
+def _profile_child() -> None:
+    """Runs under `python -X importtime`: the same startup as run(), minus connecting."""
+    t0 = time.perf_counter()
+    from catalog import preload_catalog
+
+    future = preload_catalog()
+    import bot  # noqa: F401
+
+    t1 = time.perf_counter()
+    catalog = future.result()
+    t2 = time.perf_counter()
+    print(f"PROFILE import_bot={t1 - t0:.6f} catalog_ready={t2 - t0:.6f} events={len(catalog)}")
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """`-X importtime` lines -> (module, nesting depth, self us, cumulative us)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        head, cumulative_us, name = line.split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), depth, int(head[len("import time:"):]), int(cumulative_us)))
+    return rows
+
+
+def profile_startup() -> int:
+    import subprocess
+    import tempfile
+
+    # Importing bot opens its SQLite store; keep the profiling run's away from the real bot.db
+    with tempfile.TemporaryDirectory() as tmp:
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import worker; worker._profile_child()"],
+            cwd=HERE, capture_output=True, text=True,
+            env=dict(os.environ, BOT_DB_PATH=os.path.join(tmp, "profile.db")),
+        )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr[-4000:])
+        return proc.returncode
+    rows = _parse_importtime(proc.stderr)
+    phases: Dict[str, str] = dict(kv.split("=", 1) for kv in proc.stdout.split("PROFILE", 1)[-1].split())
+    total_us = sum(self_us for _, _, self_us, _ in rows)
+    # bot and what it imports directly (discord, catalog, ...), plus anything imported lazily later
+    top = sorted((r for r in rows if r[1] <= 1), key=lambda r: -r[3])
+    print(f"Imports: {total_us / 1000:.1f} ms in {len(rows)} modules "
+          f"(import bot done at {float(phases['import_bot']) * 1000:.1f} ms, "
+          f"catalog with {phases['events']} event(s) ready at {float(phases['catalog_ready']) * 1000:.1f} ms)")
+    print(f"{'module':32} {'self ms':>9} {'total ms':>9}")
+    for name, _, self_us, cumulative_us in top[:PROFILE_TOP]:
+        print(f"{name:32} {self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    if "--profile-startup" in sys.argv[1:]:
+        sys.exit(profile_startup())
+    run()
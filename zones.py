@@ -0,0 +1,120 @@
+"""Time zone lookup for /time: IANA names, common abbreviations and fixed UTC offsets.
+
+    resolve_zone("america/los_angeles")  -> ZoneInfo("America/Los_Angeles")
+    resolve_zone("PST")                  -> ZoneInfo("America/Los_Angeles")  (PDT in summer)
+    resolve_zone("UTC+5:30")             -> timezone(timedelta(hours=5, minutes=30))
+
+Abbreviations name a region, not an offset: "CET" is Central European time with
+its summer shift, which is what people mean when they say "20:00 CET" in chat.
+Resolved zones are cached, so a ZoneInfo is only read from disk once. The zone
+list (~600 names from the tz database) and its autocomplete index are built on
+first use rather than at import, keeping them off the worker's cold start.
+"""
+import functools
+import re
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Dict, List, Optional
+
+from search import SearchIndex
+
+_OFFSET_ZONE = re.compile(r"(?:utc|gmt)?\s*([+-])(\d{1,2})(?::?(\d{2}))?")
+_HIDDEN_ZONES = {"Factory", "localtime", "posixrules"}
+
+# Abbreviation -> the IANA zone it's taken to mean. Ambiguous ones get the most common reading:
+# CST is US Central (China's is Asia/Shanghai by name), IST is India, BST is British Summer Time.
+ZONE_ABBREVIATIONS: Dict[str, str] = {
+    "utc": "UTC", "gmt": "UTC", "z": "UTC", "zulu": "UTC",
+    "hst": "Pacific/Honolulu",
+    "akst": "America/Anchorage", "akdt": "America/Anchorage",
+    "pst": "America/Los_Angeles", "pdt": "America/Los_Angeles", "pt": "America/Los_Angeles",
+    "mst": "America/Denver", "mdt": "America/Denver", "mt": "America/Denver",
+    "cst": "America/Chicago", "cdt": "America/Chicago", "ct": "America/Chicago",
+    "est": "America/New_York", "edt": "America/New_York", "et": "America/New_York",
+    "ast": "America/Halifax", "adt": "America/Halifax",
+    "brt": "America/Sao_Paulo", "art": "America/Argentina/Buenos_Aires",
+    "wet": "Europe/Lisbon", "west": "Europe/Lisbon",
+    "bst": "Europe/London", "ist": "Asia/Kolkata",
+    "cet": "Europe/Paris", "cest": "Europe/Paris",
+    "eet": "Europe/Athens", "eest": "Europe/Athens",
+    "msk": "Europe/Moscow", "trt": "Europe/Istanbul",
+    "gst": "Asia/Dubai", "pkt": "Asia/Karachi",
+    "ict": "Asia/Bangkok", "wib": "Asia/Jakarta",
+    "sgt": "Asia/Singapore", "hkt": "Asia/Hong_Kong", "pht": "Asia/Manila",
+    "kst": "Asia/Seoul", "jst": "Asia/Tokyo",
+    "awst": "Australia/Perth", "acst": "Australia/Adelaide", "acdt": "Australia/Adelaide",
+    "aest": "Australia/Sydney", "aedt": "Australia/Sydney",
+    "nzst": "Pacific/Auckland", "nzdt": "Pacific/Auckland",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def zone_names() -> Dict[str, str]:
+    """Lowercased IANA name -> canonical name, for every zone in the tz database."""
+    from zoneinfo import available_timezones
+
+    return {name.lower(): name for name in available_timezones() if name not in _HIDDEN_ZONES}
+
+
+@functools.lru_cache(maxsize=1)
+def zone_index() -> SearchIndex:
+    """Autocomplete over zone names (and the abbreviations pointing at them). With nothing typed
+    yet it offers the zones behind the abbreviations first, then the rest alphabetically."""
+    aliases: Dict[str, List[str]] = {}
+    for abbr, name in ZONE_ABBREVIATIONS.items():
+        aliases.setdefault(name, []).append(abbr)
+    names = sorted(zone_names().values())
+    ordered = [n for n in names if n in aliases] + [n for n in names if n not in aliases]
+    return SearchIndex((name, name, aliases.get(name, ())) for name in ordered)
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve(key: str) -> Optional[tzinfo]:
+    from zoneinfo import ZoneInfo
+
+    if key in ZONE_ABBREVIATIONS:
+        return ZoneInfo(ZONE_ABBREVIATIONS[key])
+    name = zone_names().get(key)
+    if name is not None:
+        return ZoneInfo(name)
+    m = _OFFSET_ZONE.fullmatch(key)
+    if m:
+        hours, minutes = int(m[2]), int(m[3] or 0)
+        if hours <= 14 and minutes < 60:
+            delta = timedelta(hours=hours, minutes=minutes)
+            return timezone(-delta if m[1] == "-" else delta) if delta else timezone.utc
+    return None
+
+
+def resolve_zone(text: str) -> Optional[tzinfo]:
+    """IANA name (any case), abbreviation or UTC offset -> tzinfo; None if it's none of those."""
+    return _resolve(text.strip().lower())
+
+
+def zone_name(tz: tzinfo) -> str:
+    """The name to store and show: 'America/Los_Angeles', or 'UTC+05:30' for fixed offsets."""
+    return getattr(tz, "key", None) or str(tz)
+
+
+def describe_zone(tz: tzinfo, at: datetime) -> str:
+    """'America/Los_Angeles (PDT, UTC-07:00)' as of `at`."""
+    local = at.astimezone(tz)
+    offset = local.utcoffset() or timedelta(0)
+    sign = "-" if offset < timedelta(0) else "+"
+    hours, rest = divmod(abs(int(offset.total_seconds())), 3600)
+    utc_offset = f"UTC{sign}{hours:02d}:{rest // 60:02d}"
+    abbr = local.tzname()
+    name = zone_name(tz)
+    if name == utc_offset or name == "UTC":
+        return name
+    if abbr and abbr != utc_offset and not abbr.startswith(("+", "-")):
+        return f"{name} ({abbr}, {utc_offset})"
+    return f"{name} ({utc_offset})"
+
+
+def search_zones(query: str, limit: int = 25) -> List[str]:
+    """Zone names for autocomplete; an exact abbreviation ("pst") puts its zone first."""
+    results = zone_index().search(query, limit)
+    alias = ZONE_ABBREVIATIONS.get(query.strip().lower())
+    if alias is None:
+        return results
+    return [alias] + [name for name in results if name != alias][:limit - 1]